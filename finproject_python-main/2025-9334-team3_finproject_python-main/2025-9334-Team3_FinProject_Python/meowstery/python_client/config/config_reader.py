@@ -32,6 +32,36 @@ def load_orb_config(config_path=None):
         raise KeyError(f"Missing key in config file: {e}")
 
 
+def load_metrics_config(config_path=None):
+    """Optional [METRICS] section: jsonl_path, dump_interval (seconds), overlay (true/false) and trace_path."""
+    config = configparser.ConfigParser()
+    if config_path is None:
+        config_path = os.path.join(os.path.dirname(__file__), 'config.ini')
+    config.read(config_path)
+
+    section = config['METRICS'] if config.has_section('METRICS') else {}
+    return {
+        'jsonl_path': section.get('jsonl_path', '').strip(),
+        'dump_interval': float(section.get('dump_interval', '10')),
+        'overlay': str(section.get('overlay', 'false')).strip().lower() in ('1', 'true', 'yes', 'on'),
+        'trace_path': section.get('trace_path', '').strip(),
+    }
+
+
+def load_ui_config(config_path=None):
+    """Optional [UI] section: keyboard (buttons or painted)."""
+    config = configparser.ConfigParser()
+    if config_path is None:
+        config_path = os.path.join(os.path.dirname(__file__), 'config.ini')
+    config.read(config_path)
+
+    section = config['UI'] if config.has_section('UI') else {}
+    keyboard = str(section.get('keyboard', 'buttons')).strip().lower()
+    return {
+        'keyboard': keyboard if keyboard in ('buttons', 'painted') else 'buttons',
+    }
+
+
 def resolve_available_services():
     load_orb_config()
 
@@ -0,0 +1,170 @@
+import atexit
+import configparser
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+
+ROOT_LOGGER = "meowstery"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(threadName)s [%(name)s] %(message)s"
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last capacity formatted records in memory for crash dumps.
+
+    Set [LOGGING] ring_level = DEBUG to capture more detail before a crash
+    than the console shows, at the cost of formatting debug records.
+    """
+
+    def __init__(self, capacity=2000):
+        super().__init__(logging.DEBUG)
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        try:
+            self.records.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(list(self.records)) + "\n")
+        return path
+
+
+class _LevelGate(logging.Filter):
+    """Per-handler level that the listener honours (QueueListener ignores handler levels by default)."""
+
+    def __init__(self, level):
+        super().__init__()
+        self.level = level
+
+    def filter(self, record):
+        return record.levelno >= self.level
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues the record untouched so message formatting happens on the listener thread.
+
+    The stock QueueHandler formats on the caller to make records picklable;
+    this queue never leaves the process, so that work is skipped. Arguments
+    are formatted slightly later, so log values rather than objects the
+    caller goes on to mutate.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+_listener = None
+_ring = None
+_lock = threading.Lock()
+
+
+def load_logging_config(config_path=None):
+    """Optional [LOGGING] section: level, ring_level, file, max_bytes, backups, ring_size."""
+    config = configparser.ConfigParser()
+    if config_path is None:
+        config_path = os.path.join(os.path.dirname(__file__), 'config.ini')
+    config.read(config_path)
+
+    section = config['LOGGING'] if config.has_section('LOGGING') else {}
+    level = os.environ.get("MEOWSTERY_LOG_LEVEL", section.get('level', 'INFO')).upper()
+    return {
+        'level': level,
+        'ring_level': section.get('ring_level', '').strip().upper(),
+        'file': section.get('file', '').strip(),
+        'max_bytes': int(section.get('max_bytes', str(2 * 1024 * 1024))),
+        'backups': int(section.get('backups', '3')),
+        'ring_size': int(section.get('ring_size', '2000')),
+    }
+
+
+def setup_logging(level=None, log_file=None, config_path=None):
+    """Route every "meowstery.*" logger through a queue to a background writer thread.
+
+    The calling thread only enqueues the record; formatting and I/O for the
+    console, the rotating file and the crash ring buffer happen on the
+    listener thread. Records below every handler's level are dropped by the
+    logger before any message formatting. Safe to call more than once.
+    """
+    global _listener, _ring
+    with _lock:
+        if _listener is not None:
+            return logging.getLogger(ROOT_LOGGER)
+
+        settings = load_logging_config(config_path)
+        console_level = _level(level or settings['level'])
+        ring_level = _level(settings['ring_level']) if settings['ring_level'] else console_level
+        log_file = log_file or settings['file']
+        formatter = logging.Formatter(LOG_FORMAT)
+
+        console = logging.StreamHandler(sys.stderr)
+        console.addFilter(_LevelGate(console_level))
+        handlers = [console]
+        if log_file:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=settings['max_bytes'], backupCount=settings['backups'], encoding="utf-8")
+            file_handler.addFilter(_LevelGate(console_level))
+            handlers.append(file_handler)
+        _ring = RingBufferHandler(settings['ring_size'])
+        _ring.addFilter(_LevelGate(ring_level))
+        handlers.append(_ring)
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(min(console_level, ring_level))
+        root.addHandler(_DeferredQueueHandler(log_queue))
+        root.propagate = False
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=False)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        _install_crash_dump()
+        return root
+
+
+def _level(name):
+    value = logging.getLevelName(str(name).upper())
+    return value if isinstance(value, int) else logging.INFO
+
+
+def shutdown_logging():
+    """Flush the queue and stop the writer thread."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def dump_recent_logs(path=None):
+    """Write the crash ring buffer to path (default: a timestamped file in the working directory)."""
+    if _ring is None:
+        return None
+    path = path or f"meowstery-crash-{time.strftime('%Y%m%d-%H%M%S')}.log"
+    return _ring.dump(path)
+
+
+def _install_crash_dump():
+    previous_hook = sys.excepthook
+
+    def hook(exc_type, exc, tb):
+        logging.getLogger(ROOT_LOGGER).critical("Unhandled exception", exc_info=(exc_type, exc, tb))
+        shutdown_logging()
+        try:
+            path = dump_recent_logs()
+            if path:
+                sys.stderr.write(f"Recent log written to {path}\n")
+        except OSError:
+            pass
+        previous_hook(exc_type, exc, tb)
+
+    sys.excepthook = hook
@@ -117,6 +117,7 @@ omniORB.registerType(GameManagerService._NP_RepositoryId, _0_service._d_GameMana
 # GameManagerService operations and attributes
 GameManagerService._d_joinOrCreateGameSession = (((omniORB.tcInternal.tv_string,0), ), ((omniORB.tcInternal.tv_string,0), ), None)
 GameManagerService._d_listActiveGameSessions = ((), (omniORB.typeMapping["IDL:service/GameSessionList:1.0"], ), None)
+GameManagerService._d_getGameSession = (((omniORB.tcInternal.tv_string,0), ), (omniORB.typeMapping["IDL:service/GameSession:1.0"], ), {_0_service.GameNotFound._NP_RepositoryId: _0_service._d_GameNotFound})
 
 # GameManagerService object reference
 class _objref_GameManagerService (CORBA.Object):
@@ -131,6 +132,9 @@ class _objref_GameManagerService (CORBA.Object):
     def listActiveGameSessions(self, *args):
         return self._obj.invoke("listActiveGameSessions", _0_service.GameManagerService._d_listActiveGameSessions, args)
 
+    def getGameSession(self, *args):
+        return self._obj.invoke("getGameSession", _0_service.GameManagerService._d_getGameSession, args)
+
 omniORB.registerObjref(GameManagerService._NP_RepositoryId, _objref_GameManagerService)
 _0_service._objref_GameManagerService = _objref_GameManagerService
 del GameManagerService, _objref_GameManagerService
@@ -141,7 +145,7 @@ class GameManagerService (PortableServer.Servant):
     _NP_RepositoryId = _0_service.GameManagerService._NP_RepositoryId
 
 
-    _omni_op_d = {"joinOrCreateGameSession": _0_service.GameManagerService._d_joinOrCreateGameSession, "listActiveGameSessions": _0_service.GameManagerService._d_listActiveGameSessions}
+    _omni_op_d = {"joinOrCreateGameSession": _0_service.GameManagerService._d_joinOrCreateGameSession, "listActiveGameSessions": _0_service.GameManagerService._d_listActiveGameSessions, "getGameSession": _0_service.GameManagerService._d_getGameSession}
 
 GameManagerService._omni_skeleton = GameManagerService
 _0_service__POA.GameManagerService = GameManagerService
@@ -189,6 +193,7 @@ GameService._d_getRemainingGuesses = (((omniORB.tcInternal.tv_string,0), ), (omn
 GameService._d_getGameStatus = (((omniORB.tcInternal.tv_string,0), ), ((omniORB.tcInternal.tv_string,0), ), {_0_service.GameNotFound._NP_RepositoryId: _0_service._d_GameNotFound})
 GameService._d_getRoundStartTime = (((omniORB.tcInternal.tv_string,0), omniORB.tcInternal.tv_long), ((omniORB.tcInternal.tv_string,0), ), None)
 GameService._d_getRoundDuration = (((omniORB.tcInternal.tv_string,0), ), (omniORB.tcInternal.tv_short, ), None)
+GameService._d_getServerTime = ((), ((omniORB.tcInternal.tv_string,0), ), None)
 
 # GameService object reference
 class _objref_GameService (CORBA.Object):
@@ -218,6 +223,9 @@ class _objref_GameService (CORBA.Object):
     def getRoundDuration(self, *args):
         return self._obj.invoke("getRoundDuration", _0_service.GameService._d_getRoundDuration, args)
 
+    def getServerTime(self, *args):
+        return self._obj.invoke("getServerTime", _0_service.GameService._d_getServerTime, args)
+
 omniORB.registerObjref(GameService._NP_RepositoryId, _objref_GameService)
 _0_service._objref_GameService = _objref_GameService
 del GameService, _objref_GameService
@@ -228,7 +236,7 @@ class GameService (PortableServer.Servant):
     _NP_RepositoryId = _0_service.GameService._NP_RepositoryId
 
 
-    _omni_op_d = {"requestToJoinGame": _0_service.GameService._d_requestToJoinGame, "getWordMask": _0_service.GameService._d_getWordMask, "submitGuess": _0_service.GameService._d_submitGuess, "getRemainingGuesses": _0_service.GameService._d_getRemainingGuesses, "getGameStatus": _0_service.GameService._d_getGameStatus, "getRoundStartTime": _0_service.GameService._d_getRoundStartTime, "getRoundDuration": _0_service.GameService._d_getRoundDuration}
+    _omni_op_d = {"requestToJoinGame": _0_service.GameService._d_requestToJoinGame, "getWordMask": _0_service.GameService._d_getWordMask, "submitGuess": _0_service.GameService._d_submitGuess, "getRemainingGuesses": _0_service.GameService._d_getRemainingGuesses, "getGameStatus": _0_service.GameService._d_getGameStatus, "getRoundStartTime": _0_service.GameService._d_getRoundStartTime, "getRoundDuration": _0_service.GameService._d_getRoundDuration, "getServerTime": _0_service.GameService._d_getServerTime}
 
 GameService._omni_skeleton = GameService
 _0_service__POA.GameService = GameService
@@ -292,6 +300,122 @@ omniORB.registerSkeleton(WordService._NP_RepositoryId, WordService)
 del WordService
 __name__ = "service"
 
+# interface GameEventListener
+_0_service._d_GameEventListener = (omniORB.tcInternal.tv_objref, "IDL:service/GameEventListener:1.0", "GameEventListener")
+omniORB.typeMapping["IDL:service/GameEventListener:1.0"] = _0_service._d_GameEventListener
+_0_service.GameEventListener = omniORB.newEmptyClass()
+class GameEventListener :
+    _NP_RepositoryId = _0_service._d_GameEventListener[1]
+
+    def __init__(self, *args, **kw):
+        raise RuntimeError("Cannot construct objects of this type.")
+
+    _nil = CORBA.Object._nil
+
+
+_0_service.GameEventListener = GameEventListener
+_0_service._tc_GameEventListener = omniORB.tcInternal.createTypeCode(_0_service._d_GameEventListener)
+omniORB.registerType(GameEventListener._NP_RepositoryId, _0_service._d_GameEventListener, _0_service._tc_GameEventListener)
+
+# GameEventListener operations and attributes
+GameEventListener._d_onRoundStarted = (((omniORB.tcInternal.tv_string,0), omniORB.tcInternal.tv_long, (omniORB.tcInternal.tv_string,0)), None, None)
+GameEventListener._d_onWordMaskChanged = (((omniORB.tcInternal.tv_string,0), (omniORB.tcInternal.tv_string,0), omniORB.typeMapping["IDL:service/WordMaskInfo:1.0"]), None, None)
+GameEventListener._d_onScoreChanged = (((omniORB.tcInternal.tv_string,0), (omniORB.tcInternal.tv_string,0), omniORB.tcInternal.tv_short), None, None)
+GameEventListener._d_onGameFinished = (((omniORB.tcInternal.tv_string,0), (omniORB.tcInternal.tv_string,0)), None, None)
+GameEventListener._d_onHeartbeat = (((omniORB.tcInternal.tv_string,0), ), None, None)
+
+# GameEventListener object reference
+class _objref_GameEventListener (CORBA.Object):
+    _NP_RepositoryId = GameEventListener._NP_RepositoryId
+
+    def __init__(self, obj):
+        CORBA.Object.__init__(self, obj)
+
+    def onRoundStarted(self, *args):
+        return self._obj.invoke("onRoundStarted", _0_service.GameEventListener._d_onRoundStarted, args)
+
+    def onWordMaskChanged(self, *args):
+        return self._obj.invoke("onWordMaskChanged", _0_service.GameEventListener._d_onWordMaskChanged, args)
+
+    def onScoreChanged(self, *args):
+        return self._obj.invoke("onScoreChanged", _0_service.GameEventListener._d_onScoreChanged, args)
+
+    def onGameFinished(self, *args):
+        return self._obj.invoke("onGameFinished", _0_service.GameEventListener._d_onGameFinished, args)
+
+    def onHeartbeat(self, *args):
+        return self._obj.invoke("onHeartbeat", _0_service.GameEventListener._d_onHeartbeat, args)
+
+omniORB.registerObjref(GameEventListener._NP_RepositoryId, _objref_GameEventListener)
+_0_service._objref_GameEventListener = _objref_GameEventListener
+del GameEventListener, _objref_GameEventListener
+
+# GameEventListener skeleton
+__name__ = "service__POA"
+class GameEventListener (PortableServer.Servant):
+    _NP_RepositoryId = _0_service.GameEventListener._NP_RepositoryId
+
+
+    _omni_op_d = {"onRoundStarted": _0_service.GameEventListener._d_onRoundStarted, "onWordMaskChanged": _0_service.GameEventListener._d_onWordMaskChanged, "onScoreChanged": _0_service.GameEventListener._d_onScoreChanged, "onGameFinished": _0_service.GameEventListener._d_onGameFinished, "onHeartbeat": _0_service.GameEventListener._d_onHeartbeat}
+
+GameEventListener._omni_skeleton = GameEventListener
+_0_service__POA.GameEventListener = GameEventListener
+omniORB.registerSkeleton(GameEventListener._NP_RepositoryId, GameEventListener)
+del GameEventListener
+__name__ = "service"
+
+# interface GameEventService
+_0_service._d_GameEventService = (omniORB.tcInternal.tv_objref, "IDL:service/GameEventService:1.0", "GameEventService")
+omniORB.typeMapping["IDL:service/GameEventService:1.0"] = _0_service._d_GameEventService
+_0_service.GameEventService = omniORB.newEmptyClass()
+class GameEventService :
+    _NP_RepositoryId = _0_service._d_GameEventService[1]
+
+    def __init__(self, *args, **kw):
+        raise RuntimeError("Cannot construct objects of this type.")
+
+    _nil = CORBA.Object._nil
+
+
+_0_service.GameEventService = GameEventService
+_0_service._tc_GameEventService = omniORB.tcInternal.createTypeCode(_0_service._d_GameEventService)
+omniORB.registerType(GameEventService._NP_RepositoryId, _0_service._d_GameEventService, _0_service._tc_GameEventService)
+
+# GameEventService operations and attributes
+GameEventService._d_subscribe = (((omniORB.tcInternal.tv_string,0), (omniORB.tcInternal.tv_string,0), omniORB.typeMapping["IDL:service/GameEventListener:1.0"]), (), {_0_service.GameNotFound._NP_RepositoryId: _0_service._d_GameNotFound})
+GameEventService._d_unsubscribe = (((omniORB.tcInternal.tv_string,0), (omniORB.tcInternal.tv_string,0)), (), None)
+
+# GameEventService object reference
+class _objref_GameEventService (CORBA.Object):
+    _NP_RepositoryId = GameEventService._NP_RepositoryId
+
+    def __init__(self, obj):
+        CORBA.Object.__init__(self, obj)
+
+    def subscribe(self, *args):
+        return self._obj.invoke("subscribe", _0_service.GameEventService._d_subscribe, args)
+
+    def unsubscribe(self, *args):
+        return self._obj.invoke("unsubscribe", _0_service.GameEventService._d_unsubscribe, args)
+
+omniORB.registerObjref(GameEventService._NP_RepositoryId, _objref_GameEventService)
+_0_service._objref_GameEventService = _objref_GameEventService
+del GameEventService, _objref_GameEventService
+
+# GameEventService skeleton
+__name__ = "service__POA"
+class GameEventService (PortableServer.Servant):
+    _NP_RepositoryId = _0_service.GameEventService._NP_RepositoryId
+
+
+    _omni_op_d = {"subscribe": _0_service.GameEventService._d_subscribe, "unsubscribe": _0_service.GameEventService._d_unsubscribe}
+
+GameEventService._omni_skeleton = GameEventService
+_0_service__POA.GameEventService = GameEventService
+omniORB.registerSkeleton(GameEventService._NP_RepositoryId, GameEventService)
+del GameEventService
+__name__ = "service"
+
 #
 # End of module "service"
 #
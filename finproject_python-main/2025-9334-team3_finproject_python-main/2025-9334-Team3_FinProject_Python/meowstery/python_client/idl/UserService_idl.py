@@ -128,6 +128,62 @@ _0_service._tc_GameConfiguration = omniORB.tcInternal.createTypeCode(_0_service.
 omniORB.registerType(GameConfiguration._NP_RepositoryId, _0_service._d_GameConfiguration, _0_service._tc_GameConfiguration)
 del GameConfiguration
 
+# struct LeaderboardEntry
+_0_service.LeaderboardEntry = omniORB.newEmptyClass()
+class LeaderboardEntry (omniORB.StructBase):
+    _NP_RepositoryId = "IDL:service/LeaderboardEntry:1.0"
+
+    def __init__(self, username, wins):
+        self.username = username
+        self.wins = wins
+
+_0_service.LeaderboardEntry = LeaderboardEntry
+_0_service._d_LeaderboardEntry  = (omniORB.tcInternal.tv_struct, LeaderboardEntry, LeaderboardEntry._NP_RepositoryId, "LeaderboardEntry", "username", (omniORB.tcInternal.tv_string,0), "wins", omniORB.tcInternal.tv_short)
+_0_service._tc_LeaderboardEntry = omniORB.tcInternal.createTypeCode(_0_service._d_LeaderboardEntry)
+omniORB.registerType(LeaderboardEntry._NP_RepositoryId, _0_service._d_LeaderboardEntry, _0_service._tc_LeaderboardEntry)
+del LeaderboardEntry
+
+# typedef ... LeaderboardEntries
+class LeaderboardEntries:
+    _NP_RepositoryId = "IDL:service/LeaderboardEntries:1.0"
+    def __init__(self, *args, **kw):
+        raise RuntimeError("Cannot construct objects of this type.")
+_0_service.LeaderboardEntries = LeaderboardEntries
+_0_service._d_LeaderboardEntries  = (omniORB.tcInternal.tv_sequence, omniORB.typeMapping["IDL:service/LeaderboardEntry:1.0"], 0)
+_0_service._ad_LeaderboardEntries = (omniORB.tcInternal.tv_alias, LeaderboardEntries._NP_RepositoryId, "LeaderboardEntries", (omniORB.tcInternal.tv_sequence, omniORB.typeMapping["IDL:service/LeaderboardEntry:1.0"], 0))
+_0_service._tc_LeaderboardEntries = omniORB.tcInternal.createTypeCode(_0_service._ad_LeaderboardEntries)
+omniORB.registerType(LeaderboardEntries._NP_RepositoryId, _0_service._ad_LeaderboardEntries, _0_service._tc_LeaderboardEntries)
+del LeaderboardEntries
+
+# typedef ... UsernameList
+class UsernameList:
+    _NP_RepositoryId = "IDL:service/UsernameList:1.0"
+    def __init__(self, *args, **kw):
+        raise RuntimeError("Cannot construct objects of this type.")
+_0_service.UsernameList = UsernameList
+_0_service._d_UsernameList  = (omniORB.tcInternal.tv_sequence, (omniORB.tcInternal.tv_string,0), 0)
+_0_service._ad_UsernameList = (omniORB.tcInternal.tv_alias, UsernameList._NP_RepositoryId, "UsernameList", (omniORB.tcInternal.tv_sequence, (omniORB.tcInternal.tv_string,0), 0))
+_0_service._tc_UsernameList = omniORB.tcInternal.createTypeCode(_0_service._ad_UsernameList)
+omniORB.registerType(UsernameList._NP_RepositoryId, _0_service._ad_UsernameList, _0_service._tc_UsernameList)
+del UsernameList
+
+# struct LeaderboardDelta
+_0_service.LeaderboardDelta = omniORB.newEmptyClass()
+class LeaderboardDelta (omniORB.StructBase):
+    _NP_RepositoryId = "IDL:service/LeaderboardDelta:1.0"
+
+    def __init__(self, version, full, changed, removed):
+        self.version = version
+        self.full = full
+        self.changed = changed
+        self.removed = removed
+
+_0_service.LeaderboardDelta = LeaderboardDelta
+_0_service._d_LeaderboardDelta  = (omniORB.tcInternal.tv_struct, LeaderboardDelta, LeaderboardDelta._NP_RepositoryId, "LeaderboardDelta", "version", omniORB.tcInternal.tv_long, "full", omniORB.tcInternal.tv_boolean, "changed", omniORB.typeMapping["IDL:service/LeaderboardEntries:1.0"], "removed", omniORB.typeMapping["IDL:service/UsernameList:1.0"])
+_0_service._tc_LeaderboardDelta = omniORB.tcInternal.createTypeCode(_0_service._d_LeaderboardDelta)
+omniORB.registerType(LeaderboardDelta._NP_RepositoryId, _0_service._d_LeaderboardDelta, _0_service._tc_LeaderboardDelta)
+del LeaderboardDelta
+
 # interface AdminService
 _0_service._d_AdminService = (omniORB.tcInternal.tv_objref, "IDL:service/AdminService:1.0", "AdminService")
 omniORB.typeMapping["IDL:service/AdminService:1.0"] = _0_service._d_AdminService
@@ -235,6 +291,8 @@ omniORB.registerType(LeaderboardService._NP_RepositoryId, _0_service._d_Leaderbo
 # LeaderboardService operations and attributes
 LeaderboardService._d_getTopPlayers = ((), (omniORB.typeMapping["IDL:service/LeaderboardService/PlayerScores:1.0"], ), None)
 LeaderboardService._d_incrementWins = (((omniORB.tcInternal.tv_string,0), ), (), None)
+LeaderboardService._d_getTopPlayersRange = ((omniORB.tcInternal.tv_long, omniORB.tcInternal.tv_long), (omniORB.typeMapping["IDL:service/LeaderboardService/PlayerScores:1.0"], ), None)
+LeaderboardService._d_getLeaderboardSince = ((omniORB.tcInternal.tv_long, ), (omniORB.typeMapping["IDL:service/LeaderboardDelta:1.0"], ), None)
 
 # LeaderboardService object reference
 class _objref_LeaderboardService (CORBA.Object):
@@ -249,6 +307,12 @@ class _objref_LeaderboardService (CORBA.Object):
     def incrementWins(self, *args):
         return self._obj.invoke("incrementWins", _0_service.LeaderboardService._d_incrementWins, args)
 
+    def getTopPlayersRange(self, *args):
+        return self._obj.invoke("getTopPlayersRange", _0_service.LeaderboardService._d_getTopPlayersRange, args)
+
+    def getLeaderboardSince(self, *args):
+        return self._obj.invoke("getLeaderboardSince", _0_service.LeaderboardService._d_getLeaderboardSince, args)
+
 omniORB.registerObjref(LeaderboardService._NP_RepositoryId, _objref_LeaderboardService)
 _0_service._objref_LeaderboardService = _objref_LeaderboardService
 del LeaderboardService, _objref_LeaderboardService
@@ -259,7 +323,7 @@ class LeaderboardService (PortableServer.Servant):
     _NP_RepositoryId = _0_service.LeaderboardService._NP_RepositoryId
 
 
-    _omni_op_d = {"getTopPlayers": _0_service.LeaderboardService._d_getTopPlayers, "incrementWins": _0_service.LeaderboardService._d_incrementWins}
+    _omni_op_d = {"getTopPlayers": _0_service.LeaderboardService._d_getTopPlayers, "incrementWins": _0_service.LeaderboardService._d_incrementWins, "getTopPlayersRange": _0_service.LeaderboardService._d_getTopPlayersRange, "getLeaderboardSince": _0_service.LeaderboardService._d_getLeaderboardSince}
 
 LeaderboardService._omni_skeleton = LeaderboardService
 _0_service__POA.LeaderboardService = LeaderboardService
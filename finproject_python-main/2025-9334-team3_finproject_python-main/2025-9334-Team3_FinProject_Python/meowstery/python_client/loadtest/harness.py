@@ -0,0 +1,293 @@
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+
+from PyQt5.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+from meowstery.python_client.loadtest.headless import HeadlessLobbyView, no_game_view
+from meowstery.python_client.loadtest.stats import CallRecorder
+from meowstery.python_client.loadtest.strategies import STRATEGIES, create_strategy
+from meowstery.python_client.config.logging_config import setup_logging
+from meowstery.python_client.local_server.faults import FaultInjector, FaultRule
+from meowstery.python_client.local_server.game_world import GameConfig
+from meowstery.python_client.local_server.server import LocalServer
+from meowstery.python_client.player.controller.lobby_controller import LobbyController
+from meowstery.python_client.player.model.async_corba import install_event_loop
+from meowstery.python_client.player.model.poll_scheduler import get_poll_scheduler
+from meowstery.python_client.player.model.service_registry import get_registry
+from meowstery.python_client.player.model.timer_registry import leaks_reported, live_timers
+from meowstery.python_client.player.model.user_model import CorbaUserModel, LobbyModel
+
+
+class SimulatedPlayer(QObject):
+    """One player driven through the real LobbyController and GameController, without windows."""
+    finished = pyqtSignal(object)
+
+    def __init__(self, harness, username, strategy, think_ms, games):
+        super().__init__()
+        self.harness = harness
+        self.username = username
+        self.password = "pw-" + username
+        self.strategy = strategy
+        self.think_ms = think_ms
+        self.games_left = games
+        self.games_played = 0
+        self.lobby_timeouts = 0
+        self.guesses = 0
+        self.lobby = None
+        self.game = None
+        self.done = False
+        self.guess_timer = QTimer()
+        self.guess_timer.setSingleShot(True)
+        self.guess_timer.timeout.connect(self._guess)
+
+    def start(self):
+        corba = self.harness.corba
+        corba.register_player(self.username, self.password)  # AlreadyExists is fine on reruns
+        ok, session_id = corba.login_player(self.username, self.password)
+        if not ok:
+            print(f"[SimulatedPlayer] {self.username} could not log in: {session_id}")
+            self._finish()
+            return
+        self._join_lobby()
+
+    def _join_lobby(self):
+        view = HeadlessLobbyView()
+        view.timed_out.connect(self._on_lobby_timed_out)
+        self.lobby = LobbyController(LobbyModel(self.username), view, self.harness.corba,
+                                     game_view_factory=no_game_view)
+        self.lobby.game_controller_created.connect(self._on_game_controller)
+
+    def _on_lobby_timed_out(self):
+        self.lobby_timeouts += 1
+        self.lobby.on_main_menu()
+        if self.harness.running:
+            QTimer.singleShot(random.randint(100, 1000), self._join_lobby)
+
+    def _on_game_controller(self, controller):
+        config = self.harness.game_config
+        if self.harness.in_process:
+            # The client hard-codes the intermission; match it to the stand-in server's configuration.
+            controller.ROUND_TRANSITION_SECONDS = config.intermission_seconds
+        self.game = controller
+        controller.game_ended.connect(self._on_game_ended)
+        self._schedule_guess()
+
+    def _schedule_guess(self):
+        if not self.done:
+            jitter = random.uniform(0.5, 1.5)
+            self.guess_timer.start(int(self.think_ms * jitter))
+
+    def _guess(self):
+        game = self.game
+        if game is None or game.game_over or self.done:
+            return
+        if game.round_active:
+            letter = self.strategy.next_letter(game.current_masked_word, game.guessed_letters,
+                                               game.current_word or "")
+            if letter:
+                self.guesses += 1
+                game.handle_letter_guess(letter)
+        self._schedule_guess()
+
+    def _on_game_ended(self, *args):
+        if self.game is None:
+            return  # game_ended can fire from more than one poll loop
+        self.game = None
+        self.guess_timer.stop()
+        self.games_played += 1
+        self.games_left -= 1
+        self.harness.record_game_finished(self)
+        if self.games_left > 0 and self.harness.running:
+            QTimer.singleShot(random.randint(100, 1000), self._join_lobby)
+        else:
+            self._finish()
+
+    def _finish(self):
+        if not self.done:
+            self.done = True
+            self.guess_timer.stop()
+            self.finished.emit(self)
+
+
+class LoadHarness(QObject):
+    """Runs N simulated players against the stand-in server (in-process by default) and reports load."""
+
+    def __init__(self, players=10, strategy="frequency", think_ms=800, games=1, duration=300,
+                 ramp_ms=50, host="127.0.0.1", port=1050, game_config: GameConfig = None,
+                 in_process=True, seed=None, faults: FaultInjector = None):
+        super().__init__()
+        self.player_count = players
+        self.strategy_name = strategy
+        self.think_ms = think_ms
+        self.games_per_player = games
+        self.duration = duration
+        self.ramp_ms = ramp_ms
+        self.host = host
+        self.port = port
+        self.game_config = game_config
+        self.in_process = in_process
+        self.seed = seed
+        self.faults = faults
+        self.recorder = CallRecorder()
+        self.players = []
+        self.games_finished = 0
+        self.running = False
+        self.started = None
+        self.ended = None
+        self.server = None
+        self.corba = None
+
+    def run(self, app):
+        if self.in_process:
+            # Started first so the client shares the server's ORB and endpoint
+            self.server = LocalServer(self.host, self.port, self.game_config, self.faults).start()
+
+        registry = get_registry()
+        registry.configure(self.host, self.port)
+        registry.add_call_observer(self.recorder)
+        install_event_loop()
+        self.corba = CorbaUserModel()
+
+        self.running = True
+        self.started = time.monotonic()
+        rng = random.Random(self.seed)
+        for index in range(self.player_count):
+            strategy = create_strategy(self.strategy_name, rng.random())
+            player = SimulatedPlayer(self, f"sim{index:04d}", strategy, self.think_ms, self.games_per_player)
+            player.finished.connect(self._on_player_finished)
+            self.players.append(player)
+            QTimer.singleShot(index * self.ramp_ms, player.start)
+
+        QTimer.singleShot(int(self.duration * 1000), self.stop)
+        app.exec_()
+
+        registry.remove_call_observer(self.recorder)
+        if self.server is not None:
+            registry.reset()
+            self.server.shutdown()
+        return self.report()
+
+    def record_game_finished(self, player):
+        self.games_finished += 1
+
+    def _on_player_finished(self, player):
+        if all(p.done for p in self.players):
+            self.stop()
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self.ended = time.monotonic()
+        QCoreApplication.instance().quit()
+
+    def report(self):
+        elapsed = (self.ended or time.monotonic()) - self.started
+        rows = self.recorder.rows(elapsed)
+        return {
+            "players": self.player_count,
+            "strategy": self.strategy_name,
+            "elapsed_seconds": elapsed,
+            "games_finished": self.games_finished,
+            # Each game is counted once per participating player; divide by players per game for server games
+            "player_games_per_minute": self.games_finished / elapsed * 60 if elapsed > 0 else 0.0,
+            # Only known when the server runs in this process
+            "server_games_per_minute": (self.server.world.games_finished / elapsed * 60
+                                        if self.server is not None and elapsed > 0 else None),
+            "injected_failures": self.faults.injected_failures if self.faults is not None else 0,
+            "lobby_timeouts": sum(p.lobby_timeouts for p in self.players),
+            "guesses": sum(p.guesses for p in self.players),
+            "total_calls": sum(row["calls"] for row in rows),
+            "calls_per_second": sum(row["calls"] for row in rows) / elapsed if elapsed > 0 else 0.0,
+            "operations": rows,
+            "poll_ticks": get_poll_scheduler().ticks,
+            "poll_overhead_ms": get_poll_scheduler().overhead_seconds * 1000,
+            # Leaks are reported at every screen transition; live timers are whatever still runs at the end
+            "timer_leaks": leaks_reported(),
+            "live_timers": live_timers(),
+        }
+
+
+def format_report(report):
+    lines = [
+        f"Players: {report['players']} ({report['strategy']}), ran {report['elapsed_seconds']:.1f}s",
+        f"Games finished: {report['games_finished']} "
+        f"({report['player_games_per_minute']:.1f} player-games/min"
+        + (f", {report['server_games_per_minute']:.1f} server games/min"
+           if report['server_games_per_minute'] is not None else "") + "), "
+        f"lobby timeouts: {report['lobby_timeouts']}, guesses: {report['guesses']}",
+        f"Remote calls: {report['total_calls']} ({report['calls_per_second']:.1f}/s), "
+        f"injected failures: {report['injected_failures']}",
+        f"Poll scheduler: {report['poll_ticks']} ticks, {report['poll_overhead_ms']:.1f} ms overhead",
+        f"Timer leaks: {report['timer_leaks']}, still running at exit: {report['live_timers'] or '-'}",
+        "",
+        f"{'operation':<44}{'calls':>8}{'calls/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  errors",
+    ]
+    for row in report["operations"]:
+        errors = ", ".join(f"{name}={count}" for name, count in sorted(row["errors"].items())) or "-"
+        lines.append(f"{row['operation']:<44}{row['calls']:>8}{row['calls_per_second']:>9.1f}"
+                     f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}  {errors}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent Meowstery players without windows")
+    parser.add_argument("--players", type=int, default=10)
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="frequency")
+    parser.add_argument("--think-ms", type=int, default=800, help="mean delay between a player's guesses")
+    parser.add_argument("--games", type=int, default=1, help="games each player finishes before stopping")
+    parser.add_argument("--duration", type=float, default=300, help="stop after this many seconds")
+    parser.add_argument("--ramp-ms", type=int, default=50, help="delay between player logins")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1050)
+    parser.add_argument("--external", action="store_true",
+                        help="use a server already running at --host/--port instead of the in-process one")
+    parser.add_argument("--wait-seconds", type=int, default=5)
+    parser.add_argument("--round-seconds", type=int, default=20)
+    parser.add_argument("--intermission-seconds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--fault", action="append", default=[], metavar="PATTERN:OPTIONS",
+                        help="server-side latency/failure rule for the in-process server (see local_server)")
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--verbose", action="store_true", help="keep the client's own console output")
+    parser.add_argument("--strict-timers", action="store_true",
+                        help="exit with status 1 if any timer survived a screen transition")
+    args = parser.parse_args(argv)
+
+    setup_logging(level="DEBUG" if args.verbose else "WARNING")
+    # GameController may still build widgets (e.g. for the leaderboard), so a QApplication is needed
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    game_config = GameConfig(wait_seconds=args.wait_seconds, round_seconds=args.round_seconds,
+                             intermission_seconds=args.intermission_seconds)
+    try:
+        rules = [FaultRule.parse(spec) for spec in args.fault]
+    except ValueError as e:
+        parser.error(str(e))
+    faults = FaultInjector(rules, seed=args.seed) if rules else None
+    harness = LoadHarness(players=args.players, strategy=args.strategy, think_ms=args.think_ms,
+                          games=args.games, duration=args.duration, ramp_ms=args.ramp_ms,
+                          host=args.host, port=args.port, game_config=game_config,
+                          in_process=not args.external, seed=args.seed, faults=faults)
+
+    with open(os.devnull, "w") as devnull:
+        with contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(devnull):
+            report = harness.run(app)
+
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.strict_timers and report["timer_leaks"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
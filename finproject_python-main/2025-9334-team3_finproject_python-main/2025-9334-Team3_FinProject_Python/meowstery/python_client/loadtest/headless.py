@@ -0,0 +1,42 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class HeadlessLobbyView(QObject):
+    """Stands in for LobbyView: remembers what the lobby showed instead of drawing it."""
+    timed_out = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.restart_button = None
+        self.main_menu_button = None
+        self.status = ""
+        self.message = ""
+        self.players = []
+        self.closed = False
+
+    def update_status(self, status):
+        self.status = status
+
+    def update_players_list(self, players):
+        self.players = list(players)
+
+    def update_waiting_message(self, message):
+        self.message = message
+
+    def show_restart_and_main_menu_buttons(self):
+        # The real view offers "Find Match Again" here; a simulated player decides on its own.
+        self.timed_out.emit()
+
+    def hide_restart_and_main_menu_buttons(self):
+        pass
+
+    def show(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def no_game_view(players):
+    """game_view_factory for LobbyController that runs GameController without a window."""
+    return None
@@ -0,0 +1,44 @@
+import math
+import threading
+from collections import Counter, defaultdict
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class CallRecorder:
+    """Registry call observer that keeps every latency per "Service.operation"."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(Counter)
+
+    def __call__(self, service_name, operation, seconds, error):
+        key = f"{service_name}.{operation}"
+        with self._lock:
+            self.latencies[key].append(seconds)
+            if error is not None:
+                self.errors[key][type(error).__name__] += 1
+
+    def rows(self, elapsed):
+        with self._lock:
+            items = {key: sorted(values) for key, values in self.latencies.items()}
+            errors = {key: dict(counter) for key, counter in self.errors.items()}
+        rows = []
+        for key, values in sorted(items.items(), key=lambda kv: -len(kv[1])):
+            rows.append({
+                "operation": key,
+                "calls": len(values),
+                "calls_per_second": len(values) / elapsed if elapsed > 0 else 0.0,
+                "errors": errors.get(key, {}),
+                "p50_ms": percentile(values, 0.50) * 1000,
+                "p95_ms": percentile(values, 0.95) * 1000,
+                "p99_ms": percentile(values, 0.99) * 1000,
+            })
+        return rows
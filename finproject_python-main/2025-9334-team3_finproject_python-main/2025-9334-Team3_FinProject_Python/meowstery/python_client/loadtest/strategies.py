@@ -0,0 +1,60 @@
+import random
+import string
+
+
+class GuessStrategy:
+    """Picks the next letter a simulated player types."""
+    name = "base"
+
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+
+    def next_letter(self, masked_word, guessed_letters, word=""):
+        raise NotImplementedError
+
+    def _unguessed(self, letters, guessed_letters):
+        return [c for c in letters if c not in guessed_letters]
+
+
+class FrequencyStrategy(GuessStrategy):
+    """Most common English letters first, like a sensible human."""
+    name = "frequency"
+    ORDER = "ETAOINSHRDLCUMWFGYPBVKJXQZ"
+
+    def next_letter(self, masked_word, guessed_letters, word=""):
+        remaining = self._unguessed(self.ORDER, guessed_letters)
+        return remaining[0] if remaining else None
+
+
+class RandomStrategy(GuessStrategy):
+    name = "random"
+
+    def next_letter(self, masked_word, guessed_letters, word=""):
+        remaining = self._unguessed(string.ascii_uppercase, guessed_letters)
+        return self.random.choice(remaining) if remaining else None
+
+
+class OracleStrategy(GuessStrategy):
+    """Knows the word and misses with probability miss_rate; makes games finish quickly."""
+    name = "oracle"
+
+    def __init__(self, seed=None, miss_rate=0.2):
+        super().__init__(seed)
+        self.miss_rate = miss_rate
+
+    def next_letter(self, masked_word, guessed_letters, word=""):
+        hits = self._unguessed(sorted(set(word.upper())), guessed_letters)
+        misses = self._unguessed([c for c in string.ascii_uppercase if c not in word.upper()], guessed_letters)
+        if hits and (not misses or self.random.random() >= self.miss_rate):
+            return self.random.choice(hits)
+        return self.random.choice(misses) if misses else None
+
+
+STRATEGIES = {cls.name: cls for cls in (FrequencyStrategy, RandomStrategy, OracleStrategy)}
+
+
+def create_strategy(name, seed=None):
+    try:
+        return STRATEGIES[name](seed)
+    except KeyError:
+        raise ValueError(f"Unknown strategy {name!r}; choose from {', '.join(sorted(STRATEGIES))}")
@@ -0,0 +1,100 @@
+import queue
+import threading
+import time
+
+from omniORB import CORBA
+
+import service
+import service__POA
+
+
+class GameEventServiceServant(service__POA.GameEventService):
+    """Keeps listener references per game and pushes events to them from one dispatcher thread."""
+
+    HEARTBEAT_SECONDS = 2
+
+    def __init__(self, game_exists=None):
+        self._game_exists = game_exists
+        self._lock = threading.Lock()
+        self._listeners = {}
+        self._queue = queue.Queue()
+        self._running = False
+        self._threads = []
+
+    def start(self):
+        self._running = True
+        for target in (self._dispatch_loop, self._heartbeat_loop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self._running = False
+        self._queue.put(None)
+
+    # IDL operations
+
+    def subscribe(self, gameId, username, listener):
+        if self._game_exists is not None and not self._game_exists(gameId):
+            raise service.GameNotFound(f"Game {gameId} not found")
+        with self._lock:
+            self._listeners.setdefault(gameId, {})[username] = listener
+        print(f"[GameEventService] {username} subscribed to game {gameId}")
+
+    def unsubscribe(self, gameId, username):
+        with self._lock:
+            listeners = self._listeners.get(gameId, {})
+            listeners.pop(username, None)
+            if not listeners:
+                self._listeners.pop(gameId, None)
+        print(f"[GameEventService] {username} unsubscribed from game {gameId}")
+
+    # Publishing API used by the stand-in game logic
+
+    def publish_round_started(self, game_id, round_number, start_time):
+        self._queue.put((game_id, None, "onRoundStarted", (game_id, round_number, start_time)))
+
+    def publish_word_mask_changed(self, game_id, username, mask_info):
+        self._queue.put((game_id, username, "onWordMaskChanged", (game_id, username, mask_info)))
+
+    def publish_score_changed(self, game_id, username, rounds_won):
+        self._queue.put((game_id, None, "onScoreChanged", (game_id, username, rounds_won)))
+
+    def publish_game_finished(self, game_id, winner_username):
+        self._queue.put((game_id, None, "onGameFinished", (game_id, winner_username)))
+
+    def subscriber_count(self, game_id=None):
+        with self._lock:
+            if game_id is not None:
+                return len(self._listeners.get(game_id, {}))
+            return sum(len(listeners) for listeners in self._listeners.values())
+
+    def _dispatch_loop(self):
+        while self._running:
+            event = self._queue.get()
+            if event is None:
+                break
+            game_id, only_username, operation, args = event
+            with self._lock:
+                targets = list(self._listeners.get(game_id, {}).items())
+            for username, listener in targets:
+                if only_username is not None and username != only_username:
+                    continue
+                self._deliver(game_id, username, listener, operation, args)
+
+    def _heartbeat_loop(self):
+        while self._running:
+            time.sleep(self.HEARTBEAT_SECONDS)
+            with self._lock:
+                game_ids = list(self._listeners)
+            for game_id in game_ids:
+                self._queue.put((game_id, None, "onHeartbeat", (game_id,)))
+
+    def _deliver(self, game_id, username, listener, operation, args):
+        try:
+            getattr(listener, operation)(*args)
+        except (CORBA.TRANSIENT, CORBA.COMM_FAILURE, CORBA.OBJECT_NOT_EXIST) as e:
+            print(f"[GameEventService] Dropping listener {username} for game {game_id}: {e}")
+            self.unsubscribe(game_id, username)
+        except Exception as e:
+            print(f"[GameEventService] Error delivering {operation} to {username}: {e}")
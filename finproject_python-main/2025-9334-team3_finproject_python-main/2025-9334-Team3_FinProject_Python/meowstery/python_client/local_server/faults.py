@@ -0,0 +1,99 @@
+import fnmatch
+import functools
+import random
+import threading
+import time
+
+from omniORB import CORBA
+
+
+# System exceptions a flaky network or an overloaded server typically produces
+FAILURE_KINDS = ("TRANSIENT", "COMM_FAILURE", "TIMEOUT", "NO_RESPONSE")
+
+
+class FaultRule:
+    """Latency, jitter and failure rate for every operation matching pattern ("Service.op", wildcards allowed)."""
+
+    def __init__(self, pattern="*", latency_ms=0.0, jitter_ms=0.0, failure_rate=0.0, failure="TRANSIENT"):
+        if failure not in FAILURE_KINDS:
+            raise ValueError(f"Unknown failure {failure!r}; choose from {', '.join(FAILURE_KINDS)}")
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError("failure rate must be between 0 and 1")
+        self.pattern = pattern
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.failure = failure
+
+    def matches(self, operation):
+        return fnmatch.fnmatchcase(operation, self.pattern)
+
+    @classmethod
+    def parse(cls, spec):
+        """Parse "GameService.getWordMask:latency=50,jitter=20,fail=0.05,error=COMM_FAILURE"."""
+        pattern, _, options = spec.partition(":")
+        kwargs = {}
+        for option in filter(None, (o.strip() for o in options.split(","))):
+            key, _, value = option.partition("=")
+            if key == "latency":
+                kwargs["latency_ms"] = float(value)
+            elif key == "jitter":
+                kwargs["jitter_ms"] = float(value)
+            elif key == "fail":
+                kwargs["failure_rate"] = float(value)
+            elif key == "error":
+                kwargs["failure"] = value.upper()
+            else:
+                raise ValueError(f"Unknown fault option {key!r} in {spec!r}")
+        return cls(pattern.strip() or "*", **kwargs)
+
+    def __repr__(self):
+        return (f"FaultRule({self.pattern!r}, latency_ms={self.latency_ms}, jitter_ms={self.jitter_ms}, "
+                f"failure_rate={self.failure_rate}, failure={self.failure!r})")
+
+
+class FaultInjector:
+    """Wraps servant operations so each call is delayed and sometimes fails, per the matching rules.
+
+    Rules are checked in order and the first match wins, so put specific
+    patterns before a catch-all "*". Failures raise a CORBA system exception
+    with COMPLETED_NO before the servant runs, the way a dropped request
+    would look to the client.
+    """
+
+    def __init__(self, rules=None, seed=None):
+        self.rules = list(rules or [])
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.injected_failures = 0
+
+    def rule_for(self, operation):
+        for rule in self.rules:
+            if rule.matches(operation):
+                return rule
+        return None
+
+    def install(self, name, servant):
+        """Shadow every IDL operation of servant with a faulty wrapper (instance attributes win over the class)."""
+        if not self.rules:
+            return servant
+        for op in getattr(servant, "_omni_op_d", {}):
+            rule = self.rule_for(f"{name}.{op}")
+            if rule is not None and hasattr(servant, op):
+                setattr(servant, op, self._wrap(getattr(servant, op), rule))
+        return servant
+
+    def _wrap(self, method, rule):
+        @functools.wraps(method)
+        def faulty(*args):
+            with self._lock:
+                delay = rule.latency_ms + self._random.uniform(-rule.jitter_ms, rule.jitter_ms)
+                fail = self._random.random() < rule.failure_rate
+                if fail:
+                    self.injected_failures += 1
+            if delay > 0:
+                time.sleep(delay / 1000.0)
+            if fail:
+                raise getattr(CORBA, rule.failure)(0, CORBA.COMPLETED_NO)
+            return method(*args)
+        return faulty
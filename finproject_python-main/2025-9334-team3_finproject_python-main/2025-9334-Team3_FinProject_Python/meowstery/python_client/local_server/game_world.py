@@ -0,0 +1,490 @@
+import itertools
+import random
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import service
+
+
+WORDS = [
+    "WHISKERS", "KITTEN", "MEOW", "PAWS", "PURR", "TABBY", "CATNIP", "SIAMESE", "PERSIAN", "CALICO",
+    "MOUSER", "FELINE", "LITTER", "SCRATCH", "POUNCE", "HAIRBALL", "TOMCAT", "BENGAL", "SPHYNX", "MANX",
+    "COLLAR", "YARN", "SARDINE", "TUNA", "NAP", "SUNBEAM", "CARDBOARD", "LASER", "FEATHER", "TAIL",
+]
+
+
+def format_server_time(dt: datetime) -> str:
+    """Same shape as the Java server's timestamps: 2025-01-31 14:05:09.123456."""
+    return dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+class GameConfig:
+    def __init__(self, wait_seconds=10, round_seconds=30, intermission_seconds=10,
+                 rounds_to_win=3, max_rounds=9, max_guesses=5, finished_linger_seconds=30,
+                 admin_username="admin", admin_password="admin"):
+        self.wait_seconds = wait_seconds
+        self.round_seconds = round_seconds
+        self.intermission_seconds = intermission_seconds
+        self.rounds_to_win = rounds_to_win
+        self.max_rounds = max_rounds
+        self.max_guesses = max_guesses
+        self.finished_linger_seconds = finished_linger_seconds
+        self.admin_username = admin_username
+        self.admin_password = admin_password
+
+
+class Account:
+    def __init__(self, player_id, username, password, is_admin=False):
+        self.player_id = player_id
+        self.username = username
+        self.password = password
+        self.wins = 0
+        self.is_admin = is_admin
+        self.login_session_id = None
+
+
+class PlayerRound:
+    def __init__(self, max_guesses):
+        self.guessed = set()
+        self.guesses_left = max_guesses
+
+
+class Round:
+    def __init__(self, number, word, players, max_guesses):
+        self.number = number
+        self.word = word
+        self.start_time = format_server_time(datetime.now())
+        self.started_at = time.monotonic()
+        self.ended_at = None
+        self.winner = None
+        self.players = {username: PlayerRound(max_guesses) for username in players}
+
+    @property
+    def active(self):
+        return self.ended_at is None
+
+    def mask_for(self, username):
+        guessed = self.players[username].guessed if username in self.players else set()
+        return "".join(c if c in guessed else "_" for c in self.word)
+
+    def solved_by(self, username):
+        return "_" not in self.mask_for(username)
+
+
+class Game:
+    def __init__(self, game_id, creator, round_seconds):
+        self.game_id = game_id
+        self.players: List[str] = [creator]
+        self.status = "WAITING"
+        self.created_at = time.monotonic()
+        # Fixed when the game is created so updateRoundTime only affects later games
+        self.round_seconds = round_seconds
+        self.start_time = ""
+        self.rounds: List[Round] = []
+        self.round_wins: Dict[str, int] = {}
+        self.next_round_at = None
+        self.finished_at = None
+        self.winner = ""
+        self.used_words = set()
+        self.next_word = None
+
+    @property
+    def current_round(self) -> Optional[Round]:
+        return self.rounds[-1] if self.rounds else None
+
+    def status_for(self, username):
+        if self.status == "FINISHED":
+            return "WON" if username == self.winner else "LOST"
+        return self.status
+
+    def to_idl(self):
+        return service.GameSession(self.game_id, self.start_time, list(self.players), self.status)
+
+
+class GameWorld:
+    """Accounts, matchmaking, rounds and the leaderboard behind the stand-in servants.
+
+    Time-driven transitions (lobby timeout, round end, next round) happen in
+    tick(), which the server calls from a background thread. Every change a
+    client could poll for is also published through the optional event
+    publisher.
+    """
+
+    TICK_SECONDS = 0.1
+
+    def __init__(self, config: Optional[GameConfig] = None, events=None, seed=None):
+        self.config = config or GameConfig()
+        self.events = events
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._player_ids = itertools.count(1)
+        self._accounts: Dict[str, Account] = {}
+        self._admins: Dict[str, Account] = {}
+        self._games: Dict[str, Game] = {}
+        self._player_games: Dict[str, str] = {}
+        # username -> (version, removed), kept in version order: re-touching a name moves it to the end
+        self._leaderboard_changes: Dict[str, tuple] = {}
+        self._leaderboard_version = 0
+        self.games_finished = 0
+        self._running = False
+        self._thread = None
+        if self.config.admin_username:
+            self._admins[self.config.admin_username] = Account(
+                0, self.config.admin_username, self.config.admin_password, is_admin=True)
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._tick_loop, name="game-world", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+
+    # Accounts
+
+    def create_player(self, username, password):
+        with self._lock:
+            if username in self._accounts:
+                raise service.AlreadyExists(f"Player {username} already exists")
+            self._accounts[username] = Account(next(self._player_ids), username, password)
+            self._leaderboard_changed(username)
+
+    def remove_player(self, username):
+        with self._lock:
+            if self._accounts.pop(username, None) is None:
+                raise service.NotFound(f"Player {username} not found")
+            self._leaderboard_changed(username, removed=True)
+
+    def update_player(self, old_username, new_username, new_password):
+        with self._lock:
+            account = self._accounts.get(old_username)
+            if account is None:
+                raise service.NotFound(f"Player {old_username} not found")
+            if new_username != old_username and new_username in self._accounts:
+                raise service.AlreadyExists(f"Player {new_username} already exists")
+            del self._accounts[old_username]
+            account.username = new_username
+            if new_password:
+                account.password = new_password
+            self._accounts[new_username] = account
+            if new_username != old_username:
+                self._leaderboard_changed(old_username, removed=True)
+                self._leaderboard_changed(new_username)
+
+    def search_players(self, keyword):
+        keyword = (keyword or "").lower()
+        with self._lock:
+            matches = [a for a in self._accounts.values() if keyword in a.username.lower()]
+            return [self._account_to_idl(a) for a in sorted(matches, key=lambda a: a.username)]
+
+    def set_wait_time(self, seconds):
+        with self._lock:
+            self.config.wait_seconds = max(1, int(seconds))
+
+    def set_round_time(self, seconds):
+        with self._lock:
+            self.config.round_seconds = max(1, int(seconds))
+
+    def login(self, username, password):
+        with self._lock:
+            return self._login(self._accounts, username, password, force=False)
+
+    def login_admin(self, username, password):
+        with self._lock:
+            return self._login(self._admins, username, password, force=False)
+
+    def force_login(self, username, password, table):
+        """Log in even if another client holds the session; table is "players" or "admins"."""
+        accounts = self._admins if str(table).lower().startswith("admin") else self._accounts
+        with self._lock:
+            return self._login(accounts, username, password, force=True)
+
+    def logout(self, session_id):
+        with self._lock:
+            for account in itertools.chain(self._accounts.values(), self._admins.values()):
+                if account.login_session_id == session_id:
+                    account.login_session_id = None
+                    return
+
+    @staticmethod
+    def _login(accounts, username, password, force):
+        account = accounts.get(username)
+        if account is None or account.password != password:
+            raise service.InvalidCredentials("Incorrect username or password")
+        forced = account.login_session_id is not None
+        if forced and not force:
+            raise service.AlreadyLoggedIn(f"{username} is already logged in")
+        account.login_session_id = uuid.uuid4().hex
+        return service.LoginResult(True, forced, account.login_session_id)
+
+    def top_players(self, limit=None, offset=0):
+        with self._lock:
+            ranked = sorted(self._accounts.values(), key=lambda a: (-a.wins, a.username))
+            ranked = ranked[offset:offset + limit] if limit is not None else ranked[offset:]
+            return [self._account_to_idl(a) for a in ranked]
+
+    def increment_wins(self, username):
+        with self._lock:
+            account = self._accounts.get(username)
+            if account is not None:
+                account.wins += 1
+                self._leaderboard_changed(username)
+
+    def leaderboard_since(self, version):
+        """LeaderboardDelta of the (username, wins) changes after version.
+
+        Version 0, or one this server never issued (e.g. from before a
+        restart), gets the whole leaderboard with full=True.
+        """
+        with self._lock:
+            current = self._leaderboard_version
+            if version <= 0 or version > current:
+                changed = [service.LeaderboardEntry(a.username, a.wins) for a in self._accounts.values()]
+                return service.LeaderboardDelta(current, True, changed, [])
+            changed, removed = [], []
+            for username, (changed_in, was_removed) in reversed(self._leaderboard_changes.items()):
+                if changed_in <= version:
+                    break
+                if was_removed:
+                    removed.append(username)
+                else:
+                    changed.append(service.LeaderboardEntry(username, self._accounts[username].wins))
+            return service.LeaderboardDelta(current, False, changed, removed)
+
+    def _leaderboard_changed(self, username, removed=False):
+        self._leaderboard_version += 1
+        self._leaderboard_changes.pop(username, None)
+        self._leaderboard_changes[username] = (self._leaderboard_version, removed)
+
+    @staticmethod
+    def _account_to_idl(account):
+        return service.PlayerAccount(account.player_id, account.username, "", account.wins,
+                                     account.login_session_id is not None)
+
+    # Matchmaking
+
+    def join_or_create(self, username):
+        with self._lock:
+            game = self._game_of(username)
+            if game is not None and game.status != "FINISHED":
+                return game.game_id
+            for game in self._games.values():
+                if game.status == "WAITING":
+                    game.players.append(username)
+                    self._player_games[username] = game.game_id
+                    return game.game_id
+            game = Game(uuid.uuid4().hex[:12], username, self.config.round_seconds)
+            self._games[game.game_id] = game
+            self._player_games[username] = game.game_id
+            return game.game_id
+
+    def request_to_join(self, username):
+        with self._lock:
+            game = self._game_of(username)
+            if game is None:
+                game = self._games[self.join_or_create(username)]
+            if game.status == "WAITING" and len(game.players) < 2:
+                raise service.NoOpponentFound("Waiting for an opponent")
+
+    def active_sessions(self):
+        with self._lock:
+            return [g.to_idl() for g in self._games.values() if g.status != "FINISHED"]
+
+    def session(self, game_id):
+        with self._lock:
+            return self._require_game(game_id).to_idl()
+
+    def game_exists(self, game_id):
+        with self._lock:
+            return game_id in self._games
+
+    # Rounds
+
+    def status(self, username):
+        with self._lock:
+            return self._require_player_game(username).status_for(username)
+
+    def word_mask(self, username):
+        with self._lock:
+            game = self._require_player_game(username)
+            current = game.current_round
+            if current is None:
+                return service.WordMaskInfo("", self.config.max_guesses)
+            player = current.players.get(username)
+            guesses_left = player.guesses_left if player else 0
+            return service.WordMaskInfo(current.mask_for(username), guesses_left)
+
+    def remaining_guesses(self, username):
+        with self._lock:
+            current = self._require_player_game(username).current_round
+            if current is None:
+                return self.config.max_guesses
+            player = current.players.get(username)
+            return player.guesses_left if player else 0
+
+    def round_duration(self, game_id):
+        with self._lock:
+            game = self._games.get(game_id)
+            return game.round_seconds if game is not None else self.config.round_seconds
+
+    def submit_guess(self, username, letter):
+        letter = str(letter).upper()
+        with self._lock:
+            game = self._require_player_game(username)
+            current = game.current_round
+            if game.status != "PLAYING" or current is None or not current.active:
+                raise service.InvalidGuess("Round is not active")
+            if len(letter) != 1 or not letter.isalpha():
+                raise service.InvalidGuess(f"'{letter}' is not a letter")
+            player = current.players.get(username)
+            if player is None:
+                raise service.InvalidGuess(f"{username} is not playing this round")
+            if letter in player.guessed:
+                raise service.InvalidGuess(f"'{letter}' was already guessed")
+            if player.guesses_left <= 0:
+                raise service.InvalidGuess("No guesses left")
+
+            player.guessed.add(letter)
+            if letter not in current.word:
+                player.guesses_left -= 1
+            self._publish("publish_word_mask_changed", game.game_id, username,
+                          service.WordMaskInfo(current.mask_for(username), player.guesses_left))
+
+            if current.solved_by(username):
+                self._end_round(game, current, winner=username)
+            elif all(p.guesses_left <= 0 or current.solved_by(u) for u, p in current.players.items()):
+                self._end_round(game, current, winner=None)
+
+    def round_start_time(self, game_id, round_number):
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None or not 1 <= round_number <= len(game.rounds):
+                return ""
+            return game.rounds[round_number - 1].start_time
+
+    def current_word(self, game_id):
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None or game.current_round is None:
+                return ""
+            return game.current_round.word
+
+    def mark_word_used(self, word, game_id):
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is not None and word:
+                game.used_words.add(word.upper())
+
+    def new_word_for_next_round(self, game_id):
+        """Choose (once) the word the next round of game_id will use."""
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None:
+                return ""
+            if game.next_word is None:
+                game.next_word = self._pick_word(game)
+            return game.next_word
+
+    # Time-driven transitions
+
+    def tick(self, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for game in list(self._games.values()):
+                if game.status == "WAITING" and now - game.created_at >= self.config.wait_seconds:
+                    if len(game.players) >= 2:
+                        self._start_game(game)
+                    else:
+                        self._remove_game(game)
+                elif game.status == "PLAYING":
+                    current = game.current_round
+                    if current is not None and current.active and now - current.started_at >= game.round_seconds:
+                        self._end_round(game, current, winner=None)
+                    elif game.next_round_at is not None and now >= game.next_round_at:
+                        self._start_round(game)
+                elif game.status == "FINISHED" and now - game.finished_at >= self.config.finished_linger_seconds:
+                    self._remove_game(game)
+
+    def _tick_loop(self):
+        while self._running:
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"[GameWorld] Error advancing games: {e}")
+            time.sleep(self.TICK_SECONDS)
+
+    def _start_game(self, game):
+        game.status = "PLAYING"
+        game.round_wins = {username: 0 for username in game.players}
+        self._start_round(game)
+        game.start_time = game.rounds[0].start_time
+        print(f"[GameWorld] Game {game.game_id} started with {game.players}")
+
+    def _start_round(self, game):
+        word = game.next_word or self._pick_word(game)
+        game.used_words.add(word)
+        game.next_word = None
+        game.next_round_at = None
+        current = Round(len(game.rounds) + 1, word, game.players, self.config.max_guesses)
+        game.rounds.append(current)
+        self._publish("publish_round_started", game.game_id, current.number, current.start_time)
+
+    def _end_round(self, game, current, winner):
+        current.ended_at = time.monotonic()
+        current.winner = winner
+        if winner is not None:
+            game.round_wins[winner] = game.round_wins.get(winner, 0) + 1
+            self._publish("publish_score_changed", game.game_id, winner, game.round_wins[winner])
+
+        leader = max(game.round_wins, key=game.round_wins.get, default=None)
+        if winner is not None and game.round_wins[winner] >= self.config.rounds_to_win:
+            self._finish_game(game, winner)
+        elif current.number >= self.config.max_rounds:
+            self._finish_game(game, leader if leader and game.round_wins[leader] > 0 else "")
+        else:
+            game.next_round_at = current.ended_at + self.config.intermission_seconds
+
+    def _finish_game(self, game, winner):
+        game.status = "FINISHED"
+        game.winner = winner
+        game.finished_at = time.monotonic()
+        self.games_finished += 1
+        if winner:
+            self.increment_wins(winner)
+        self._publish("publish_game_finished", game.game_id, winner)
+        print(f"[GameWorld] Game {game.game_id} finished, winner: {winner or 'none'}")
+
+    def _remove_game(self, game):
+        self._games.pop(game.game_id, None)
+        for username in game.players:
+            if self._player_games.get(username) == game.game_id:
+                del self._player_games[username]
+
+    def _pick_word(self, game):
+        unused = [w for w in WORDS if w not in game.used_words] or WORDS
+        return self._random.choice(unused)
+
+    # Lookups
+
+    def _game_of(self, username):
+        game_id = self._player_games.get(username)
+        return self._games.get(game_id) if game_id else None
+
+    def _require_game(self, game_id):
+        game = self._games.get(game_id)
+        if game is None:
+            raise service.GameNotFound(f"Game {game_id} not found")
+        return game
+
+    def _require_player_game(self, username):
+        game = self._game_of(username)
+        if game is None:
+            raise service.GameNotFound(f"{username} is not in a game")
+        return game
+
+    def _publish(self, method, *args):
+        if self.events is not None:
+            getattr(self.events, method)(*args)
@@ -0,0 +1,72 @@
+import threading
+
+from omniORB import CORBA
+import CosNaming
+import CosNaming__POA
+
+
+class LocalNamingContext(CosNaming__POA.NamingContext):
+    """Flat in-memory naming context, enough for the client's single-component lookups."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bindings = {}
+
+    @staticmethod
+    def _key(n):
+        if len(n) != 1:
+            raise CosNaming.NamingContext.InvalidName()
+        return n[0].id, n[0].kind
+
+    def _bind(self, n, obj, binding_type, replace):
+        key = self._key(n)
+        with self._lock:
+            if not replace and key in self._bindings:
+                raise CosNaming.NamingContext.AlreadyBound()
+            self._bindings[key] = (obj, binding_type)
+
+    def bind(self, n, obj):
+        self._bind(n, obj, CosNaming.nobject, replace=False)
+
+    def rebind(self, n, obj):
+        self._bind(n, obj, CosNaming.nobject, replace=True)
+
+    def bind_context(self, n, nc):
+        self._bind(n, nc, CosNaming.ncontext, replace=False)
+
+    def rebind_context(self, n, nc):
+        self._bind(n, nc, CosNaming.ncontext, replace=True)
+
+    def resolve(self, n):
+        key = self._key(n)
+        with self._lock:
+            entry = self._bindings.get(key)
+        if entry is None:
+            raise CosNaming.NamingContext.NotFound(CosNaming.NamingContext.missing_node, n)
+        return entry[0]
+
+    def unbind(self, n):
+        key = self._key(n)
+        with self._lock:
+            if self._bindings.pop(key, None) is None:
+                raise CosNaming.NamingContext.NotFound(CosNaming.NamingContext.missing_node, n)
+
+    def new_context(self):
+        raise CORBA.NO_IMPLEMENT(0, CORBA.COMPLETED_NO)
+
+    def bind_new_context(self, n):
+        raise CORBA.NO_IMPLEMENT(0, CORBA.COMPLETED_NO)
+
+    def destroy(self):
+        with self._lock:
+            if self._bindings:
+                raise CosNaming.NamingContext.NotEmpty()
+
+    def list(self, how_many):
+        with self._lock:
+            bindings = [CosNaming.Binding([CosNaming.NameComponent(id_, kind)], binding_type)
+                        for (id_, kind), (_, binding_type) in self._bindings.items()]
+        # No BindingIterator: a how_many of 0 returns everything in the list instead.
+        if how_many:
+            bindings = bindings[:how_many]
+        return bindings, CosNaming.BindingIterator._nil
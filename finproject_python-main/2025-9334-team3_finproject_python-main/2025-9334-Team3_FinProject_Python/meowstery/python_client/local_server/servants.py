@@ -0,0 +1,144 @@
+from datetime import datetime
+
+import service__POA
+
+from meowstery.python_client.local_server.game_world import GameWorld, format_server_time
+
+
+class GameManagerServiceServant(service__POA.GameManagerService):
+    def __init__(self, world: GameWorld):
+        self.world = world
+
+    def joinOrCreateGameSession(self, username):
+        return self.world.join_or_create(username)
+
+    def listActiveGameSessions(self):
+        return self.world.active_sessions()
+
+    def getGameSession(self, gameId):
+        return self.world.session(gameId)
+
+
+class GameServiceServant(service__POA.GameService):
+    def __init__(self, world: GameWorld):
+        self.world = world
+
+    def requestToJoinGame(self, username):
+        self.world.request_to_join(username)
+
+    def getWordMask(self, username):
+        return self.world.word_mask(username)
+
+    def submitGuess(self, username, guessedLetter):
+        self.world.submit_guess(username, guessedLetter)
+
+    def getRemainingGuesses(self, username):
+        return self.world.remaining_guesses(username)
+
+    def getGameStatus(self, username):
+        return self.world.status(username)
+
+    def getRoundStartTime(self, gameSessionId, roundNumber):
+        return self.world.round_start_time(gameSessionId, roundNumber)
+
+    def getRoundDuration(self, gameSessionId):
+        return self.world.round_duration(gameSessionId)
+
+    def getServerTime(self):
+        return format_server_time(datetime.now())
+
+
+class WordServiceServant(service__POA.WordService):
+    def __init__(self, world: GameWorld):
+        self.world = world
+
+    def getRandomWord(self, gameId):
+        return self.world.current_word(gameId)
+
+    def markWordAsUsed(self, word, gameId):
+        self.world.mark_word_used(word, gameId)
+
+    def getNewWordForNextRound(self, gameId):
+        return self.world.new_word_for_next_round(gameId)
+
+
+class AdminServiceServant(service__POA.AdminService):
+    def __init__(self, world: GameWorld):
+        self.world = world
+
+    def createPlayer(self, username, password):
+        self.world.create_player(username, password)
+
+    def removePlayer(self, username):
+        self.world.remove_player(username)
+
+    def updatePlayer(self, oldUsername, newUsername, newPassword):
+        self.world.update_player(oldUsername, newUsername, newPassword)
+
+    def searchPlayer(self, keyword):
+        return self.world.search_players(keyword)
+
+    def updateWaitTime(self, seconds):
+        self.world.set_wait_time(seconds)
+
+    def updateRoundTime(self, seconds):
+        self.world.set_round_time(seconds)
+
+    def getWaitTime(self):
+        return self.world.config.wait_seconds
+
+    def getRoundTime(self):
+        return self.world.config.round_seconds
+
+
+class LeaderboardServiceServant(service__POA.LeaderboardService):
+    def __init__(self, world: GameWorld):
+        self.world = world
+
+    def getTopPlayers(self):
+        return self.world.top_players()
+
+    def incrementWins(self, username):
+        self.world.increment_wins(username)
+
+    def getTopPlayersRange(self, offset, count):
+        return self.world.top_players(limit=max(0, count), offset=max(0, offset))
+
+    def getLeaderboardSince(self, version):
+        return self.world.leaderboard_since(version)
+
+
+class LoginServiceServant(service__POA.LoginService):
+    def __init__(self, world: GameWorld):
+        self.world = world
+
+    def loginPlayer(self, username, password):
+        return self.world.login(username, password)
+
+    def loginAdmin(self, username, password):
+        return self.world.login_admin(username, password)
+
+    def forceLoginPlayer(self, username, password, table):
+        return self.world.force_login(username, password, table)
+
+    def logoutPlayer(self, sessionId):
+        self.world.logout(sessionId)
+
+
+def create_servants(world: GameWorld, faults=None):
+    """Naming-service name -> servant for every interface in GameService.idl and UserService.idl.
+
+    faults is an optional FaultInjector applied to each servant.
+    """
+    servants = {
+        "GameManagerService": GameManagerServiceServant(world),
+        "GameService": GameServiceServant(world),
+        "WordService": WordServiceServant(world),
+        "AdminService": AdminServiceServant(world),
+        "LeaderboardService": LeaderboardServiceServant(world),
+        "LoginService": LoginServiceServant(world),
+    }
+    if faults is not None:
+        for name, servant in servants.items():
+            faults.install(name, servant)
+    return servants
@@ -0,0 +1,153 @@
+import argparse
+import sys
+import time
+
+from omniORB import CORBA
+import CosNaming
+
+from meowstery.python_client.local_server.events import GameEventServiceServant
+from meowstery.python_client.local_server.faults import FaultInjector, FaultRule
+from meowstery.python_client.local_server.game_world import GameConfig, GameWorld
+from meowstery.python_client.local_server.naming import LocalNamingContext
+from meowstery.python_client.local_server.servants import create_servants
+
+
+class LocalServer:
+    """Stand-in for the Java backend: servants plus a corbaloc-reachable naming service on one ORB.
+
+    Clients reach it exactly like the real server, through
+    corbaloc::<host>:<port>/NameService.
+    """
+
+    def __init__(self, host="127.0.0.1", port=1050, config: GameConfig = None, faults: FaultInjector = None):
+        self.host = host
+        self.port = port
+        self.faults = faults
+        self.orb = None
+        self.naming = LocalNamingContext()
+        self.world = GameWorld(config)
+        self.events = GameEventServiceServant(game_exists=self.world.game_exists)
+        self.world.events = self.events
+
+    def start(self):
+        self.orb = CORBA.ORB_init(["-ORBendPoint", f"giop:tcp:{self.host}:{self.port}"], CORBA.ORB_ID)
+
+        root_poa = self.orb.resolve_initial_references("RootPOA")
+        root_poa._get_the_POAManager().activate()
+
+        # The INS POA serves objects under fixed keys, which is what corbaloc URLs address.
+        ins_poa = self.orb.resolve_initial_references("omniINSPOA")
+        ins_poa._get_the_POAManager().activate()
+        ins_poa.activate_object_with_id(b"NameService", self.naming)
+
+        for name, servant in create_servants(self.world, self.faults).items():
+            self.register(name, servant)
+        self.register("GameEventService", self.events)
+        self.events.start()
+        self.world.start()
+        print(f"[LocalServer] Listening on {self.host}:{self.port}")
+        return self
+
+    def register(self, name, servant):
+        self.naming.rebind([CosNaming.NameComponent(name, "")], servant._this())
+        print(f"[LocalServer] Registered {name}")
+
+    def run(self):
+        self.orb.run()
+
+    def shutdown(self):
+        self.world.stop()
+        self.events.stop()
+        if self.orb is not None:
+            self.orb.shutdown(True)
+            self.orb.destroy()
+            self.orb = None
+
+
+def run_push_self_test(server):
+    """Subscribe a real client listener in-process and check every event kind reaches its signal."""
+    from PyQt5.QtCore import QCoreApplication, QTimer
+    from meowstery.python_client.player.model.game_events import GameEventSubscription
+    from meowstery.python_client.player.model.service_registry import get_registry
+    import service
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    registry = get_registry()
+    registry.configure(server.host, server.port)
+    event_service = registry.resolve("GameEventService", service.GameEventService)
+
+    # Subscriptions are only accepted for games the world knows about
+    game_id = server.world.join_or_create("tester")
+    subscription = GameEventSubscription(event_service, game_id, "tester")
+    if not subscription.subscribe():
+        print("[LocalServer] Self-test failed: could not subscribe")
+        return 1
+
+    received = []
+    bridge = subscription.bridge
+    bridge.round_started.connect(lambda *args: received.append(("round_started", args)))
+    bridge.word_mask_changed.connect(lambda g, u, m: received.append(("word_mask_changed", (g, u, m.maskedWord))))
+    bridge.score_changed.connect(lambda *args: received.append(("score_changed", args)))
+    bridge.game_finished.connect(lambda *args: received.append(("game_finished", args)))
+
+    started = time.monotonic()
+    server.events.publish_round_started(game_id, 1, time.strftime("%Y-%m-%d %H:%M:%S"))
+    server.events.publish_word_mask_changed(game_id, "tester", service.WordMaskInfo("_A__", 5))
+    server.events.publish_score_changed(game_id, "tester", 1)
+    server.events.publish_game_finished(game_id, "tester")
+
+    def check():
+        if len(received) >= 4 or time.monotonic() - started > 5:
+            app.quit()
+
+    poll = QTimer()
+    poll.timeout.connect(check)
+    poll.start(20)
+    app.exec_()
+    subscription.unsubscribe()
+
+    for kind, args in received:
+        print(f"[LocalServer] Received {kind}: {args}")
+    if len(received) < 4:
+        print(f"[LocalServer] Self-test failed: {len(received)}/4 events delivered")
+        return 1
+    print(f"[LocalServer] Self-test passed in {(time.monotonic() - started) * 1000:.1f} ms")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the Meowstery CORBA server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1050)
+    parser.add_argument("--wait-seconds", type=int, default=10, help="lobby wait before a game starts")
+    parser.add_argument("--round-seconds", type=int, default=30)
+    parser.add_argument("--fault", action="append", default=[], metavar="PATTERN:OPTIONS",
+                        help='inject latency/failures, e.g. "GameService.*:latency=80,jitter=40,fail=0.05"; '
+                             'repeatable, first matching pattern wins')
+    parser.add_argument("--fault-seed", type=int, default=None)
+    parser.add_argument("--self-test", action="store_true",
+                        help="push one event of each kind to an in-process client listener and exit")
+    args = parser.parse_args(argv)
+
+    config = GameConfig(wait_seconds=args.wait_seconds, round_seconds=args.round_seconds)
+    try:
+        rules = [FaultRule.parse(spec) for spec in args.fault]
+    except ValueError as e:
+        parser.error(str(e))
+    faults = FaultInjector(rules, seed=args.fault_seed) if rules else None
+    for rule in rules:
+        print(f"[LocalServer] Injecting {rule}")
+    server = LocalServer(args.host, args.port, config, faults).start()
+    try:
+        if args.self_test:
+            return run_push_self_test(server)
+        server.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+import logging
 import sys
 import time
 import random
@@ -7,6 +8,9 @@ from PyQt5.QtWidgets import QMessageBox
 from PyQt5.QtCore import QTimer
 
 
+logger = logging.getLogger(__name__)
+
+
 class FinishedController:
     def __init__(self, view, username, game_session_id=None):
         self.view = view
@@ -220,7 +224,7 @@ class GameController:
 
             return True
         except Exception as e:
-            print(f"Error initializing round: {str(e)}")
+            logger.warning("Error initializing round: %s", e)
             return False
 
     def get_round_word(self) -> str:
@@ -259,16 +263,16 @@ class GameController:
 
                 if word in self.used_words or word in tried_words:
                     tried_words.add(word)
-                    print(f"Word '{word}' already used or tried, retrying... ({attempt + 1})")
+                    logger.debug("Word '%s' already used or tried, retrying... (%s)", word, attempt + 1)
                     continue
 
                 return word
 
             except Exception as e:
-                print(f"Error getting word from service: {str(e)}")
+                logger.warning("Error getting word from service: %s", e)
                 break
 
-        print("Failed to get a unique word from the service after max attempts.")
+        logger.warning("Failed to get a unique word from the service after max attempts.")
         return ""
 
     def get_word_from_defaults(self) -> str:
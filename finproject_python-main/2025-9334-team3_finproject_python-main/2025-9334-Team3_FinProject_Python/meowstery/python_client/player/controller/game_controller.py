@@ -1,10 +1,29 @@
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer
+import asyncio
+import logging
+import math
+from PyQt5.QtCore import QObject, pyqtSignal
 import time
 from typing import Optional, Set, Dict, List
-from datetime import datetime
 import random
 import service
 
+from meowstery.python_client.config.config_reader import load_metrics_config
+from meowstery.python_client.player.model.async_corba import CallScope, get_async_corba
+from meowstery.python_client.player.model.call_metrics import get_call_metrics
+from meowstery.python_client.player.model.game_events import GameEventSubscription
+from meowstery.python_client.player.model.game_state import GameStateSnapshotter
+from meowstery.python_client.player.model.guess_pipeline import GuessPipeline
+from meowstery.python_client.player.model.leaderboard_cache import get_leaderboard_cache
+from meowstery.python_client.player.model.poll_scheduler import get_poll_scheduler
+from meowstery.python_client.player.model.round_clock import RoundClock, get_clock_estimator, parse_server_time
+from meowstery.python_client.player.model.service_registry import RETRYABLE_CORBA_ERRORS
+from meowstery.python_client.player.model.timer_registry import TimerRegistry, check_leaks
+from meowstery.python_client.player.model.tracing import get_tracer, traced
+from meowstery.python_client.player.model.word_cache import RoundWordCache
+
+
+logger = logging.getLogger(__name__)
+
 
 class GameController(QObject):
     # Signals (keep existing signal connections)
@@ -19,6 +38,7 @@ class GameController(QObject):
     show_round_results = pyqtSignal(bool, str)
     start_round = pyqtSignal(int, int)
     disable_letter_button = pyqtSignal(str, bool)
+    enable_letter_button = pyqtSignal(str)
     show_error_dialog = pyqtSignal(str, str)
     navigate_to_main_menu = pyqtSignal()
     game_ended = pyqtSignal(str, dict, str, bool)
@@ -28,6 +48,18 @@ class GameController(QObject):
     MAX_GUESSES_PER_ROUND = 5
     ROUND_TRANSITION_SECONDS = 10
     POLL_INTERVAL_MS = 1000
+    FALLBACK_POLL_INTERVAL_MS = 5000  # Polling rate while server-push events are flowing
+    EVENT_CHANNEL_TIMEOUT_SECONDS = 6  # No event or heartbeat for this long means push is down
+    # Base interval of each in-game poll loop, stretched while push events are flowing
+    POLL_TIMER_BASE_MS = {
+        'lobby_poll_timer': POLL_INTERVAL_MS,
+        'state_poll_timer': POLL_INTERVAL_MS,
+        '_round_poll_timer': POLL_INTERVAL_MS,
+        'game_state_sync_timer': 3000,
+        'game_finished_sync_timer': 1000,
+        '_poll_timer': 500,
+    }
+    FAST_POLL_MS = 250  # Around a round start or end the client expects
 
     def __init__(self, username: str, game_session_id: str, view: Optional[QObject] = None, corba_services=None):
         super().__init__()
@@ -37,6 +69,23 @@ class GameController(QObject):
         self.corba_services = corba_services
         self.game_service = corba_services.game_service if corba_services else None
         self.word_service = corba_services.word_service if corba_services else None
+        # Status, word mask and round start are fetched once per tick and shared by every poll loop
+        self.game_state = (GameStateSnapshotter(self.game_service, game_session_id, username,
+                                                clock=get_clock_estimator())
+                           if self.game_service else None)
+        # Poll ticks await their remote calls on the CORBA pool instead of blocking the GUI thread
+        self.call_scope = CallScope("game")
+        self._poll_tasks = {}
+        # The round's word is fetched once per round, not on every keypress
+        self.word_cache = RoundWordCache(self.word_service)
+        # Guesses are sent from a worker thread; letter -> predicted correctness until the reply
+        self._pending_guesses = {}
+        self.guess_pipeline = None
+        if self.game_service:
+            self.guess_pipeline = GuessPipeline(self.game_service, username, self.game_state)
+            self.guess_pipeline.guess_confirmed.connect(self._on_guess_confirmed)
+            self.guess_pipeline.guess_rejected.connect(self._on_guess_rejected)
+            self.guess_pipeline.guess_failed.connect(self._on_guess_failed)
 
         # Game state
         self.current_masked_word = ""
@@ -45,11 +94,11 @@ class GameController(QObject):
         self.round_active = False
         self.game_over = False
         self.is_winner = False
-        self.leaderboard_win_updated = False
         self.is_initializing_round = False
         self.round_transition_in_progress = False
         self.current_round = 1
         self.needs_new_word_for_next_round = False
+        self.current_word = ""
         self.used_words = set()
         self.correct_letters = set()
         self.player_rounds_won = {}
@@ -57,24 +106,41 @@ class GameController(QObject):
         # Initialization attempts counter
         self.init_attempts = 0
 
-        # Timers
-        self.game_timer = QTimer()
-        self.game_timer.timeout.connect(self._on_game_timer_tick)
-        self.init_retry_timer = QTimer()
-        self.init_retry_timer.setSingleShot(True)
-        self.init_retry_timer.timeout.connect(self._initialize_round_with_retry)
-        self.state_poll_timer = QTimer()
-        self.state_poll_timer.timeout.connect(self._poll_game_state)
+        # Timers; every timer, single-shot and poll loop is created through the registry
+        self.timers = TimerRegistry("GameController")
+        self.game_timer = self.timers.timer('game_timer', self._on_game_timer_tick, single_shot=True,
+                                            precise=True)
+        self.init_retry_timer = self.timers.timer('init_retry_timer', self._initialize_round_with_retry,
+                                                  single_shot=True)
+        self.fallback_timer = None
         self.round_sync_timer = None
         self.game_finished_sync_timer = None
 
+        # Server-push events; polling drops to FALLBACK_POLL_INTERVAL_MS while they flow
+        self.event_subscription = None
+        self._event_channel_healthy = False
+        self.event_watchdog_timer = self.timers.timer('event_watchdog_timer', self._check_event_channel)
+
+        # Poll loops run on the shared scheduler, which adapts their intervals (see _poll_loop)
+        self.state_poll_timer = self._poll_loop('state_poll_timer', self._poll_game_state)
+
+        if self.view is not None and hasattr(self.view, "set_metrics_source"):
+            self.view.set_metrics_source(get_call_metrics().snapshot, visible=load_metrics_config()["overlay"])
+
         # Game configuration
         self.round_duration_seconds = 30
-        self.round_start_time = None
+        # Countdown in server time (see round_clock); every game timer reads it
+        self.round_clock = RoundClock(get_clock_estimator(), self.round_duration_seconds)
+
+        # The server records the win; whichever way the game ends, the next leaderboard view refetches
+        self.game_ended.connect(self._invalidate_leaderboard)
 
         if self.view:
             self._connect_view_signals()
 
+    def _invalidate_leaderboard(self, *args):
+        get_leaderboard_cache().invalidate()
+
     def _connect_view_signals(self):
         """Connect signals to view methods while preserving existing connections"""
         self.update_status.connect(self.view.show_overlay_message)
@@ -93,6 +159,8 @@ class GameController(QObject):
             self.start_round.connect(self.view.start_round)
         if hasattr(self.view, 'disable_letter_button'):
             self.disable_letter_button.connect(self.view.disable_letter_button)
+        if hasattr(self.view, 'enable_letter_button'):
+            self.enable_letter_button.connect(self.view.enable_letter_button)
         if hasattr(self.view, 'show_error_dialog'):
             self.show_error_dialog.connect(self.view.show_error_dialog)
         if hasattr(self.view, 'set_letter_button_listener'):
@@ -106,83 +174,137 @@ class GameController(QObject):
             self.update_guessed_letters.connect(self.view.update_guessed_letters_display)
 
     def start_game(self):
-        print("[GameController] Starting game initialization...")
+        """Start the game without blocking; the view takes input while the configuration is fetched."""
+        logger.info("Starting game initialization...")
         self.update_status.emit("Initializing game...")
+        self.call_scope.spawn(self._start_game_async())
+
+    async def _start_game_async(self):
+        async_corba = get_async_corba()
+        admin = async_corba.service(self.corba_services.admin_service, "AdminService")
+        game = async_corba.service(self.game_service, "GameService")
+        wait_time, round_time, duration = await asyncio.gather(
+            admin.getWaitTime(), admin.getRoundTime(), game.getRoundDuration(self.game_session_id),
+            return_exceptions=True)
+        if self.game_over:
+            return
 
         # Fetch game configuration
-        try:
-            self.wait_time_in_seconds = self.corba_services.admin_service.getWaitTime()
-            self.round_time_in_seconds = self.corba_services.admin_service.getRoundTime()
-            print(
-                f"[GameController] Fetched game config: wait={self.wait_time_in_seconds}s, round={self.round_time_in_seconds}s")
-        except Exception as e:
-            print(f"[GameController] Error fetching game configuration: {e}")
+        error = next((e for e in (wait_time, round_time) if isinstance(e, Exception)), None)
+        if error is not None:
+            logger.warning("Error fetching game configuration: %s", error)
             self.update_status.emit("Error fetching game configuration.")
             return
+        self.wait_time_in_seconds = wait_time
+        self.round_time_in_seconds = round_time
+        logger.info("Fetched game config: wait=%ss, round=%ss",
+                    self.wait_time_in_seconds, self.round_time_in_seconds)
+
+        # This game's round length; the admin setting above only applies to games created after a change
+        if isinstance(duration, Exception):
+            logger.warning("Could not fetch round duration, using %ss: %s", self.round_duration_seconds, duration)
+        elif duration > 0:
+            self.round_duration_seconds = duration
 
         # Initialize player rounds won from server
-        players = self._get_players_in_session(self.game_session_id) or [self.username]
+        try:
+            session = await self._await_current_session()
+        except Exception as e:
+            logger.warning("Error getting players in session: %s", e)
+            session = None
+        if self.game_over:
+            return
+        players = (session.playerUsernames if session else None) or [self.username]
         for player in players:
             self.player_rounds_won[player] = 0
         self._update_all_player_scores_from_db()  # Get initial scores from server
 
+        # Subscribe before polling starts so the timers pick up the fallback rate
+        self._subscribe_to_game_events()
+
         # Start game state synchronization
         self._start_game_state_sync()
 
         # Start game initialization with retry
         self._initialize_round_with_retry()
 
-    def _get_players_in_session(self, game_session_id):
-        try:
-            game_manager_service = self.corba_services.game_manager_service
-            sessions = game_manager_service.listActiveGameSessions()
-            for session in sessions:
-                if session.gameId == game_session_id:
-                    return session.playerUsernames
-        except Exception as e:
-            print(f"[GameController] Error getting players in session: {e}")
-        return None
+    def _get_current_session(self):
+        return self.corba_services.session_cache.get(self.game_session_id)
+
+    async def _await_current_session(self):
+        return await get_async_corba().run("GameManagerService", self._get_current_session)
+
+    async def _await_round_start_time(self, round_number):
+        return await get_async_corba().run("GameService", self.game_state.round_start_time, round_number)
+
+    async def _await_round_word(self):
+        """Fetch the current round's word off the GUI thread; it becomes current_word unless the round moved on."""
+        round_number = self.current_round
+        word = await get_async_corba().run("WordService", self.word_cache.get, self.game_session_id, round_number)
+        if word and round_number == self.current_round:
+            self.current_word = word
+        return word
+
+    def _game_state_snapshot(self, max_age=None):
+        return self.game_state.current(self.current_round, max_age)
+
+    async def _await_game_state_snapshot(self, max_age=None):
+        return await get_async_corba().run("GameService", self._game_state_snapshot, max_age)
+
+    def _spawn_poll(self, key, coro_factory):
+        """Start coro_factory() unless the previous tick's task under key is still running."""
+        task = self._poll_tasks.get(key)
+        if task is not None and not task.done():
+            return task
+        task = self._poll_tasks[key] = self.call_scope.spawn(coro_factory())
+        return task
 
     def _initialize_round_with_retry(self):
-        print(f"[GameController] Attempting to join game (attempt {self.init_attempts + 1})...")
+        self._spawn_poll('join', self._join_game_async)
+
+    async def _join_game_async(self):
+        logger.info("Attempting to join game (attempt %s)...", self.init_attempts + 1)
         self.init_attempts += 1
 
         try:
-            game_manager_service = self.corba_services.game_manager_service
-            sessions = game_manager_service.listActiveGameSessions()
-            current_session = next((s for s in sessions if s.gameId == self.game_session_id), None)
+            current_session = await self._await_current_session()
+            if self.game_over:
+                return
 
             if not current_session:
-                print("[GameController] Session not found during join retry. Returning to lobby.")
+                logger.warning("Session not found during join retry. Returning to lobby.")
                 self.update_status.emit("Session not found. Returning to lobby.")
                 self.return_to_main_menu()
                 return
 
             if current_session.sessionStatus == "PLAYING" and self.username in current_session.playerUsernames:
-                print("[GameController] Session already PLAYING and player present. Starting round polling...")
+                logger.info("Session already PLAYING and player present. Starting round polling...")
                 self._start_round_polling()
                 return
             elif current_session.sessionStatus == "WAITING":
                 # Check if we've exceeded the wait time
                 if self.init_attempts * self.POLL_INTERVAL_MS > self.wait_time_in_seconds * 1000:
-                    print("[GameController] Wait time exceeded. Returning to lobby.")
+                    logger.info("Wait time exceeded. Returning to lobby.")
                     self.update_status.emit("Game start timeout. Returning to lobby.")
                     self.return_to_main_menu()
                     return
 
                 try:
-                    self.corba_services.game_service.requestToJoinGame(self.username)
-                    print("[GameController] Successfully requested to join game. Starting lobby polling...")
+                    game = get_async_corba().service(self.corba_services.game_service, "GameService")
+                    await game.requestToJoinGame(self.username)
+                    if self.game_over:
+                        return
+                    logger.info("Successfully requested to join game. Starting lobby polling...")
                     self._start_lobby_polling()
                 except service.NoOpponentFound as e:
-                    print(f"[GameController] No opponent found: {e.reason}. Transitioning to lobby polling...")
+                    logger.info("No opponent found: %s. Transitioning to lobby polling...", e.reason)
                     if self.init_attempts < self.MAX_INIT_ATTEMPTS:
                         self._start_lobby_polling()
                     else:
                         self.update_status.emit("Matchmaking timed out. No opponent found.")
                         self.return_to_main_menu()
             else:
-                print(f"[GameController] Session in unexpected state: {current_session.sessionStatus}. Retrying...")
+                logger.info("Session in unexpected state: %s. Retrying...", current_session.sessionStatus)
                 if self.init_attempts < self.MAX_INIT_ATTEMPTS:
                     self.init_retry_timer.start(self.POLL_INTERVAL_MS)
                 else:
@@ -190,64 +312,75 @@ class GameController(QObject):
                     self.return_to_main_menu()
 
         except service.NoOpponentFound as e:
-            print(f"[GameController] No opponent found: {e.reason}. Transitioning to lobby polling...")
+            logger.info("No opponent found: %s. Transitioning to lobby polling...", e.reason)
             if self.init_attempts < self.MAX_INIT_ATTEMPTS:
                 self._start_lobby_polling()
             else:
                 self.update_status.emit("Matchmaking timed out. No opponent found.")
                 self.return_to_main_menu()
         except Exception as e:
-            print(f"[GameController] Error during initial join attempt: {e}")
+            logger.warning("Error during initial join attempt: %s", e)
             self.update_status.emit(f"Error during game initialization: {e}")
             self.return_to_main_menu()
 
     def _start_lobby_polling(self):
-        print("[GameController] Starting lobby polling...")
+        logger.info("Starting lobby polling...")
         if not hasattr(self, 'lobby_poll_timer') or not self.lobby_poll_timer.isActive():
-            self.lobby_poll_timer = QTimer()
-            self.lobby_poll_timer.timeout.connect(self._poll_lobby_state)
-            self.lobby_poll_timer.start(self.POLL_INTERVAL_MS)
-        self._poll_attempts = 0
-        self._max_poll_attempts = (self.wait_time_in_seconds * 1000 // self.POLL_INTERVAL_MS) + 5
+            self.lobby_poll_timer = self._poll_loop('lobby_poll_timer', self._poll_lobby_state)
+            self.lobby_poll_timer.start()
+        self._lobby_poll_started = time.time()
+        # Same grace period as the old attempt limit: the wait time plus five polls
+        self._lobby_poll_deadline = self._lobby_poll_started + self.wait_time_in_seconds + 5 * self.POLL_INTERVAL_MS / 1000
+        # The server starts the game when the wait time runs out; poll fast around that moment
+        self.lobby_poll_timer.expect_at(self._lobby_poll_started + self.wait_time_in_seconds, self.FAST_POLL_MS)
 
     def _poll_lobby_state(self):
+        self._spawn_poll('lobby', self._poll_lobby_state_async)
+
+    async def _poll_lobby_state_async(self):
         try:
-            game_manager_service = self.corba_services.game_manager_service
-            sessions = game_manager_service.listActiveGameSessions()
-            current_session = next((s for s in sessions if s.gameId == self.game_session_id), None)
+            current_session = await self._await_current_session()
+            if self.game_over or not self.lobby_poll_timer.isActive():
+                return
 
             if not current_session:
-                print("[GameController] Session not found. Returning to lobby.")
+                logger.warning("Session not found. Returning to lobby.")
                 self.update_status.emit("Session not found. Returning to lobby.")
                 self.lobby_poll_timer.stop()
                 self.navigate_to_main_menu.emit()
                 return
 
-            print(
-                f"[LobbyController] Session status: {current_session.sessionStatus}, Players: {current_session.playerUsernames}")
+            logger.debug("Session status: %s, Players: %s",
+                         current_session.sessionStatus, current_session.playerUsernames)
 
+            self.lobby_poll_timer.report_success()
             # Calculate remaining time
-            remaining_time = self.wait_time_in_seconds - (self._poll_attempts * self.POLL_INTERVAL_MS / 1000)
+            remaining_time = self.wait_time_in_seconds - (time.time() - self._lobby_poll_started)
             remaining_time = max(0, int(remaining_time))
 
             self.update_status.emit(
                 f"Waiting for game to start... Players: {len(current_session.playerUsernames)}/{current_session.sessionStatus} - Time left: {remaining_time}s")
 
             if current_session.sessionStatus == "PLAYING":
-                print("[GameController] Game is starting!")
+                logger.debug("Game is starting!")
                 self.update_status.emit("Game is starting!")
                 self.lobby_poll_timer.stop()
                 self._start_round_polling()
                 return
 
-            self._poll_attempts += 1
-            if self._poll_attempts > self._max_poll_attempts:
+            if time.time() > self._lobby_poll_deadline:
                 self.update_status.emit("Matchmaking timed out. Please try again.")
                 self.lobby_poll_timer.stop()
                 self.navigate_to_main_menu.emit()
 
+        except RETRYABLE_CORBA_ERRORS as e:
+            logger.warning("Lobby poll failed, backing off: %s", e)
+            self.lobby_poll_timer.report_error()
+            if time.time() > self._lobby_poll_deadline:
+                self.lobby_poll_timer.stop()
+                self.navigate_to_main_menu.emit()
         except Exception as e:
-            print(f"[GameController] Error polling lobby state: {e}")
+            logger.warning("Error polling lobby state: %s", e)
             self.update_status.emit(f"Error polling lobby: {e}")
             self.lobby_poll_timer.stop()
             self.navigate_to_main_menu.emit()
@@ -255,126 +388,140 @@ class GameController(QObject):
     def _start_round_polling(self):
         # Prevent multiple simultaneous round polling starts
         if hasattr(self, '_round_poll_timer') and self._round_poll_timer and self._round_poll_timer.isActive():
-            print("[GameController] Round polling already active, skipping...")
+            logger.info("Round polling already active, skipping...")
             return
 
-        print("[GameController] Starting round polling...")
+        logger.info("Starting round polling...")
+        self._spawn_poll('round_start', self._start_round_polling_async)
+
+    async def _start_round_polling_async(self):
         try:
-            game_manager_service = self.corba_services.game_manager_service
-            sessions = game_manager_service.listActiveGameSessions()
-            current_session = next((s for s in sessions if s.gameId == self.game_session_id), None)
+            current_session = await self._await_current_session()
+            if self.game_over:
+                return
 
             if not current_session:
-                print("[GameController] Session not found for round polling. Returning to lobby.")
+                logger.warning("Session not found for round polling. Returning to lobby.")
                 self.update_status.emit("Session not found. Returning to lobby.")
                 self.navigate_to_main_menu.emit()
                 return
 
-            round_start_time = self._parse_server_time(current_session.startTime)
-            now = time.time()
-            if round_start_time is not None and now < round_start_time:
-                seconds_to_wait = int(round_start_time - now)
-                print(f"[GameController] Waiting for round to start in {seconds_to_wait} seconds...")
-                self.update_status.emit(f"Round starts in {seconds_to_wait} seconds...")
-                QTimer.singleShot(max(0, seconds_to_wait * 1000), self._start_word_mask_polling)
+            round_start_time = parse_server_time(
+                await self._await_round_start_time(self.current_round) or current_session.startTime)
+            if self.game_over:
+                return
+            seconds_to_wait = self.round_clock.seconds_until(round_start_time) if round_start_time else 0.0
+            # Word mask polling runs fast for a moment around the start instead of a full interval late
+            estimator = self.round_clock.estimator
+            self._expected_round_start = (estimator.to_local(round_start_time) if seconds_to_wait > 0
+                                          else time.time())
+            if seconds_to_wait > 0:
+                logger.info("Waiting for round to start in %.2f seconds...", seconds_to_wait)
+                self.update_status.emit(f"Round starts in {math.ceil(seconds_to_wait)} seconds...")
+                self.timers.single_shot(seconds_to_wait * 1000, self._start_word_mask_polling)
             else:
                 self._start_word_mask_polling()
         except Exception as e:
-            print(f"[GameController] Error in _start_round_polling: {e}")
+            logger.warning("Error in _start_round_polling: %s", e)
             self.update_status.emit(f"Error starting round: {e}")
             self.navigate_to_main_menu.emit()
 
-    def _parse_server_time(self, time_str):
-        if not time_str:
-            return None
-        try:
-            try:
-                dt = datetime.fromisoformat(time_str)
-            except Exception:
-                try:
-                    dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S.%f")
-                except Exception:
-                    dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
-            return dt.timestamp()
-        except Exception as e:
-            print(f"[GameController] Could not parse server time '{time_str}': {e}")
-            return None
-
     def _start_word_mask_polling(self):
         # Prevent multiple simultaneous word mask polling starts
         if hasattr(self, '_round_poll_timer') and self._round_poll_timer and self._round_poll_timer.isActive():
-            print("[GameController] Word mask polling already active, skipping...")
+            logger.info("Word mask polling already active, skipping...")
             return
 
-        print("[GameController] Starting word mask polling...")
+        logger.info("Starting word mask polling...")
+        self._spawn_poll('word_mask_start', self._start_word_mask_polling_async)
+
+    async def _start_word_mask_polling_async(self):
         try:
             # First try to get the word directly
             try:
-                actual_word = self.corba_services.word_service.getRandomWord(self.game_session_id)
-                print(f"[GameController] Actual word for this round (assigned): {actual_word}")
-                self.current_word = actual_word
+                actual_word = await self._await_round_word()
+                logger.info("Actual word for this round (assigned): %s", actual_word)
             except Exception as e:
-                print(f"[GameController] Could not fetch/assign actual word: {e}")
+                logger.warning("Could not fetch/assign actual word: %s", e)
 
             # Then check game status
             try:
-                status = self.corba_services.game_service.getGameStatus(self.username)
-                print(f"[GameController] Current game status: {status}")
+                snapshot = await self._await_game_state_snapshot()
+                snapshot.raise_for_status()
+                status = snapshot.status
+                logger.info("Current game status: %s", status)
                 if status != "PLAYING":
-                    print(f"[GameController] Game not in PLAYING state: {status}")
+                    logger.info("Game not in PLAYING state: %s", status)
                     self.update_status.emit(f"Waiting for game to start... (Status: {status})")
             except Exception as e:
-                print(f"[GameController] Error getting game status: {e}")
+                logger.warning("Error getting game status: %s", e)
+            if self.game_over or (getattr(self, '_round_poll_timer', None) and self._round_poll_timer.isActive()):
+                return
 
             # Start polling for word mask
-            self._round_poll_timer = QTimer()
-            self._round_poll_timer.timeout.connect(self._poll_word_mask)
+            self._round_poll_timer = self._poll_loop('_round_poll_timer', self._poll_word_mask)
             self._round_poll_attempts = 0
             self._max_round_poll_attempts = (self.round_time_in_seconds * 1000 // self.POLL_INTERVAL_MS) + 5
-            self._round_poll_timer.start(self.POLL_INTERVAL_MS)
+            # Give up by elapsed time, not attempt count, so a stretched interval waits just as long
+            self._round_poll_deadline = time.time() + self._max_round_poll_attempts * self.POLL_INTERVAL_MS / 1000
+            self._round_poll_timer.expect_at(getattr(self, '_expected_round_start', None) or time.time(),
+                                             self.FAST_POLL_MS)
+            self._round_poll_timer.start()
 
         except Exception as e:
-            print(f"[GameController] Error in _start_word_mask_polling: {e}")
+            logger.warning("Error in _start_word_mask_polling: %s", e)
             self.update_status.emit(f"Error starting game: {e}")
             self.return_to_main_menu()
 
     def _poll_word_mask(self):
+        self._spawn_poll('word_mask', self._poll_word_mask_async)
+
+    async def _poll_word_mask_async(self):
         try:
             self._round_poll_attempts += 1
-            print(f"[GameController] Polling for word mask, attempt {self._round_poll_attempts}")
+            logger.debug("Polling for word mask, attempt %s", self._round_poll_attempts)
 
-            if self._round_poll_attempts > self._max_round_poll_attempts:
-                print("[GameController] Max polling attempts reached. Stopping word mask polling.")
+            if time.time() > self._round_poll_deadline:
+                logger.debug("Max polling attempts reached. Stopping word mask polling.")
                 self.update_status.emit("Failed to receive word from server. Please try again later.")
                 self._round_poll_timer.stop()
                 self.return_to_main_menu()
                 return
 
             try:
-                # First check game status
-                status = self.corba_services.game_service.getGameStatus(self.username)
+                # Status and mask come from the same snapshot
+                snapshot = await self._await_game_state_snapshot()
+                if self.game_over or not self._round_poll_timer.isActive():
+                    return
+                snapshot.raise_for_status()
+                status = snapshot.status
                 if status != "PLAYING":
-                    print(f"[GameController] Game not in PLAYING state: {status}")
+                    logger.debug("Game not in PLAYING state: %s", status)
                     self.update_status.emit(f"Waiting for game to start... (Status: {status})")
                     return
 
-                # Then try to get word mask
-                word_mask_info = self.corba_services.game_service.getWordMask(self.username)
-                print(f"[GameController] Received word mask info: {word_mask_info}")
+                snapshot.raise_for_mask()
+                # The round clock only reads known start times, so fetch this one before gameplay starts
+                await self._await_round_start_time(self.current_round)
+                if self.game_over or not self._round_poll_timer.isActive():
+                    return
+                self._round_poll_timer.report_success()
+                word_mask_info = snapshot.word_mask
+                logger.debug("Received word mask info: %s", word_mask_info)
 
                 if word_mask_info and hasattr(word_mask_info, 'maskedWord') and word_mask_info.maskedWord:
                     if word_mask_info.maskedWord == self.current_masked_word:
-                        print("[GameController] Received same word mask, continuing to poll...")
+                        logger.debug("Received same word mask, continuing to poll...")
                         return
 
                     self._round_poll_timer.stop()
                     self._start_gameplay(word_mask_info)
                     return
                 else:
-                    print(f"[GameController] No valid word mask info received")
+                    logger.debug("No valid word mask info received")
                     # If we have a current word but no mask, create a masked version
                     if self.current_word:
-                        print("[GameController] Creating masked word from current word")
+                        logger.debug("Creating masked word from current word")
                         masked_word = '_' * len(self.current_word)
                         word_mask_info = type('WordMaskInfo', (), {'maskedWord': masked_word})()
                         self._round_poll_timer.stop()
@@ -385,109 +532,109 @@ class GameController(QObject):
                     f"Waiting for game to start... ({self._round_poll_attempts}/{self._max_round_poll_attempts})")
 
             except service.GameNotFound as e:
-                print(f"[GameController] Game not found: {e.reason}")
+                logger.warning("Game not found: %s", e.reason)
                 self.update_status.emit(f"Game not found: {e.reason}")
                 self._round_poll_timer.stop()
                 self.return_to_main_menu()
             except service.NoOpponentFound as e:
-                print(f"[GameController] No opponent found: {e.reason}")
+                logger.debug("No opponent found: %s", e.reason)
                 self.update_status.emit("Waiting for opponent to join...")
+            except RETRYABLE_CORBA_ERRORS as e:
+                # Keep trying until the deadline, backing off so a struggling server is not hammered
+                logger.warning("getWordMask failed, backing off: %s", e)
+                self._round_poll_timer.report_error()
+                self.update_status.emit("Connection problem, retrying...")
             except Exception as e:
-                print(f"[GameController] getWordMask error: {e}")
+                logger.warning("getWordMask error: %s", e)
                 self.update_status.emit(f"Error getting word mask: {e}")
                 self._round_poll_timer.stop()
                 self.return_to_main_menu()
         except Exception as e:
-            print(f"[GameController] Error in _poll_word_mask: {e}")
+            logger.warning("Error in _poll_word_mask: %s", e)
             self.update_status.emit(f"Error in round polling: {e}")
             self._round_poll_timer.stop()
             self.return_to_main_menu()
 
-    def get_current_round_number(self):
-        """Get the current round number from server using available IDL methods."""
+    async def get_current_round_number(self):
+        """Get the current round number from server using available IDL methods (awaitable)."""
         try:
+            round_number = self.current_round
             # Try to get round information using getRoundStartTime with current round
             # This will help us determine if we're in a valid round
-            round_start_time = self.corba_services.game_service.getRoundStartTime(
-                self.game_session_id,
-                self.current_round
-            )
+            round_start_time = await self._await_round_start_time(round_number)
 
             # If we get a valid start time, the round exists
             if round_start_time:
-                print(f"[GameController] Server confirms round {self.current_round} exists")
+                logger.debug("Server confirms round %s exists", round_number)
                 return self.current_round
             else:
                 # Try the next round
-                next_round = self.current_round + 1
-                round_start_time = self.corba_services.game_service.getRoundStartTime(
-                    self.game_session_id,
-                    next_round
-                )
-                if round_start_time:
-                    print(f"[GameController] Server confirms round {next_round} exists, updating local round")
+                next_round = round_number + 1
+                round_start_time = await self._await_round_start_time(next_round)
+                if round_start_time and self.current_round == round_number:
+                    logger.debug("Server confirms round %s exists, updating local round", next_round)
                     self.current_round = next_round
                     return self.current_round
                 else:
-                    print(f"[GameController] Using local round {self.current_round} (no server round info available)")
+                    logger.debug("Using local round %s (no server round info available)", self.current_round)
                     return self.current_round
 
         except Exception as e:
-            print(f"[GameController] Error getting round number from server: {e}")
-            print(f"[GameController] Using local round {self.current_round}")
+            logger.warning("Error getting round number from server: %s", e)
+            logger.debug("Using local round %s", self.current_round)
             return self.current_round
 
     def _update_all_player_scores_from_db(self):
-        """Update player scores using available IDL methods."""
+        """Update player scores using available IDL methods; the session is fetched in the background."""
+        if not self.game_over:
+            self._spawn_poll('player_scores', self._update_player_scores_async)
+
+    async def _update_player_scores_async(self):
         try:
             # Get current session information to see player list
-            game_manager_service = self.corba_services.game_manager_service
-            sessions = game_manager_service.listActiveGameSessions()
-
-            for session in sessions:
-                if session.gameId == self.game_session_id:
-                    # Update player list from session
-                    for player in session.playerUsernames:
-                        if player not in self.player_rounds_won:
-                            self.player_rounds_won[player] = 0
-
-                    # Since we can't get individual player wins from server,
-                    # we'll use local tracking but log that we're doing so
-                    for player in self.player_rounds_won:
-                        if player in session.playerUsernames:
-                            print(f"[GameController] Using local wins for {player}: {self.player_rounds_won[player]}")
-                        else:
-                            # Remove players no longer in session
-                            del self.player_rounds_won[player]
-
-                    # Update UI if view is available
-                    if hasattr(self.view, 'get_player_scores_panel'):
-                        for player, wins in self.player_rounds_won.items():
-                            self.view.get_player_scores_panel().update_score(player, wins)
-                    break
+            session = await self._await_current_session()
+            if session and not self.game_over:
+                # Update player list from session
+                for player in session.playerUsernames:
+                    if player not in self.player_rounds_won:
+                        self.player_rounds_won[player] = 0
+
+                # Since we can't get individual player wins from server,
+                # we'll use local tracking but log that we're doing so
+                for player in list(self.player_rounds_won):
+                    if player in session.playerUsernames:
+                        logger.debug("Using local wins for %s: %s", player, self.player_rounds_won[player])
+                    else:
+                        # Remove players no longer in session
+                        del self.player_rounds_won[player]
+
+                # Update UI if view is available
+                if hasattr(self.view, 'get_player_scores_panel'):
+                    for player, wins in self.player_rounds_won.items():
+                        self.view.get_player_scores_panel().update_score(player, wins)
 
         except Exception as e:
-            print(f"[GameController] Error in _update_all_player_scores_from_db: {e}")
+            logger.warning("Error updating player scores: %s", e)
 
     def get_player_round_wins(self, username: str) -> int:
         """Get the number of rounds won by a player using local tracking."""
         try:
             # Since getPlayerRoundWins is not available in IDL, use local tracking
             wins = self.player_rounds_won.get(username, 0)
-            print(f"[GameController] Using local wins for {username}: {wins}")
+            logger.debug("Using local wins for %s: %s", username, wins)
             return wins
         except Exception as e:
-            print(f"[GameController] Error getting wins for {username}: {e}")
+            logger.warning("Error getting wins for %s: %s", username, e)
             return self.player_rounds_won.get(username, 0)
 
     def get_all_player_wins(self) -> Dict[str, int]:
         """Get all player wins using local tracking."""
         try:
             # Since getAllPlayerWins is not available in IDL, use local tracking
-            print("[GameController] Using local wins for all players")
+            logger.debug("Using local wins for all players")
             return self.player_rounds_won.copy()
         except Exception as e:
-            print(f"[GameController] Error getting all player wins: {e}")
+            logger.warning("Error getting all player wins: %s", e)
             return self.player_rounds_won.copy()
 
     def mark_round_guessed(self, username: str):
@@ -497,46 +644,48 @@ class GameController(QObject):
             if username not in self.player_rounds_won:
                 self.player_rounds_won[username] = 0
             self.player_rounds_won[username] += 1
-            print(f"[GameController] Marked round {self.current_round} guessed by {username} (local tracking)")
+            logger.debug("Marked round %s guessed by %s (local tracking)", self.current_round, username)
         except Exception as e:
-            print(f"[GameController] Error marking round guessed: {e}")
+            logger.warning("Error marking round guessed: %s", e)
 
     def increment_round(self):
         """Increment the round number locally since incrementGameRound is not available in IDL."""
         try:
             # Since incrementGameRound is not available in IDL, increment locally
-            print("[GameController] Incrementing round locally (incrementGameRound not available in IDL)")
+            logger.warning("Incrementing round locally (incrementGameRound not available in IDL)")
             self.current_round += 1
         except Exception as e:
-            print(f"[GameController] Error incrementing round: {e}")
+            logger.warning("Error incrementing round: %s", e)
             self.current_round += 1  # Fallback to local increment
 
-    def is_round_complete(self, round_number: int) -> bool:
-        """Check if a round is complete using local logic since isRoundComplete is not available in IDL."""
+    async def is_round_complete(self, round_number: int) -> bool:
+        """Check if a round is complete using local logic since isRoundComplete is not available in IDL (awaitable)."""
         try:
             # Since isRoundComplete is not available in IDL, use local logic
             # A round is complete if someone has won or all players are out of guesses
-            game_status = self.corba_services.game_service.getGameStatus(self.username)
-            if game_status in ["WON", "LOST", "FINISHED"]:
+            snapshot = await self._await_game_state_snapshot()
+            snapshot.raise_for_status()
+            if snapshot.status in ["WON", "LOST", "FINISHED"]:
                 return True
 
             # Check if current round is different (indicating round completion)
             if self.current_round > round_number:
                 return True
 
-            print(f"[GameController] Assuming round {round_number} incomplete (isRoundComplete not available in IDL)")
+            logger.warning("Assuming round %s incomplete (isRoundComplete not available in IDL)", round_number)
             return False
         except Exception as e:
-            print(f"[GameController] Error checking round completion: {e}")
+            logger.warning("Error checking round completion: %s", e)
             return False
 
     def _start_gameplay(self, word_mask_info):
-        try:
-            actual_word = self.word_service.getRandomWord(self.game_session_id)
-            print(f"[GameController] Actual word for this round: {actual_word}")
+        actual_word = self.word_cache.peek(self.game_session_id, self.current_round)
+        if actual_word:
             self.current_word = actual_word
-        except Exception as e:
-            print(f"[GameController] Could not fetch actual word: {e}")
+            logger.info("Actual word for this round: %s", actual_word)
+        else:
+            # Not fetched yet; guesses are judged by the server until it arrives
+            self.call_scope.spawn(self._await_round_word())
 
         self.update_status.emit("Game started! Guess the word!")
 
@@ -546,26 +695,27 @@ class GameController(QObject):
         # Use guessesLeft from server instead of always resetting to MAX_GUESSES_PER_ROUND
         if hasattr(word_mask_info, 'guessesLeft') and word_mask_info.guessesLeft is not None:
             self.guesses_left = word_mask_info.guessesLeft
-            print(f"[GameController] Using guesses left from server: {self.guesses_left}")
+            logger.info("Using guesses left from server: %s", self.guesses_left)
 
             # Workaround: If server sends 0 guesses at the start of a round, reset to maximum
             # This handles cases where the server doesn't properly reset guesses for new rounds
             if self.guesses_left == 0 and not self.guessed_letters:
-                print("[GameController] Server sent 0 guesses at round start, resetting to maximum")
+                logger.info("Server sent 0 guesses at round start, resetting to maximum")
                 self.guesses_left = self.MAX_GUESSES_PER_ROUND
         else:
             self.guesses_left = self.MAX_GUESSES_PER_ROUND
-            print(f"[GameController] No guesses left from server, using default: {self.guesses_left}")
+            logger.info("No guesses left from server, using default: %s", self.guesses_left)
 
         # Extract guessed letters from the initial masked word
         self.guessed_letters = set()
+        self._pending_guesses.clear()
         for char in self.current_masked_word:
             if char != '_':
                 self.guessed_letters.add(char)
-        print(f"[GameController] Initial guessed letters: {sorted(self.guessed_letters)}")
+        logger.info("Initial guessed letters: %s", sorted(self.guessed_letters))
 
         self.round_active = True
-        self.round_start_time = time.time()
+        self._start_round_clock()
 
         # Update UI with initial state
         self.update_word_display.emit(self.current_masked_word)
@@ -580,18 +730,24 @@ class GameController(QObject):
 
         try:
             if self.game_timer:
-                self.game_timer.setInterval(1000)
-                self.game_timer.start()
+                self.update_time_left.emit(self.round_clock.remaining_display())
+                self.game_timer.start(self.round_clock.ms_to_next_tick())
             if self.state_poll_timer:
-                self.state_poll_timer.start(self.POLL_INTERVAL_MS)
+                self.state_poll_timer.start()
         except Exception as e:
-            print(f"[GameController] Error starting timers: {e}")
+            logger.warning("Error starting timers: %s", e)
             self.return_to_main_menu()
 
     def _poll_game_state(self):
+        self._spawn_poll('game_state', self._poll_game_state_async)
+
+    async def _poll_game_state_async(self):
         try:
-            status = self.game_service.getGameStatus(self.username)
-            if status != "PLAYING":
+            snapshot = await self._await_game_state_snapshot()
+            snapshot.raise_for_status()
+            self.state_poll_timer.report_success()
+            status = snapshot.status
+            if status != "PLAYING" and self.round_active:
                 self.round_active = False
                 self.game_timer.stop()
                 self.state_poll_timer.stop()
@@ -599,15 +755,26 @@ class GameController(QObject):
                 self.disable_keyboard.emit()
                 self.game_ended.emit(self.username, {}, self.game_session_id, status == "ENDED")
                 return
+        except RETRYABLE_CORBA_ERRORS:
+            self.state_poll_timer.report_error()
         except Exception:
             pass
 
+    def _start_round_clock(self):
+        """Count the current round down from the server's start time (from now if it is not known yet)."""
+        start_text = self.game_state.known_round_start_time(self.current_round) if self.game_state else ""
+        self.round_clock.start_round(self.current_round, start_text, self.round_duration_seconds)
+        logger.debug("Round %s clock: %.2fs left, server clock %s", self.current_round,
+                     self.round_clock.remaining(), self.round_clock.estimator.stats())
+
     def _on_game_timer_tick(self):
+        """Single-shot, re-armed to land on each displayed second and exactly on the round deadline."""
         try:
-            elapsed = int(time.time() - self.round_start_time)
-            remaining = self.round_duration_seconds - elapsed
-            self.update_time_left.emit(max(0, remaining))
-            if remaining <= 0:
+            remaining = self.round_clock.remaining()
+            self.update_time_left.emit(math.ceil(remaining))
+            if remaining > 0:
+                self.game_timer.start(self.round_clock.ms_to_next_tick())
+            else:
                 # Prevent multiple time-up triggers
                 if self.round_transition_in_progress:
                     return
@@ -627,7 +794,9 @@ class GameController(QObject):
         except Exception as e:
             self.show_error_dialog.emit("CORBA Error", str(e))
 
+    @traced("GameController.handle_letter_guess")
     def handle_letter_guess(self, letter):
+        """Apply the guess locally at once and let the guess pipeline send it; never blocks."""
         if not self.round_active:
             self.update_status.emit("Round not active. Wait for the round to start.")
             return
@@ -638,61 +807,20 @@ class GameController(QObject):
             return
 
         try:
-            game_id = self.game_session_id
-            if not game_id:
-                print("[GameController] Invalid game session ID for letter check")
+            if not self.game_session_id:
+                logger.warning("Invalid game session ID for letter check")
                 raise Exception("Invalid game session ID")
 
-            word = None
-            try:
-                word = self.word_service.getRandomWord(game_id)
-                print(f"[GameController] Got word directly from WordService: {word}")
-                self.current_word = word
-            except Exception as e:
-                print(f"[GameController] Error getting word from server: {e}")
-                if self.current_word:
-                    word = self.current_word
-                    print(f"[GameController] Using stored word: {word}")
-                else:
-                    raise Exception("No valid word available for letter check")
-
-            if not word:
-                print("[GameController] No valid word available for letter check")
-                raise Exception("No valid word available for letter check")
-
-            positions = [i for i, char in enumerate(word) if char.upper() == letter]
+            # Predict the outcome from the round's word; the server reply reconciles it
+            word = self.current_word
+            positions = [i for i, char in enumerate(word) if char.upper() == letter] if word else []
             is_correct_guess = bool(positions)
+            if not word:
+                logger.debug("No word known yet, waiting for server to judge the guess")
 
-            print(
-                f"[GameController] Letter '{letter}' checked with WordService: {'correct' if is_correct_guess else 'incorrect'}")
-
-            try:
-                if self.word_service:
-                    game_exists = self._check_game_exists_on_server()
-
-                    if game_exists:
-                        try:
-                            self.game_service.submitGuess(self.username, letter)
-                            if not self._update_word_mask():
-                                if is_correct_guess:
-                                    self._update_local_word_mask(letter, positions)
-                        except service.GameNotFound:
-                            if is_correct_guess:
-                                self._update_local_word_mask(letter, positions)
-                        except Exception as e:
-                            print(f"[GameController] Error submitting guess to server: {e}")
-                            if is_correct_guess:
-                                self._update_local_word_mask(letter, positions)
-                    else:
-                        if is_correct_guess:
-                            self._update_local_word_mask(letter, positions)
-                else:
-                    if is_correct_guess:
-                        self._update_local_word_mask(letter, positions)
-            except Exception as e:
-                print(f"[GameController] Error checking game existence: {e}")
-                if is_correct_guess:
-                    self._update_local_word_mask(letter, positions)
+            self._pending_guesses[letter] = is_correct_guess
+            if is_correct_guess:
+                self._update_local_word_mask(letter, positions)
 
             self.guessed_letters.add(letter)
             self.update_guessed_letters.emit(self.guessed_letters)
@@ -702,10 +830,15 @@ class GameController(QObject):
 
             if is_correct_guess:
                 self.correct_letters.add(letter)
-            else:
+            elif word:
                 self.guesses_left -= 1
                 self.update_guesses_left.emit(self.guesses_left)
 
+            if self.guess_pipeline:
+                self.guess_pipeline.submit(letter)
+            else:
+                self._pending_guesses.pop(letter, None)
+
             # Check if word is completed but don't end round automatically
             self._check_word_completion()
 
@@ -713,9 +846,83 @@ class GameController(QObject):
             self._check_round_status()
 
         except Exception as e:
-            print(f"[GameController] Error processing guess: {e}")
+            logger.warning("Error processing guess: %s", e)
             self.update_status.emit(f"Error: {e}")
 
+    def _on_guess_confirmed(self, letter, word_mask_info):
+        is_correct_guess = self._pending_guesses.pop(letter, None)
+        if is_correct_guess is None or not self.round_active:
+            return
+        trace = get_tracer().find("guess", letter)
+        if trace is not None:
+            trace.mark("confirmed")
+        if not word_mask_info or not word_mask_info.maskedWord:
+            logger.debug("No word mask after guess '%s', keeping local mask", letter)
+            return
+        if trace is not None:
+            with trace.activate():
+                self._reconcile_word_mask(word_mask_info)
+        else:
+            self._reconcile_word_mask(word_mask_info)
+        if letter in self.current_masked_word:
+            self.correct_letters.add(letter)
+            if not is_correct_guess:
+                # Predicted wrong because the word was not known yet; recolour the key
+                self.disable_letter_button.emit(letter, True)
+        self._check_word_completion()
+        self._check_round_status()
+
+    def _on_guess_rejected(self, letter, reason):
+        is_correct_guess = self._pending_guesses.pop(letter, None)
+        if is_correct_guess is None or not self.round_active:
+            return
+        logger.debug("Guess '%s' rejected by server: %s", letter, reason)
+        self.guessed_letters.discard(letter)
+        self.correct_letters.discard(letter)
+        if is_correct_guess:
+            self.current_masked_word = self.current_masked_word.replace(letter, '_')
+            self.update_word_display.emit(self.current_masked_word)
+        elif self.current_word:
+            self.guesses_left += 1
+            self.update_guesses_left.emit(self.guesses_left)
+        self.update_guessed_letters.emit(self.guessed_letters)
+        self.enable_letter_button.emit(letter)
+        self.update_status.emit(f"Guess '{letter}' rejected: {reason}")
+
+    def _on_guess_failed(self, letter, error):
+        self._pending_guesses.pop(letter, None)
+        if isinstance(error, service.GameNotFound):
+            logger.warning("Game session not found on server. Using local mode.")
+            if not self.current_masked_word:
+                self.timers.single_shot(1500, self.return_to_main_menu)
+            return
+        # The optimistic update stands; the next state poll reconciles it
+        logger.warning("Error submitting guess to server: %s", error)
+
+    def _close_guess_pipeline(self):
+        self._pending_guesses.clear()
+        if self.guess_pipeline:
+            self.guess_pipeline.close()
+            self.guess_pipeline = None
+
+    @traced("GameController._reconcile_word_mask")
+    def _reconcile_word_mask(self, word_mask_info):
+        """Adopt the server's mask and guesses, re-applying guesses the server has not answered yet."""
+        mask = list(self._process_word_mask(word_mask_info.maskedWord))
+        guesses_left = word_mask_info.guessesLeft
+        for pending_letter, pending_correct in self._pending_guesses.items():
+            if pending_correct:
+                for i, char in enumerate(self.current_word or ""):
+                    if char.upper() == pending_letter and i < len(mask):
+                        mask[i] = pending_letter
+            elif self.current_word:
+                guesses_left -= 1
+        self.current_masked_word = ''.join(mask)
+        self.guesses_left = guesses_left
+        self.update_word_display.emit(self.current_masked_word)
+        self.update_guesses_left.emit(self.guesses_left)
+
+    @traced("GameController._update_local_word_mask")
     def _update_local_word_mask(self, letter, positions):
         if not positions:
             return
@@ -733,72 +940,13 @@ class GameController(QObject):
         self.guessed_letters.add(letter)
 
         self.update_word_display.emit(self.current_masked_word)
-        print(f"[GameController] Updated word mask locally to: {self.current_masked_word}")
-
-    def _check_game_exists_on_server(self):
-        try:
-            word_mask_info = self.game_service.getWordMask(self.username)
-            return word_mask_info and word_mask_info.maskedWord
-        except service.GameNotFound:
-            return False
-        except Exception as e:
-            print(f"[GameController] Error checking if game exists: {e}")
-            return False
-
-    def _update_word_mask(self):
-        try:
-            word_mask_info = self._get_word_mask_with_retry()
+        logger.debug("Updated word mask locally to: %s", self.current_masked_word)
 
-            if not word_mask_info or not word_mask_info.maskedWord:
-                return self._handle_null_word_mask()
-
-            processed_mask = self._process_word_mask(word_mask_info.maskedWord)
-            word_mask_info.maskedWord = processed_mask
-
-            self.current_masked_word = word_mask_info.maskedWord
-            self.guesses_left = word_mask_info.guessesLeft
-            self.update_word_display.emit(self.current_masked_word)
-            self.update_guesses_left.emit(self.guesses_left)
-
-            return True
-        except service.GameNotFound:
-            print("[GameController] Game session not found on server. Using local mode.")
-            if not self.current_masked_word:
-                QTimer.singleShot(1500, self.return_to_main_menu)
-            return False
-        except Exception as e:
-            print(f"[GameController] Error updating word mask: {e}")
-            if not self.current_masked_word:
-                self.show_error_dialog.emit("Error", f"Error updating word mask: {e}")
-            return False
-
-    def _get_word_mask_with_retry(self):
-        word_mask_info = None
-        retry_count = 0
-        last_exception = None
-
-        while retry_count < 3 and not word_mask_info:
-            try:
-                word_mask_info = self.game_service.getWordMask(self.username)
-                return word_mask_info
-            except service.GameNotFound as e:
-                last_exception = e
-                retry_count += 1
-                print(
-                    f"[GameController] GameNotFound on attempt {retry_count} of 3. Session ID: {self.game_session_id}")
-                if retry_count < 3:
-                    time.sleep(0.5 * retry_count)
-            except Exception as e:
-                raise e
-
-        if last_exception:
-            raise last_exception
-        return None
-
-    def _handle_null_word_mask(self):
-        print("[GameController] Received null word mask from server")
-        self.show_error_dialog.emit("Error", "Could not retrieve word data from server. Would you like to try again?")
-        return False
+    def _apply_word_mask_info(self, word_mask_info):
+        self.current_masked_word = self._process_word_mask(word_mask_info.maskedWord)
+        self.guesses_left = word_mask_info.guessesLeft
+        self.update_word_display.emit(self.current_masked_word)
+        self.update_guesses_left.emit(self.guesses_left)
 
     def _process_word_mask(self, original_mask):
         player_specific_mask = []
@@ -825,49 +973,50 @@ class GameController(QObject):
             # Note: Word completion is now handled separately and doesn't automatically end the round
             # Players can continue guessing until they run out of guesses or time runs out
         except Exception as e:
-            print(f"[GameController] Error checking round status: {e}")
+            logger.warning("Error checking round status: %s", e)
             self.update_status.emit("Error checking game status. Returning to main menu...")
-            QTimer.singleShot(1500, self.return_to_main_menu)
+            self.timers.single_shot(1500, self.return_to_main_menu)
 
     def _handle_round_win(self):
         """Handle the logic when a player wins a round"""
         # Prevent multiple simultaneous round win handling
         if self.round_transition_in_progress:
-            print("[GameController] Round transition already in progress, skipping round win handling...")
+            logger.info("Round transition already in progress, skipping round win handling...")
             return
 
         # Prevent handling if round is already over
         if not self.round_active:
-            print("[GameController] Round already inactive, skipping round win handling...")
+            logger.info("Round already inactive, skipping round win handling...")
             return
 
+        self._stop_round_sync_polling()
+        self.round_active = False
+        self.call_scope.spawn(self._finish_round_win())
+
+    async def _finish_round_win(self):
         try:
-            self._stop_round_sync_polling()
-            word = self._get_actual_word()
-            self.round_active = False
+            word = await self._get_actual_word()
+            if self.game_over:
+                return
 
             # First update server with win using local tracking
             try:
                 self.mark_round_guessed(self.username)
-                print(f"[GameController] Marked round {self.current_round} guessed by {self.username}")
+                logger.info("Marked round %s guessed by %s", self.current_round, self.username)
             except Exception as e:
-                print(f"[GameController] Error marking round guessed: {e}")
+                logger.warning("Error marking round guessed: %s", e)
 
             # Then update local wins from server to ensure consistency
             self._update_all_player_scores_from_db()
 
             # Get current wins after update
             current_wins = self.player_rounds_won.get(self.username, 0)
-            print(f"[GameController] Current wins for {self.username}: {current_wins}")
+            logger.info("Current wins for %s: %s", self.username, current_wins)
 
             # Mark current word as used if possible
-            if hasattr(self.word_service, 'markWordAsUsed') and word:
-                try:
-                    self.word_service.markWordAsUsed(word, self.game_session_id)
-                except Exception as e:
-                    print(f"[GameController] Error marking word as used: {e}")
+            self._mark_word_used(word)
 
-            print(f"[GameController] Round won! Word was: {word}")
+            logger.info("Round won! Word was: %s", word)
             if word:
                 self.used_words.add(word)
 
@@ -882,42 +1031,55 @@ class GameController(QObject):
             else:
                 # Handle round increment
                 try:
-                    server_round = self.get_current_round_number()
+                    server_round = await self.get_current_round_number()
                     if server_round <= self.current_round:
                         self.increment_round()
                     else:
-                        print(f"[GameController] Server round {server_round} ahead of local {self.current_round}")
+                        logger.info("Server round %s ahead of local %s", server_round, self.current_round)
                         self.current_round = server_round
                 except Exception as e:
-                    print(f"[GameController] Error incrementing round: {e}")
+                    logger.warning("Error incrementing round: %s", e)
                     self.current_round += 1  # Fallback to local increment
+                if self.game_over:
+                    return
 
                 # Prepare for next round
                 self._prepare_word_for_next_round()
                 self._poll_for_next_round()
 
         except Exception as e:
-            print(f"[GameController] Error handling round win: {e}")
+            logger.warning("Error handling round win: %s", e)
             self.show_error_dialog.emit("Round Error", f"Error handling round win: {str(e)}")
 
+    def _mark_word_used(self, word):
+        """Tell the word service the round's word is used; sent in the background, failures are only logged."""
+        if word and hasattr(self.word_service, 'markWordAsUsed'):
+            self.call_scope.spawn(self._mark_word_used_async(word))
+
+    async def _mark_word_used_async(self, word):
+        try:
+            await get_async_corba().run("WordService", self.word_service.markWordAsUsed, word, self.game_session_id)
+        except Exception as e:
+            logger.warning("Error marking word as used: %s", e)
+
     def _start_game_state_sync(self):
         """Start periodic synchronization of game state with server"""
-        if hasattr(self, 'game_state_sync_timer'):
-            self.game_state_sync_timer.stop()
-
-        self.game_state_sync_timer = QTimer()
-        self.game_state_sync_timer.timeout.connect(self._sync_game_state)
-        self.game_state_sync_timer.start(3000)  # Sync every 3 seconds
-        print("[GameController] Started game state synchronization")
+        self.game_state_sync_timer = self._poll_loop('game_state_sync_timer', self._sync_game_state)
+        self.game_state_sync_timer.start()
+        logger.info("Started game state synchronization")
 
     def _sync_game_state(self):
         """Synchronize game state with server"""
         if self.game_over:
             return
+        self._spawn_poll('game_state_sync', self._sync_game_state_async)
 
+    async def _sync_game_state_async(self):
         try:
             # Sync round number
-            server_round = self.get_current_round_number()
+            await self.get_current_round_number()
+            if self.game_over:
+                return
 
             # Sync player wins
             self._update_all_player_scores_from_db()
@@ -926,38 +1088,41 @@ class GameController(QObject):
             winner = self._get_first_to_three_winner()
             if winner:
                 self._end_game_with_winner(winner)
+            elif self.game_state_sync_timer:
+                self.game_state_sync_timer.report_success()
 
         except Exception as e:
-            print(f"[GameController] Error in game state sync: {e}")
+            logger.warning("Error in game state sync: %s", e)
 
     def _handle_round_loss(self):
         """Handle the logic when a player loses a round"""
         # Prevent multiple simultaneous round loss handling
         if self.round_transition_in_progress:
-            print("[GameController] Round transition already in progress, skipping round loss handling...")
+            logger.info("Round transition already in progress, skipping round loss handling...")
             return
 
         # Prevent handling if round is already over
         if not self.round_active:
-            print("[GameController] Round already inactive, skipping round loss handling...")
+            logger.info("Round already inactive, skipping round loss handling...")
             return
 
+        self._stop_round_sync_polling()
+        self.round_active = False
+        self.call_scope.spawn(self._finish_round_loss())
+
+    async def _finish_round_loss(self):
         try:
-            if self._is_game_finished_and_show_popup_if_needed():
+            if await self._is_game_finished_and_show_popup_if_needed():
                 return
 
-            self._stop_round_sync_polling()
-            word = self._get_actual_word()
-            self.round_active = False
+            word = await self._get_actual_word()
+            if self.game_over:
+                return
 
             # Mark current word as used if possible
-            if hasattr(self.word_service, 'markWordAsUsed') and word:
-                try:
-                    self.word_service.markWordAsUsed(word, self.game_session_id)
-                except Exception as e:
-                    print(f"[GameController] Error marking word as used: {e}")
+            self._mark_word_used(word)
 
-            print(f"[GameController] Round lost! Word was: {word}")
+            logger.info("Round lost! Word was: %s", word)
             if word:
                 self.used_words.add(word)
 
@@ -975,21 +1140,23 @@ class GameController(QObject):
             else:
                 # Increment round regardless of whether someone guessed correctly
                 try:
-                    server_round = self.get_current_round_number()
+                    server_round = await self.get_current_round_number()
                     if server_round <= self.current_round:
                         self.increment_round()
                     else:
                         self.current_round = server_round
                 except Exception as e:
-                    print(f"[GameController] Error incrementing round: {e}")
+                    logger.warning("Error incrementing round: %s", e)
                     self.current_round += 1  # Fallback to local increment
+                if self.game_over:
+                    return
 
                 # Prepare for next round
                 self._prepare_word_for_next_round()
                 self._poll_for_next_round()
 
         except Exception as e:
-            print(f"[GameController] Error handling round loss: {e}")
+            logger.warning("Error handling round loss: %s", e)
             self.show_error_dialog.emit("Round Error", f"Error handling round loss: {str(e)}")
 
     def _reset_ui_for_new_round(self):
@@ -1002,6 +1169,7 @@ class GameController(QObject):
 
             # Reset guessed letters
             self.guessed_letters = set()
+            self._pending_guesses.clear()
             self.correct_letters = set()
             self.update_guessed_letters.emit(self.guessed_letters)
             if hasattr(self.view, 'update_guessed_letters_display'):
@@ -1016,41 +1184,38 @@ class GameController(QObject):
                 word_length = len(self.current_word) if hasattr(self, 'current_word') and self.current_word else 0
                 self.view.start_round(self.current_round, word_length)
 
-            # Reset timer
-            self.round_start_time = time.time()
+            # Hold the countdown at full time until the next round's clock starts
+            self.game_timer.stop()
+            self.round_clock.stop()
             self.update_time_left.emit(self.round_duration_seconds)
 
         except Exception as e:
-            print(f"[GameController] Error resetting UI: {e}")
+            logger.warning("Error resetting UI: %s", e)
 
-    def _get_actual_word(self):
+    async def _get_actual_word(self):
         try:
             if hasattr(self, 'current_word') and self.current_word:
-                print(f"[GameController] getActualWord - Using current word from model: {self.current_word}")
+                logger.debug("getActualWord - Using current word from model: %s", self.current_word)
                 return self.current_word
 
             if self.word_service:
                 try:
-                    game_id = self.game_session_id
-                    service_word = self.word_service.getRandomWord(game_id)
+                    service_word = await self._await_round_word()
                     if service_word:
-                        print(f"[GameController] getActualWord - Got from WordService: {service_word}")
+                        logger.debug("getActualWord - Got from WordService: %s", service_word)
                         return service_word
                 except Exception as e:
-                    print(f"[GameController] Error getting word from WordService: {e}")
+                    logger.warning("Error getting word from WordService: %s", e)
 
             if self.current_masked_word:
                 return self.current_masked_word + " (partially revealed)"
             return "Unknown word"
         except Exception as e:
-            print(f"[GameController] Error getting actual word: {e}")
+            logger.warning("Error getting actual word: %s", e)
             return "Unknown word"
 
     def _is_round_timed_out(self):
-        if not self.round_start_time:
-            return False
-        elapsed = time.time() - self.round_start_time
-        return elapsed >= self.round_duration_seconds
+        return self.round_clock.expired()
 
     def _get_first_to_three_winner(self):
         for player, wins in self.player_rounds_won.items():
@@ -1059,16 +1224,19 @@ class GameController(QObject):
         return None
 
     def _end_game_with_winner(self, winner_username):
-        print(f"[GameController] endGameWithWinner called with winner: {winner_username}")
+        logger.info("endGameWithWinner called with winner: %s", winner_username)
         try:
             self.game_over = True
             self.is_winner = (winner_username == self.username)
 
             # Stop all timers
             self._stop_all_timers()
+            self._unsubscribe_from_game_events()
+            self._close_guess_pipeline()
+            self.call_scope.cancel()
 
             # Since setGameFinished is not available in IDL, use local game end logic
-            print("[GameController] Using local game end logic (setGameFinished not available in IDL)")
+            logger.warning("Using local game end logic (setGameFinished not available in IDL)")
 
             # Update final scores
             self._update_all_player_scores_from_db()
@@ -1077,73 +1245,65 @@ class GameController(QObject):
             final_scores = self.get_all_player_wins()
             self.game_ended.emit(winner_username, final_scores, "Game completed", self.is_winner)
 
-            # Update leaderboard if available
-            try:
-                from .leaderboards_controller import LeaderboardsController
-                leaderboard_controller = LeaderboardsController(self.corba_services)
-                try:
-                    leaderboard_controller.update_player_wins(winner_username)
-                except AttributeError:
-                    print("[GameController] update_player_wins not available in LeaderboardsController")
-                self.leaderboard_win_updated = True
-            except Exception as e:
-                print(f"[GameController] Error updating leaderboard wins via LeaderboardsController: {e}")
-
         except Exception as e:
-            print(f"[GameController] Error in endGameWithWinner: {e}")
+            logger.warning("Error in endGameWithWinner: %s", e)
             self.show_error_dialog.emit("Game End Error", f"Error ending game: {str(e)}")
 
-    def _is_game_finished_and_show_popup_if_needed(self):
+    async def _is_game_finished_and_show_popup_if_needed(self):
         try:
             game_manager_service = self.corba_services.game_manager_service
             if not game_manager_service:
                 return False
 
-            sessions = game_manager_service.listActiveGameSessions()
-            for session in sessions:
-                if session.gameId == self.game_session_id and session.sessionStatus == "FINISHED":
-                    if not self.is_winner:
-                        winner_username = None
-                        try:
-                            # Since getWinnerUsername is not available in IDL, use local winner detection
-                            self._update_all_player_scores_from_db()
-                            winner_username = self._get_first_to_three_winner()
-                            print(f"[GameController] Winner from local detection in popup check: {winner_username}")
-                        except Exception as e:
-                            print(f"[GameController] Error in winner detection: {e}")
-
-                        if not winner_username:
-                            winner_username = "Unknown Player"
-                            print("[GameController] Using 'Unknown Player' in popup check")
-
-                        self._end_game_with_winner(winner_username)
-                        return True
+            session = await self._await_current_session()
+            if self.game_over:
+                return True
+            if session and session.sessionStatus == "FINISHED":
+                if not self.is_winner:
+                    winner_username = None
+                    try:
+                        # Since getWinnerUsername is not available in IDL, use local winner detection
+                        self._update_all_player_scores_from_db()
+                        winner_username = self._get_first_to_three_winner()
+                        logger.debug("Winner from local detection in popup check: %s", winner_username)
+                    except Exception as e:
+                        logger.warning("Error in winner detection: %s", e)
+
+                    if not winner_username:
+                        winner_username = "Unknown Player"
+                        logger.debug("Using 'Unknown Player' in popup check")
+
+                    self._end_game_with_winner(winner_username)
+                    return True
         except Exception as e:
-            print(f"[GameController] Error in isGameFinishedAndShowPopupIfNeeded: {e}")
+            logger.warning("Error in isGameFinishedAndShowPopupIfNeeded: %s", e)
         return False
 
     def _start_game_finished_sync_polling(self):
-        if self.game_finished_sync_timer:
-            self.game_finished_sync_timer.stop()
-        self.game_finished_sync_timer = QTimer()
-        self.game_finished_sync_timer.timeout.connect(self._poll_game_finished)
-        self.game_finished_sync_timer.start(1000)
-        print("[GameController] Started game-finished status polling.")
+        self.game_finished_sync_timer = self._poll_loop('game_finished_sync_timer', self._poll_game_finished)
+        self.game_finished_sync_timer.start()
+        logger.info("Started game-finished status polling.")
 
     def _stop_game_finished_sync_polling(self):
         if self.game_finished_sync_timer:
             self.game_finished_sync_timer.stop()
             self.game_finished_sync_timer = None
-            print("[GameController] Stopped game-finished status polling.")
+            logger.info("Stopped game-finished status polling.")
 
     def _poll_game_finished(self):
-        if self.game_over:
+        if self.game_over or not self.game_service:
             return
+        self._spawn_poll('game_finished', self._poll_game_finished_async)
+
+    async def _poll_game_finished_async(self):
         try:
-            if not self.game_service:
+            snapshot = await self._await_game_state_snapshot()
+            if self.game_over:
                 return
-
-            status = self.game_service.getGameStatus(self.username)
+            snapshot.raise_for_status()
+            if self.game_finished_sync_timer:
+                self.game_finished_sync_timer.report_success()
+            status = snapshot.status
             if status == "WON":
                 if not self.is_winner:
                     self.is_winner = True
@@ -1156,13 +1316,13 @@ class GameController(QObject):
                     # Since getWinnerUsername is not available in IDL, use local winner detection
                     self._update_all_player_scores_from_db()
                     winner = self._get_first_to_three_winner()
-                    print(f"[GameController] Winner from local detection: {winner}")
+                    logger.debug("Winner from local detection: %s", winner)
                 except Exception as e:
-                    print(f"[GameController] Error in winner detection: {e}")
+                    logger.warning("Error in winner detection: %s", e)
 
                 if not winner:
                     winner = "Unknown Player"
-                    print("[GameController] Using 'Unknown Player' as winner fallback")
+                    logger.debug("Using 'Unknown Player' as winner fallback")
 
                 self._end_game_with_winner(winner)
 
@@ -1172,148 +1332,151 @@ class GameController(QObject):
             try:
                 fallback_winner = self._get_first_to_three_winner()
             except Exception as e:
-                print(f"[GameController] Error getting fallback winner: {e}")
+                logger.warning("Error getting fallback winner: %s", e)
 
             if not fallback_winner:
                 fallback_winner = "Unknown Player"
 
             self._end_game_with_winner(fallback_winner)
+        except RETRYABLE_CORBA_ERRORS as e:
+            logger.warning("Game-finished poll failed, backing off: %s", e)
+            if self.game_finished_sync_timer:
+                self.game_finished_sync_timer.report_error()
         except Exception as e:
-            print(f"[GameController] Error in game-finished polling: {e}")
+            logger.warning("Error in game-finished polling: %s", e)
 
     def _poll_for_next_round(self):
         # Prevent multiple simultaneous next round polling
         if hasattr(self, '_poll_timer') and self._poll_timer and self._poll_timer.isActive():
-            print("[GameController] Next round polling already active, skipping...")
+            logger.debug("Next round polling already active, skipping...")
             return
 
         completed_round = self.current_round - 1
-        print(f"[GameController] Started polling for completion of round {completed_round}")
+        logger.debug("Started polling for completion of round %s", completed_round)
+        self._spawn_poll('next_round_start', lambda: self._poll_for_next_round_async(completed_round))
 
+    async def _poll_for_next_round_async(self, completed_round):
         try:
             # Use getRoundStartTime to check if next round exists
             try:
-                next_round_start_time = self.corba_services.game_service.getRoundStartTime(
-                    self.game_session_id,
-                    self.current_round
-                )
-                print(f"[GameController] Polling for next round. Current round: {self.current_round}")
+                next_round_start_time = await self._await_round_start_time(self.current_round)
+                logger.debug("Polling for next round. Current round: %s", self.current_round)
 
                 if next_round_start_time:
-                    print(f"[GameController] Next round {self.current_round} exists on server")
+                    logger.debug("Next round %s exists on server", self.current_round)
                 else:
-                    print(f"[GameController] Next round {self.current_round} not yet available on server")
+                    logger.debug("Next round %s not yet available on server", self.current_round)
 
             except Exception as e:
-                print(f"[GameController] Error checking round availability: {e}")
+                logger.warning("Error checking round availability: %s", e)
                 # Fallback to local round increment
                 self.current_round += 1
-                self._show_round_transition(False, self._get_actual_word(), self._initialize_round)
+                self._show_round_transition(False, await self._get_actual_word(), self._initialize_round)
                 return
 
         except Exception as e:
-            print(f"[GameController] Error checking server round number: {e}")
+            logger.warning("Error checking server round number: %s", e)
             self.current_round += 1
-            self._show_round_transition(False, self._get_actual_word(), self._initialize_round)
+            self._show_round_transition(False, await self._get_actual_word(), self._initialize_round)
+            return
+        if self.game_over:
             return
 
-        fallback_timer = QTimer()
-        fallback_timer.setSingleShot(True)
-        fallback_timer.timeout.connect(lambda: self._handle_fallback_timer())
+        fallback_timer = self.fallback_timer = self.timers.timer(
+            'fallback_timer', self._handle_fallback_timer, single_shot=True)
         fallback_timer.start(15000)
 
-        self._poll_timer = QTimer()
-        self._poll_timer.timeout.connect(lambda: self._handle_poll_timer(completed_round, fallback_timer))
-        self._poll_timer.start(500)
+        self._poll_timer = self._poll_loop(
+            '_poll_timer', lambda: self._spawn_poll(
+                'next_round', lambda: self._handle_poll_timer(completed_round, fallback_timer)))
+        # The round ends on the server about now
+        self._poll_timer.expect_at(time.time(), self.FAST_POLL_MS)
+        self._poll_timer.start()
 
     def _handle_fallback_timer(self):
         if self.game_over:
             return
-        print("[GameController] Fallback timer triggered - forcing round transition")
+        logger.debug("Fallback timer triggered - forcing round transition")
+        self._spawn_poll('fallback', self._handle_fallback_timer_async)
+
+    async def _handle_fallback_timer_async(self):
         try:
             # Use getRoundStartTime to check if current round exists
-            round_start_time = self.corba_services.game_service.getRoundStartTime(
-                self.game_session_id,
-                self.current_round
-            )
+            round_number = self.current_round
+            round_start_time = await self._await_round_start_time(round_number)
             if not round_start_time:
                 # Try next round
-                next_round_start_time = self.corba_services.game_service.getRoundStartTime(
-                    self.game_session_id,
-                    self.current_round + 1
-                )
-                if next_round_start_time:
+                next_round_start_time = await self._await_round_start_time(round_number + 1)
+                if next_round_start_time and self.current_round == round_number:
                     self.current_round += 1
-                    print(f"[GameController] Fallback sync: Updated client round to {self.current_round}")
+                    logger.debug("Fallback sync: Updated client round to %s", self.current_round)
         except Exception as e:
-            print(f"[GameController] Error in fallback sync: {e}")
+            logger.warning("Error in fallback sync: %s", e)
 
-        if self._is_game_finished_and_show_popup_if_needed():
+        if await self._is_game_finished_and_show_popup_if_needed():
             return
-        self._show_round_transition(False, self._get_actual_word(), self._initialize_round)
+        self._show_round_transition(False, await self._get_actual_word(), self._initialize_round)
 
-    def _handle_poll_timer(self, completed_round, fallback_timer):
+    async def _handle_poll_timer(self, completed_round, fallback_timer):
         if self.game_over:
             self._poll_timer.stop()
             fallback_timer.stop()
             return
         try:
             # Use is_round_complete method which uses available IDL methods
-            round_complete = self.is_round_complete(completed_round)
+            round_complete = await self.is_round_complete(completed_round)
 
             # Use getRoundStartTime to check current round availability
-            current_round_start_time = self.corba_services.game_service.getRoundStartTime(
-                self.game_session_id,
-                self.current_round
-            )
+            current_round_start_time = await self._await_round_start_time(self.current_round)
+            if self.game_over or not self._poll_timer.isActive():
+                return
 
-            print(f"[GameController] Polling - Round {completed_round} complete: {round_complete}, "
-                  f"Current round available: {bool(current_round_start_time)}, Client round: {self.current_round}")
+            logger.debug("Polling - Round %s complete: %s, Current round available: %s, Client round: %s",
+                         completed_round, round_complete, bool(current_round_start_time), self.current_round)
+            self._poll_timer.report_success()
 
-            if self._is_game_finished_and_show_popup_if_needed():
+            if await self._is_game_finished_and_show_popup_if_needed():
                 self._poll_timer.stop()
                 fallback_timer.stop()
                 return
 
-            if round_complete or not current_round_start_time:
+            if (round_complete or not current_round_start_time) and self._poll_timer.isActive():
                 self._poll_timer.stop()
                 fallback_timer.stop()
 
                 # Check if next round exists
-                next_round_start_time = self.corba_services.game_service.getRoundStartTime(
-                    self.game_session_id,
-                    self.current_round + 1
-                )
+                next_round_start_time = await self._await_round_start_time(self.current_round + 1)
                 if next_round_start_time:
                     self.current_round += 1
-                    print(f"[GameController] Next round {self.current_round} available, advancing")
+                    logger.debug("Next round %s available, advancing", self.current_round)
 
-                print(f"[GameController] Round {completed_round} complete, showing intermission")
+                logger.debug("Round %s complete, showing intermission", completed_round)
 
                 player_won = '_' not in self.current_masked_word
                 self._prepare_word_for_next_round()
-                self._show_round_transition(player_won, self._get_actual_word(), self._initialize_round)
+                self._show_round_transition(player_won, await self._get_actual_word(), self._initialize_round)
 
         except Exception as e:
-            print(f"[GameController] Error polling for round completion: {e}")
+            logger.warning("Error polling for round completion: %s", e)
 
     def _prepare_word_for_next_round(self):
         game_id = self.game_session_id
         if not self.word_service or not game_id:
-            print("[GameController] Cannot prepare word for next round: " +
-                  ("WordService is null" if not self.word_service else "Invalid game ID"))
+            logger.warning("Cannot prepare word for next round: %s",
+                           "WordService is null" if not self.word_service else "Invalid game ID")
             return None
 
         try:
-            time.sleep(0.1)
+            # The next round's word is fetched again instead of reusing a cached guess at it
+            self.word_cache.invalidate(game_id, self.current_round)
             self.needs_new_word_for_next_round = True
-            print("[GameController] Marked model to get new word at round start")
+            logger.info("Marked model to get new word at round start")
             return "WORD_WILL_BE_FETCHED_AT_ROUND_START"
         except Exception as e:
-            print(f"[GameController] Error preparing word for next round: {e}")
+            logger.warning("Error preparing word for next round: %s", e)
             return None
 
-    def _initialize_round(self):
+    async def _initialize_round(self):
         """Initialize a new round with proper UI reset"""
         try:
             # Reset keyboard and UI state
@@ -1323,15 +1486,23 @@ class GameController(QObject):
 
             # Reset game state for new round
             self.guessed_letters = set()
+            self._pending_guesses.clear()
             self.correct_letters = set()
             self.guesses_left = self.MAX_GUESSES_PER_ROUND
 
             # Update round number from server or use local
-            server_round = self.get_current_round_number()
+            server_round = await self.get_current_round_number()
             if server_round > self.current_round:
-                print(f"[GameController] Syncing client round {self.current_round} -> {server_round}")
+                logger.info("Syncing client round %s -> %s", self.current_round, server_round)
                 self.current_round = server_round
 
+            if self.needs_new_word_for_next_round:
+                try:
+                    if await self._await_round_word():
+                        self.needs_new_word_for_next_round = False
+                except Exception as e:
+                    logger.warning("Could not fetch word for round %s: %s", self.current_round, e)
+
             # Update UI
             self.update_guesses_left.emit(self.guesses_left)
             self.update_guessed_letters.emit(self.guessed_letters)
@@ -1340,7 +1511,7 @@ class GameController(QObject):
 
             return True
         except Exception as e:
-            print(f"[GameController] Error initializing round: {e}")
+            logger.warning("Error initializing round: %s", e)
             return False
 
     def _show_round_transition(self, won, actual_word, on_transition_complete):
@@ -1351,11 +1522,11 @@ class GameController(QObject):
 
         # Prevent multiple simultaneous round transitions
         if self.round_transition_in_progress:
-            print("[GameController] Round transition already in progress, skipping...")
+            logger.info("Round transition already in progress, skipping...")
             return
 
         self.round_transition_in_progress = True
-        print(f"[GameController] Starting round transition for round {self.current_round}")
+        logger.info("Starting round transition for round %s", self.current_round)
 
         # Reset UI elements during transition
         self.disable_keyboard.emit()
@@ -1366,37 +1537,43 @@ class GameController(QObject):
         self.show_round_results.emit(won, actual_word)
 
         # Prepare for next round after delay
-        def do_transition():
-            # --- ADDED: Reset round state for new round ---
-            # Confirm with server if next round exists
-            next_round_start_time = self.corba_services.game_service.getRoundStartTime(
-                self.game_session_id, self.current_round
-            )
-            if next_round_start_time:
-                print(
-                    f"[GameController] Confirmed new round {self.current_round} exists on server. Resetting round state.")
-                self.guesses_left = self.MAX_GUESSES_PER_ROUND
-                self.guessed_letters = set()
-                self.correct_letters = set()
-                self.update_guesses_left.emit(self.guesses_left)
-                self.update_guessed_letters.emit(self.guessed_letters)
-                if hasattr(self.view, 'start_round'):
-                    word_length = len(self.current_word) if hasattr(self, 'current_word') and self.current_word else 0
-                    self.view.start_round(self.current_round, word_length)
-            else:
-                print(
-                    f"[GameController] Next round {self.current_round} not yet available on server. Not resetting round state.")
-            # --- END ADDED ---
-            self._complete_round_transition(on_transition_complete)
+        self.timers.single_shot(self.ROUND_TRANSITION_SECONDS * 1000,
+                                lambda: self.call_scope.spawn(self._do_round_transition(on_transition_complete)))
 
-        QTimer.singleShot(self.ROUND_TRANSITION_SECONDS * 1000, do_transition)
+    async def _do_round_transition(self, on_transition_complete):
+        # --- ADDED: Reset round state for new round ---
+        # Confirm with server if next round exists
+        try:
+            next_round_start_time = await self._await_round_start_time(self.current_round)
+        except Exception as e:
+            logger.warning("Error checking round %s on server: %s", self.current_round, e)
+            next_round_start_time = ""
+        if self.game_over:
+            return
+        if next_round_start_time:
+            logger.info("Confirmed new round %s exists on server. Resetting round state.", self.current_round)
+            self.guesses_left = self.MAX_GUESSES_PER_ROUND
+            self.guessed_letters = set()
+            self._pending_guesses.clear()
+            self.correct_letters = set()
+            self.update_guesses_left.emit(self.guesses_left)
+            self.update_guessed_letters.emit(self.guessed_letters)
+            if hasattr(self.view, 'start_round'):
+                word_length = len(self.current_word) if hasattr(self, 'current_word') and self.current_word else 0
+                self.view.start_round(self.current_round, word_length)
+        else:
+            logger.info("Next round %s not yet available on server. Not resetting round state.",
+                        self.current_round)
+        # --- END ADDED ---
+        await self._complete_round_transition(on_transition_complete)
 
-    def _complete_round_transition(self, on_transition_complete):
+    async def _complete_round_transition(self, on_transition_complete):
         """Complete the round transition with proper cleanup"""
         try:
-            # Reset timer and UI
-            self.round_start_time = time.time()
-            self.update_time_left.emit(self.round_duration_seconds)
+            # Restart the countdown from the new round's server start time
+            self._start_round_clock()
+            self.update_time_left.emit(self.round_clock.remaining_display())
+            self.game_timer.start(self.round_clock.ms_to_next_tick())
 
             # Clear overlay
             if hasattr(self.view, 'hide_overlay'):
@@ -1404,53 +1581,44 @@ class GameController(QObject):
 
             # Execute completion callback
             if on_transition_complete:
-                on_transition_complete()
+                await on_transition_complete()
 
             # Start the new round gameplay after initialization
             self._start_round_polling()
 
             # Reset transition flag
             self.round_transition_in_progress = False
-            print(f"[GameController] Round transition completed for round {self.current_round}")
+            logger.info("Round transition completed for round %s", self.current_round)
+            logger.info("Word cache: %s", self.word_cache.stats())
 
         except Exception as e:
-            print(f"[GameController] Error completing round transition: {e}")
+            logger.warning("Error completing round transition: %s", e)
             self.round_transition_in_progress = False
 
     def _stop_round_sync_polling(self):
         if hasattr(self, 'round_sync_timer') and self.round_sync_timer:
             self.round_sync_timer.stop()
             self.round_sync_timer = None
-            print("[GameController] Stopped round sync polling.")
+            logger.info("Stopped round sync polling.")
 
     def return_to_main_menu(self):
-        print("[GameController] Navigating to main menu...")
+        logger.info("Navigating to main menu...")
         self._stop_all_timers()
+        self._unsubscribe_from_game_events()
+        self._close_guess_pipeline()
+        self.call_scope.cancel()
         self.navigate_to_main_menu.emit()
 
     def _stop_all_timers(self):
-        timers = [
-            getattr(self, '_round_poll_timer', None),
-            getattr(self, 'lobby_poll_timer', None),
-            getattr(self, 'init_retry_timer', None),
-            getattr(self, 'state_poll_timer', None),
-            getattr(self, 'game_timer', None),
-            getattr(self, 'round_sync_timer', None),
-            getattr(self, 'game_finished_sync_timer', None),
-            getattr(self, '_poll_timer', None)
-        ]
-
-        for timer in timers:
-            if timer and hasattr(timer, 'stop'):
-                try:
-                    timer.stop()
-                except Exception as e:
-                    print(f"[GameController] Error stopping timer: {e}")
+        """Game teardown: stop and release every timer and poll loop this controller created."""
+        self.timers.close()
+        check_leaks("game teardown")
+        logger.debug("Poll scheduler: %s", get_poll_scheduler().stats())
 
     def _check_word_completion(self):
         """Check if the word is completely revealed and handle accordingly"""
         if '_' not in self.current_masked_word:
-            print("[GameController] Word completely revealed!")
+            logger.debug("Word completely revealed!")
             self.update_status.emit("Word revealed! You can continue guessing or wait for the round to end.")
             # Don't automatically end the round - let it continue until time runs out or guesses exhausted
             return True
@@ -1462,9 +1630,125 @@ class GameController(QObject):
             return
 
         if '_' not in self.current_masked_word:
-            print("[GameController] Player ending round early - word completed")
+            logger.info("Player ending round early - word completed")
             self.update_status.emit("Ending round early - word completed!")
             self._handle_round_win()
         else:
-            print("[GameController] Cannot end round early - word not completed")
-            self.update_status.emit("Cannot end round early - word not yet completed!")
\ No newline at end of file
+            logger.warning("Cannot end round early - word not completed")
+            self.update_status.emit("Cannot end round early - word not yet completed!")
+
+    def _subscribe_to_game_events(self):
+        """Register for server-push events; without them every loop keeps polling at full rate."""
+        event_service = getattr(self.corba_services, 'game_event_service', None)
+        if not event_service:
+            logger.warning("GameEventService not available, using polling only")
+            return
+
+        self.event_subscription = GameEventSubscription(event_service, self.game_session_id, self.username)
+        if not self.event_subscription.subscribe():
+            return
+
+        bridge = self.event_subscription.bridge
+        for signal in (bridge.round_started, bridge.word_mask_changed, bridge.score_changed,
+                       bridge.game_finished, bridge.heartbeat):
+            signal.connect(self._mark_event_channel_alive)
+        bridge.round_started.connect(self._on_round_started_event)
+        bridge.word_mask_changed.connect(self._on_word_mask_event)
+        bridge.score_changed.connect(self._on_score_event)
+        bridge.game_finished.connect(self._on_game_finished_event)
+
+        self._event_channel_healthy = True
+        self.event_watchdog_timer.start(self.EVENT_CHANNEL_TIMEOUT_SECONDS * 1000 // 2)
+        self._apply_poll_intervals()
+
+    def _unsubscribe_from_game_events(self):
+        self.event_watchdog_timer.stop()
+        if self.event_subscription:
+            self.event_subscription.unsubscribe()
+            self.event_subscription = None
+        self._event_channel_healthy = False
+
+    def _push_events_active(self):
+        return bool(self.event_subscription and self.event_subscription.active and self._event_channel_healthy)
+
+    def _poll_loop(self, timer_name, callback):
+        """Create this controller's scheduler loop for timer_name, at its base interval and current floor."""
+        loop = self.timers.poll_loop(timer_name, callback, self.POLL_TIMER_BASE_MS[timer_name])
+        loop.set_floor(self._poll_floor_ms())
+        return loop
+
+    def _poll_floor_ms(self):
+        return self.FALLBACK_POLL_INTERVAL_MS if self._push_events_active() else 0
+
+    def _apply_poll_intervals(self):
+        """Retune every poll loop after the push channel goes up or down."""
+        for timer_name in self.POLL_TIMER_BASE_MS:
+            loop = getattr(self, timer_name, None)
+            if loop:
+                loop.set_floor(self._poll_floor_ms())
+
+    def _mark_event_channel_alive(self, *args):
+        if self.event_subscription and self.event_subscription.active and not self._event_channel_healthy:
+            logger.debug("Push events resumed, slowing polling to fallback rate")
+            self._event_channel_healthy = True
+            self._apply_poll_intervals()
+
+    def _check_event_channel(self):
+        if not self._push_events_active():
+            return
+        idle = self.event_subscription.bridge.seconds_since_last_event()
+        if idle is not None and idle > self.EVENT_CHANNEL_TIMEOUT_SECONDS:
+            logger.debug("No push events for %.1fs, falling back to full-rate polling", idle)
+            self._event_channel_healthy = False
+            self._apply_poll_intervals()
+
+    def _on_round_started_event(self, game_id, round_number, start_time):
+        if game_id != self.game_session_id or self.game_over:
+            return
+        logger.info("Push: round %s started at %s", round_number, start_time)
+        if round_number > self.current_round and not self.round_transition_in_progress:
+            self.current_round = round_number
+
+        # Check now instead of waiting for the next (slow) word mask poll
+        round_poll_timer = getattr(self, '_round_poll_timer', None)
+        if round_poll_timer and round_poll_timer.isActive():
+            self._poll_word_mask()
+
+    def _on_word_mask_event(self, game_id, username, word_mask_info):
+        if game_id != self.game_session_id or username != self.username or self.game_over:
+            return
+        if not word_mask_info.maskedWord:
+            return
+        self.game_state.apply_word_mask(word_mask_info)
+
+        if not self.round_active:
+            round_poll_timer = getattr(self, '_round_poll_timer', None)
+            if (round_poll_timer and round_poll_timer.isActive()
+                    and word_mask_info.maskedWord != self.current_masked_word):
+                logger.debug("Push: word mask arrived, starting gameplay")
+                round_poll_timer.stop()
+                self._start_gameplay(word_mask_info)
+            return
+
+        # Guesses the server has not answered yet stay applied on top of the pushed mask
+        self._reconcile_word_mask(word_mask_info)
+        self._check_word_completion()
+        self._check_round_status()
+
+    def _on_score_event(self, game_id, username, rounds_won):
+        if game_id != self.game_session_id or self.game_over:
+            return
+        if rounds_won > self.player_rounds_won.get(username, 0):
+            self.player_rounds_won[username] = rounds_won
+            if hasattr(self.view, 'update_score'):
+                self.view.update_score(username, rounds_won)
+
+        winner = self._get_first_to_three_winner()
+        if winner:
+            self._end_game_with_winner(winner)
+
+    def _on_game_finished_event(self, game_id, winner_username):
+        if game_id != self.game_session_id or self.game_over:
+            return
+        logger.info("Push: game finished, winner %s", winner_username)
+        self._end_game_with_winner(winner_username or self._get_first_to_three_winner() or "Unknown Player")
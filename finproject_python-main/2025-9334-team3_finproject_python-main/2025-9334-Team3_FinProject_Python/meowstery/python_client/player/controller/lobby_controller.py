@@ -1,34 +1,50 @@
+import logging
 import CORBA
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtWidgets import QApplication
 import random
-import traceback
 import time
 
 from meowstery.python_client.player.controller.game_controller import GameController
+from meowstery.python_client.player.model.async_corba import CallScope, get_async_corba
+from meowstery.python_client.player.model.timer_registry import TimerRegistry, check_leaks
+from meowstery.python_client.player.model.service_registry import RETRYABLE_CORBA_ERRORS
 from meowstery.python_client.player.model.user_model import LobbyModel
-from meowstery.python_client.player.view.game_view import GameView
-import service
+from meowstery.python_client.player.view.screens import get_screen_manager
+from meowstery.python_client.player.view.images import get_image_assets
+
+
+logger = logging.getLogger(__name__)
 
 
 class LobbyController(QObject):
     show_main_menu = pyqtSignal()
     game_started = pyqtSignal()  # signal to notify transition to game controller
+    game_controller_created = pyqtSignal(object)  # GameController, before start_game()
 
     POLL_INTERVAL_MS = 1000  # Poll every 1 second to match Java client
+    IDLE_POLL_INTERVAL_MS = 5000  # Alone in the lobby: nothing can start until someone joins
+    FAST_POLL_MS = 500  # Around the moment the wait time runs out
+    WAIT_TIME_REFRESH_SECONDS = 10  # How often the configured wait time is re-read
     MAX_RETRY_ATTEMPTS = 5
     MATCHMAKING_TIMEOUT_MS = 30000  # 30 seconds default timeout
 
     def _reset_transition_flag(self):
         self._game_transitioned = False
 
-    def __init__(self, model: 'LobbyModel', view, corba_services):
+    def __init__(self, model: 'LobbyModel', view, corba_services, game_view_factory=None):
         super().__init__()
         self.model = model
         self.view = view
         self.corba = corba_services
+        # players -> game view; headless drivers return None to run the game without a window.
+        # The default reuses one GameView across games, built while matchmaking runs.
+        self.game_view_factory = game_view_factory or get_screen_manager().factory("game")
 
         self.game_controller = None
+        # Remote calls are awaited on the CORBA pool; the scope is cancelled when the lobby closes
+        self.scope = CallScope("lobby")
+        self._fetch_task = None
         self._game_transitioned = False
         # Initialize the attribute here
         self._game_transition_started = False
@@ -39,13 +55,15 @@ class LobbyController(QObject):
         if hasattr(self.view, "restart_button") and self.view.restart_button is not None:
             self.view.restart_button.clicked.connect(self.on_restart)
 
-        # Timers
-        self.matchmaking_timer = QTimer()
-        self.matchmaking_timer.setSingleShot(True)
-        self.matchmaking_timer.timeout.connect(self.on_matchmaking_timeout)
+        # Timers; all created through the registry so on_main_menu can tear them down together
+        self.timers = TimerRegistry("LobbyController")
+        self.matchmaking_timer = self.timers.timer('matchmaking_timer', self.on_matchmaking_timeout,
+                                                   single_shot=True)
 
-        self.poll_timer = QTimer()
-        self.poll_timer.timeout.connect(self.fetch_lobby_status)
+        # Runs on the shared poll scheduler: slow while alone, fast near the start, backing off on errors
+        self.poll_timer = self.timers.poll_loop('status', self.fetch_lobby_status, self.POLL_INTERVAL_MS)
+        self._poll_errors = 0
+        self._wait_time_fetched_at = 0.0
 
         # Connect model signals to view update methods
         self.model.status_changed.connect(self.view.update_status)
@@ -71,112 +89,87 @@ class LobbyController(QObject):
             self.corba.game_manager_service._non_existent()
             return True
         except Exception as e:
-            print(f"[LobbyController] CORBA connection check failed: {e}")
+            logger.warning("CORBA connection check failed: %s", e)
             return False
 
-    def reset_corba_services(self):
-        """More robust CORBA service reset with proper error handling"""
+    async def reset_corba_services(self):
+        """Drop cached service references and resolve them again through the shared registry, off the GUI thread"""
         try:
-            print("[LobbyController] Performing CORBA reset...")
-            if hasattr(self.corba, '_orb'):
-                try:
-                    self.corba._orb.destroy()
-                except:
-                    pass
-                self.corba._orb = None
-
-            import CORBA
-            args = ["-ORBgiopMaxMsgSize", "209715200"]
-            self.corba._orb = CORBA.ORB_init(args, CORBA.ORB_ID)
-
-            from meowstery.python_client.player.model.user_model import resolve_service
-            services = [
-                ("AdminService", "admin_service", service.AdminService),
-                ("LoginService", "login_service", service.LoginService),
-                ("LeaderboardService", "leaderboard_service", service.LeaderboardService),
-                ("GameManagerService", "game_manager_service", service.GameManagerService),
-                ("GameService", "game_service", service.GameService),
-                ("WordService", "word_service", service.WordService)
-            ]
-
-            for service_name, attr, service_type in services:
-                try:
-                    setattr(self.corba, attr, resolve_service(service_name, service_type))
-                except Exception as e:
-                    print(f"[LobbyController] Failed to resolve {service_name}: {e}")
-                    try:
-                        setattr(self.corba, attr, resolve_service(service_name, service_type, timeout=5000))
-                    except Exception as e2:
-                        print(f"[LobbyController] Critical: Could not reconnect to {service_name}")
-                        raise ConnectionError(f"Could not reconnect to {service_name}")
-            print("[LobbyController] CORBA reset completed.")
+            logger.info("Performing CORBA reset...")
+            await get_async_corba().run("ServiceRegistry", self.corba.reset_services)
+            logger.info("CORBA reset completed.")
             return True
         except Exception as e:
-            print(f"[LobbyController] CORBA reset failed: {e}")
+            logger.warning("CORBA reset failed: %s", e)
             return False
 
     def start_waiting(self):
-        print("[LobbyController] Starting matchmaking...")
+        logger.info("Starting matchmaking...")
         self._reset_transition_flag()
         self.lobby_start_time = time.time()  # Track when the lobby started
 
-        # Start polling for lobby status
-        self.poll_timer = QTimer()
-        self.poll_timer.timeout.connect(self.fetch_lobby_status)
-        self.poll_timer.start(1000)
+        # Start polling for lobby status (ticks are skipped until the session is joined)
+        self.poll_timer.expect_at(None)
+        self.poll_timer.start(self.POLL_INTERVAL_MS)
 
-        self._initialize_session()
+        self.scope.spawn(self._initialize_session())
 
-    def _initialize_session(self):
+    async def _initialize_session(self):
+        async_corba = get_async_corba()
         try:
-            print("[LobbyController] Initializing game session...")
-            session_id = self.corba.game_manager_service.joinOrCreateGameSession(self.model.username)
+            logger.info("Initializing game session...")
+            game_manager = async_corba.service(self.corba.game_manager_service, "GameManagerService")
+            session_id = await game_manager.joinOrCreateGameSession(self.model.username)
             if not session_id:
                 raise Exception("Failed to create or join game session")
             self.model.game_session_id = session_id
-            print(f"[LobbyController] Session ID: {self.model.game_session_id}")
+            logger.info("Session ID: %s", self.model.game_session_id)
 
-            self.wait_time_in_seconds = self.corba.admin_service.getWaitTime()
-            self.round_time_in_seconds = self.corba.admin_service.getRoundTime()
-            print(f"[LobbyController] Server config - Wait time: {self.wait_time_in_seconds}s, Round time: {self.round_time_in_seconds}s")
+            admin = async_corba.service(self.corba.admin_service, "AdminService")
+            self.wait_time_in_seconds = await admin.getWaitTime()
+            self.round_time_in_seconds = await admin.getRoundTime()
+            logger.info("Server config - Wait time: %ss, Round time: %ss",
+                        self.wait_time_in_seconds, self.round_time_in_seconds)
 
-            self.lobby_poll_timer = QTimer()
-            self.lobby_poll_timer.timeout.connect(self.fetch_lobby_status)
-            self.lobby_poll_timer.start(1000)
-            print("[LobbyController] Started lobby status polling")
+            self.poll_timer.start(self.POLL_INTERVAL_MS)
+            logger.info("Started lobby status polling")
             self.model.set_message(f"Waiting for players... (Timeout in {self.wait_time_in_seconds}s)")
 
         except Exception as e:
-            print(f"[LobbyController] Error initializing session: {e}")
-            traceback.print_exc()
+            logger.warning("Error initializing session: %s", e, exc_info=True)
             self.model.set_message(f"Error initializing game session: {e}")
             self.on_main_menu()
 
-    def _handle_matchmaking_timeout(self):
-        print("[LobbyController] Matchmaking timeout reached")
+    async def _await_session(self):
+        return await get_async_corba().run(
+            "GameManagerService", self.corba.session_cache.get, self.model.game_session_id)
+
+    async def _handle_matchmaking_timeout(self):
+        logger.warning("Matchmaking timeout reached")
         self.poll_timer.stop()  # Ensure polling is stopped to prevent multiple game views
         if self._game_transition_started:
-            print("[LobbyController] Transition already started, skipping timeout logic.")
+            logger.warning("Transition already started, skipping timeout logic.")
             return
         try:
-            sessions = self.corba.game_manager_service.listActiveGameSessions()
-            current_session = next((s for s in sessions if s.gameId == self.model.game_session_id), None)
+            current_session = await self._await_session()
+            if self._game_transition_started:
+                return
 
             if current_session:
                 num_players = len(current_session.playerUsernames)
-                print(f"[LobbyController] Players at timeout: {num_players}")
+                logger.warning("Players at timeout: %s", num_players)
 
                 if current_session.sessionStatus == "PLAYING":
                     if not self._game_transition_started:
-                        print("[LobbyController] Session is 'PLAYING' at timeout, starting game.")
+                        logger.warning("Session is 'PLAYING' at timeout, starting game.")
                         self._game_transition_started = True
                         self.poll_timer.stop()
-                        self.navigate_to_game_screen()
+                        self.navigate_to_game_screen(current_session)
                     else:
-                        print("[LobbyController] Game transition already started, skipping.")
+                        logger.info("Game transition already started, skipping.")
                 else:
                     # TIMEOUT: Show retry/main menu buttons and stop polling
-                    print("[LobbyController] Matchmaking timed out. No match found.")
+                    logger.warning("Matchmaking timed out. No match found.")
                     self.view.show_restart_and_main_menu_buttons()
                     if self.view.restart_button:
                         self.view.restart_button.clicked.connect(self.on_restart)
@@ -185,22 +178,34 @@ class LobbyController(QObject):
                     self.model.set_status("ERROR")
                     self.model.set_message("Matchmaking timed out. No match found.")
             else:
-                print("[LobbyController] Session not found at timeout.")
+                logger.warning("Session not found at timeout.")
                 self.model.set_message("Session lost. Returning to main menu.")
                 self.on_main_menu()
         except Exception as e:
-            print(f"[LobbyController] Error during timeout handling: {e}")
+            logger.warning("Error during timeout handling: %s", e)
             self.model.set_message("Error during timeout handling.")
             self.on_main_menu()
 
     def fetch_lobby_status(self):
+        # Status poll tick; skipped until the session is joined and while the previous fetch is still out
+        if not self.model.game_session_id or (self._fetch_task and not self._fetch_task.done()):
+            return
+        self._fetch_task = self.scope.spawn(self._fetch_lobby_status())
+
+    async def _fetch_lobby_status(self):
+        async_corba = get_async_corba()
         try:
-            # Fetch the latest wait time from the server
-            wait_time_from_server = self.corba.admin_service.getWaitTime()
+            # Re-read the wait time now and then rather than on every tick
+            wait_time_from_server = self.last_wait_time_from_server
+            if wait_time_from_server is None or time.time() - self._wait_time_fetched_at > self.WAIT_TIME_REFRESH_SECONDS:
+                admin = async_corba.service(self.corba.admin_service, "AdminService")
+                wait_time_from_server = await admin.getWaitTime()
+                self._wait_time_fetched_at = time.time()
 
             # If the wait time has changed, reset the timer
             if self.last_wait_time_from_server is None or wait_time_from_server != self.last_wait_time_from_server:
-                print(f"[LobbyController] Wait time updated from {self.last_wait_time_from_server} to {wait_time_from_server}, resetting timer.")
+                logger.debug("Wait time updated from %s to %s, resetting timer.",
+                             self.last_wait_time_from_server, wait_time_from_server)
                 self.lobby_start_time = time.time()
                 self.last_wait_time_from_server = wait_time_from_server
 
@@ -215,78 +220,114 @@ class LobbyController(QObject):
             self.model.set_message(f"Waiting for players... (Timeout in {remaining}s)")
 
             if elapsed >= wait_time_from_server:
-                print("[LobbyController] Wait time expired, triggering timeout logic.")
+                logger.warning("Wait time expired, triggering timeout logic.")
                 self.poll_timer.stop()  # Stop polling before handling timeout
-                self._handle_matchmaking_timeout()
+                await self._handle_matchmaking_timeout()
                 return
 
             # ... rest of your polling logic (check session status, etc.) ...
-            sessions = self.corba.game_manager_service.listActiveGameSessions()
-            current_session = next((s for s in sessions if s.gameId == self.model.game_session_id), None)
+            current_session = await self._await_session()
+            if self._game_transition_started:
+                return
+            self._poll_errors = 0
+            self.poll_timer.report_success()
             if current_session:
+                self._adapt_poll_rate(current_session, wait_time_from_server)
                 if current_session.sessionStatus == "PLAYING" and len(current_session.playerUsernames) >= 2:
                     if not self._game_transition_started:
-                        print("[LobbyController] Game is ready, transitioning to game.")
+                        logger.debug("Game is ready, transitioning to game.")
                         self._game_transition_started = True
                         self.poll_timer.stop()
-                        self.navigate_to_game_screen()
+                        self.navigate_to_game_screen(current_session)
                     else:
-                        print("[LobbyController] Game transition already started, skipping.")
+                        logger.debug("Game transition already started, skipping.")
                         self.poll_timer.stop()
                 # else: keep waiting, UI already updated above
             else:
                 # handle session not found
-                print("[LobbyController] Session not found during polling.")
+                logger.warning("Session not found during polling.")
                 self.model.set_message("Session lost. Returning to main menu.")
                 self.on_main_menu()
+        except RETRYABLE_CORBA_ERRORS as e:
+            self._poll_errors += 1
+            self.poll_timer.report_error()
+            logger.warning("Lobby poll failed (%s in a row), backing off: %s", self._poll_errors, e)
+            if self._poll_errors >= self.MAX_RETRY_ATTEMPTS:
+                self.model.set_message("Connection lost")
+                self.on_main_menu()
+            else:
+                self.model.set_message("Temporary connection issue...")
         except Exception as e:
-            print(f"[LobbyController] Error in fetch_lobby_status: {e}")
+            logger.warning("Error in fetch_lobby_status: %s", e)
             self.model.set_message("Error during lobby polling.")
             self.on_main_menu()
 
+    def _adapt_poll_rate(self, session, wait_time):
+        """Poll slowly while nobody else is in the lobby, fast around the time the game should start."""
+        interval = self.IDLE_POLL_INTERVAL_MS if len(session.playerUsernames) < 2 else self.POLL_INTERVAL_MS
+        if self.poll_timer.interval() != interval:
+            self.poll_timer.setInterval(interval)
+        deadline = self.lobby_start_time + wait_time
+        if self.poll_timer.expected_at != deadline:
+            self.poll_timer.expect_at(deadline, self.FAST_POLL_MS, window_seconds=1.5)
+
     def _attempt_rejoin(self):
         try:
-            print("[LobbyController] Attempting to rejoin session using joinOrCreateGameSession...")
+            logger.info("Attempting to rejoin session using joinOrCreateGameSession...")
             session_id = self.corba.game_manager_service.joinOrCreateGameSession(self.model.username)
             if session_id:
-                print(f"[LobbyController] Successfully rejoined session: {session_id}")
+                logger.info("Successfully rejoined session: %s", session_id)
                 self.model.game_session_id = session_id
                 return True
             else:
-                print("[LobbyController] Failed to get session ID from joinOrCreateGameSession")
+                logger.warning("Failed to get session ID from joinOrCreateGameSession")
                 return False
         except Exception as e:
-            print(f"[LobbyController] Rejoin failed: {e}")
-            traceback.print_exc()
+            logger.warning("Rejoin failed: %s", e, exc_info=True)
             return False
 
     def _handle_polling_error(self, error):
         if isinstance(error, CORBA.TRANSIENT):
-            print("[LobbyController] CORBA transient error - attempting reset")
-            try:
-                self.reset_corba_services()
-                self.fetch_lobby_status()
-            except Exception as e:
-                print(f"[LobbyController] CORBA reset failed: {e}")
-                self.model.set_message("Connection lost")
-                self.on_main_menu()
+            logger.warning("CORBA transient error - attempting reset")
+            self.scope.spawn(self._reset_and_fetch_lobby_status())
         else:
-            print(f"[LobbyController] Non-fatal polling error: {error}")
+            logger.warning("Non-fatal polling error: %s", error)
             self.model.set_message("Temporary connection issue...")
 
+    async def _reset_and_fetch_lobby_status(self):
+        if await self.reset_corba_services():
+            self.fetch_lobby_status()
+        else:
+            self.model.set_message("Connection lost")
+            self.on_main_menu()
+
     def on_game_started(self):
-        print("[LobbyController] Game started detected. Navigating to game screen...")
+        logger.info("Game started detected. Navigating to game screen...")
         self.navigate_to_game_screen()
 
-    def navigate_to_game_screen(self):
-        print("[LobbyController] Starting game transition...")
+    def navigate_to_game_screen(self, current_session=None):
+        """Open the game screen for current_session; without one it is fetched first, off the GUI thread."""
+        logger.info("Starting game transition...")
+        transition_started = time.perf_counter()
+        if current_session is None:
+            self.scope.spawn(self._fetch_session_and_open_game_screen(transition_started))
+        else:
+            self._open_game_screen(current_session, transition_started)
+
+    async def _fetch_session_and_open_game_screen(self, transition_started):
         try:
-            # Fetch current session info
-            sessions = self.corba.game_manager_service.listActiveGameSessions()
-            current_session = next((s for s in sessions if s.gameId == self.model.game_session_id), None)
+            current_session = await self._await_session()
+        except Exception as e:
+            logger.warning("Transition failed: %s", e, exc_info=True)
+            self._game_transition_started = False
+            self.model.set_message("Failed to start game - try again")
+            return
+        self._open_game_screen(current_session, transition_started)
 
+    def _open_game_screen(self, current_session, transition_started):
+        try:
             if not current_session:
-                print("[LobbyController] Session disappeared - aborting")
+                logger.info("Session disappeared - aborting")
                 self._game_transition_started = False
                 self.model.set_message("Game session ended")
                 self.on_main_menu()
@@ -294,8 +335,8 @@ class LobbyController(QObject):
 
             players = current_session.playerUsernames
 
-            # Instantiate your GameView
-            self._game_view = GameView(players)
+            # The game view, prepared for these players (built during matchmaking and reused across games)
+            self._game_view = self.game_view_factory(players)
 
             # Instantiate your GameController with the game view and other needed info
             self._game_controller = GameController(
@@ -307,27 +348,32 @@ class LobbyController(QObject):
 
             # Connect signals from game controller to handle main menu transition post-game
             self._game_controller.navigate_to_main_menu.connect(self.on_main_menu)
+            self.game_controller_created.emit(self._game_controller)
 
             # Show the game view and start the game
-            self._game_view.show()
+            if self._game_view is not None:
+                self._game_view.show()
+            get_image_assets().preload_screens("finished", "main")
             self._game_controller.start_game()
+            if self._game_view is not None:
+                get_screen_manager().measure_transition("PLAYING -> game keyboard", transition_started)
 
-            # Close the lobby view
+            # Close the lobby view; nothing of the lobby should keep running behind the game
             self.view.close()
-            print("[LobbyController] Game transition complete")
+            self.timers.expect_idle("lobby -> game")
+            self.timers.stop_all()
+            logger.info("Game transition complete")
         except Exception as e:
-            print(f"[LobbyController] Transition failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("Transition failed: %s", e, exc_info=True)
             # Cleanup in case of failure
-            if hasattr(self, '_game_view'):
+            if getattr(self, '_game_view', None) is not None:
                 self._game_view.close()
             self._game_transition_started = False
             # Do NOT restart the polling timer here if the session is already PLAYING
             self.model.set_message("Failed to start game - try again")
 
     def on_matchmaking_timeout(self, force_timeout=False):
-        print("[LobbyController] Matchmaking timed out.")
+        logger.warning("Matchmaking timed out.")
         self.poll_timer.stop()
         self.view.show_restart_and_main_menu_buttons()
         # Reconnect signals (if buttons newly shown)
@@ -340,16 +386,22 @@ class LobbyController(QObject):
             self.model.set_message("Matchmaking timed out. No meow found.")
         else:
             # Only show timeout if there is only 1 player
-            sessions = self.corba.game_manager_service.listActiveGameSessions()
-            current_session = next((s for s in sessions if s.gameId == self.model.game_session_id), None)
-            if current_session and len(current_session.playerUsernames) > 1:
-                print("[LobbyController] Enough players after timeout, keep polling.")
-                self.poll_timer.start(self.POLL_INTERVAL_MS)
-                return
-            self.model.set_message("Matchmaking timed out. No meow found.")
+            self.scope.spawn(self._confirm_matchmaking_timeout())
+
+    async def _confirm_matchmaking_timeout(self):
+        try:
+            current_session = await self._await_session()
+        except Exception as e:
+            logger.warning("Error checking players after timeout: %s", e)
+            current_session = None
+        if current_session and len(current_session.playerUsernames) > 1:
+            logger.warning("Enough players after timeout, keep polling.")
+            self.poll_timer.start(self.POLL_INTERVAL_MS)
+            return
+        self.model.set_message("Matchmaking timed out. No meow found.")
 
     def handle_matchmaking_error(self, e):
-        print(f"[LobbyController] Matchmaking error: {e}")
+        logger.warning("Matchmaking error: %s", e)
         self.poll_timer.stop()
 
         self.view.show_restart_and_main_menu_buttons()
@@ -363,38 +415,45 @@ class LobbyController(QObject):
         self.model.set_message(f"Error: {str(e)}")
 
     def on_restart(self):
-        print("[LobbyController] Restart clicked, restarting matchmaking.")
+        logger.info("Restart clicked, restarting matchmaking.")
         self._reset_transition_flag()
 
         # Stop all timers first
         self.poll_timer.stop()
 
-        # Reset CORBA before starting again
-        if not self.reset_corba_services():
-            print("[LobbyController] Failed to reset CORBA services, returning to main menu")
+        # Reset CORBA before starting again; the button stays off until the reset is done
+        if self.view.restart_button:
+            self.view.restart_button.setEnabled(False)
+        self.scope.spawn(self._restart_after_reset())
+
+    async def _restart_after_reset(self):
+        reset = await self.reset_corba_services()
+        if self.view.restart_button:
+            self.view.restart_button.setEnabled(True)
+        if not reset:
+            logger.warning("Failed to reset CORBA services, returning to main menu")
             self.on_main_menu()
             return
 
         # Wait a moment for CORBA to stabilize
-        QTimer.singleShot(1000, self.start_waiting)
+        self.timers.single_shot(1000, self.start_waiting)
 
     def on_main_menu(self):
-        print("[LobbyController] Going back to main menu")
+        logger.info("Going back to main menu")
         self._reset_transition_flag()
-
-        # Clean up CORBA
-        if hasattr(self.corba, '_orb'):
-            try:
-                self.corba._orb.destroy()
-            except:
-                pass
-            self.corba._orb = None
+        self.timers.close()
+        self.scope.cancel()
+        check_leaks("lobby -> main menu")
 
         self.view.close()
         self.show_main_menu.emit()
 
     def show_lobby_view(self):
         self.view.show()
+        get_image_assets().preload_screens("game")
+        # Build the game screen while matchmaking runs, not when the round is about to start
+        if hasattr(self.game_view_factory, "prebuild"):
+            self.game_view_factory.prebuild(timers=self.timers)
 
     def _sanitize_username(self, username):
         """More lenient username sanitization that preserves most characters"""
@@ -413,13 +472,12 @@ class LobbyController(QObject):
         return sanitized
 
     def start_game_polling(self, game_manager_service):
-        self._poll_timer = QTimer(self)
-        self._poll_timer.timeout.connect(lambda: self.check_game_start(game_manager_service))
-        self._poll_timer.start(2000)  # Poll every 2 seconds
+        self._poll_timer = self.timers.poll_loop(
+            'game_start', lambda: self.check_game_start(game_manager_service), 2000)
+        self._poll_timer.start()
 
     def stop_game_polling(self):
-        if hasattr(self, '_poll_timer'):
-            self._poll_timer.stop()
+        self.timers.stop('game_start')
 
     def check_game_start(self, game_manager_service):
         if not self.model.game_session_id:
@@ -432,4 +490,4 @@ class LobbyController(QObject):
                 self.model.set_message("Game has started!")
                 self.model.is_waiting = False
         except Exception as e:
-            print(f"[LobbyModel] Error checking game start: {e}")
+            logger.warning("Error checking game start: %s", e)
@@ -3,6 +3,7 @@ from meowstery.python_client.player.view.login_view import UserLoginView
 from meowstery.python_client.player.controller.main_controller import MainController
 from meowstery.python_client.player.controller.register_controller import UserRegisterController
 from meowstery.python_client.player.model.user_model import CorbaUserModel
+from meowstery.python_client.player.view.images import get_image_assets
 
 
 class UserLoginController:
@@ -19,6 +20,7 @@ class UserLoginController:
 
     def show_login(self):
         self.login_view.show()
+        get_image_assets().preload_screens("main", "register")
 
     def attach_handlers(self):
         self.login_view.get_login_button().clicked.connect(self.perform_login)
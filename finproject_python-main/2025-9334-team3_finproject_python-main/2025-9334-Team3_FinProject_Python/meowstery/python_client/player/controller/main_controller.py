@@ -1,3 +1,5 @@
+import logging
+
 from PyQt5.QtWidgets import QMessageBox
 
 from meowstery.python_client.player.model.user_model import LobbyModel, CorbaUserModel
@@ -6,6 +8,11 @@ from meowstery.python_client.player.view.main_view import UserMainView
 from meowstery.python_client.player.controller.lobby_controller import LobbyController
 from meowstery.python_client.player.controller.leaderboards_controller import LeaderboardsController
 from meowstery.python_client.player.view.howto_view import HowToPlayView
+from meowstery.python_client.player.view.images import get_image_assets
+
+
+logger = logging.getLogger(__name__)
+
 
 class MainController:
     def __init__(self, username, session_id, orb, naming_context):
@@ -28,6 +35,7 @@ class MainController:
     def show(self):
         self.main_view.updateWelcomeLabel(f"Welcome, {self.username}!")
         self.main_view.show()
+        get_image_assets().preload_screens("lobby", "howto")
 
     def attach_handlers(self):
         self.main_view.playButton.clicked.connect(self.handle_play)
@@ -36,12 +44,12 @@ class MainController:
         self.main_view.leaveButton.clicked.connect(self.handle_leave)
 
     def handle_play(self):
-        print("[MainController] Play button clicked")
+        logger.info("Play button clicked")
         self.main_view.close()
         self.open_lobby(self.username, self.session_id)
 
     def open_lobby(self, username, session_id):
-        print("[MainController] Opening lobby")
+        logger.info("Opening lobby")
 
         lobby_model = LobbyModel(username)
         lobby_view = LobbyView()
@@ -54,24 +62,26 @@ class MainController:
         self.lobby_controller.show_lobby_view()
 
     def on_lobby_show_main_menu(self):
-        print("[MainController] Showing main menu again")
+        logger.info("Showing main menu again")
         self.main_view.show()
 
     def handle_leaderboards(self):
-        print("[MainController] Leaderboards button clicked")
+        logger.info("Leaderboards button clicked")
         self.show_leaderboards()
 
     def show_leaderboards(self):
-        print("[MainController] Showing leaderboard view")
+        logger.info("Showing leaderboard view")
+        if self.leaderboards_controller:
+            self.leaderboards_controller.close()
         self.leaderboards_controller = LeaderboardsController()
         self.leaderboards_controller.show_leaderboards_view()
 
     def handle_how_to_play(self):
-        print("[MainController] How to Play button clicked")
+        logger.info("How to Play button clicked")
         self.show_howto_play()
 
     def show_howto_play(self):
-        print("[MainController] Showing how to play")
+        logger.info("Showing how to play")
         self.howto_view = HowToPlayView(self.username)
         self.howto_view.show()
 
@@ -84,12 +94,12 @@ class MainController:
             QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            print("[MainController] User confirmed logout")
+            logger.info("User confirmed logout")
             self.main_view.close()
             self.return_to_login_view()
 
     def return_to_login_view(self):
-        print("[MainController] Returning to login view")
+        logger.info("Returning to login view")
         from meowstery.python_client.player.controller.login_controller import UserLoginController
         self.login_controller = UserLoginController(self.orb, self.naming_context)
         self.login_controller.show_login()
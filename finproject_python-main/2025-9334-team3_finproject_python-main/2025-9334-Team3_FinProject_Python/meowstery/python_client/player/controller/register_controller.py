@@ -1,9 +1,13 @@
 from PyQt5.QtWidgets import QMessageBox
 from PyQt5.QtCore import QObject, pyqtSignal
-import sys
+import logging
 
 from meowstery.python_client.player.view.register_view import RegisterPanel
 
+
+logger = logging.getLogger(__name__)
+
+
 class UserRegisterController(QObject):
     show_login_signal = pyqtSignal()
     registration_success = pyqtSignal(str)
@@ -58,7 +62,7 @@ class UserRegisterController(QObject):
                 QMessageBox.critical(self.view, "Registration Error", message or "Registration failed. Please try again.")
         except Exception as ex:
             QMessageBox.critical(self.view, "Registration Error", f"Registration failed: {str(ex)}")
-            print(f"Registration error: {ex}", file=sys.stderr)
+            logger.warning("Registration error: %s", ex)
 
     def validate_input(self, username, password, confirm_password):
         if len(username) < 3:
@@ -2,15 +2,23 @@ from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
     QHBoxLayout, QMessageBox
 )
-from PyQt5.QtGui import QCursor, QPixmap, QFont, QFontDatabase
+from PyQt5.QtGui import QCursor
 from PyQt5.QtCore import Qt
+import logging
 import sys
-import os
-
-import CORBA
-import CosNaming
 
+from meowstery.python_client.config.config_reader import load_metrics_config
+from meowstery.python_client.config.logging_config import setup_logging
 from meowstery.python_client.player.controller.login_controller import UserLoginController
+from meowstery.python_client.player.model.call_metrics import MetricsDumper, get_call_metrics
+from meowstery.python_client.player.model.async_corba import install_event_loop, run_event_loop
+from meowstery.python_client.player.model.service_registry import get_registry
+from meowstery.python_client.player.model.tracing import format_figures, get_tracer
+from meowstery.python_client.player.view import theme
+from meowstery.python_client.player.view.images import get_image_assets
+
+
+logger = logging.getLogger(__name__)
 
 
 class MeowsteryClient(QWidget):
@@ -26,18 +34,10 @@ class MeowsteryClient(QWidget):
         self.init_ui()
 
     def load_barriecito_font(self):
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        font_path = os.path.abspath(os.path.join(base_path, "..", "res", "Barriecito-Regular.ttf"))
-        if os.path.exists(font_path):
-            QFontDatabase.addApplicationFont(font_path)
-            self.barriecito_font = QFont("Barriecito")
-        else:
-            print(f"Warning: Barriecito font not found at {font_path}. Using Arial instead.")
-            self.barriecito_font = QFont("Arial")
+        self.barriecito_font = theme.font()
 
     def get_image_path(self, filename):
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        return os.path.join(base_path, "..", "res", "images", filename)
+        return get_image_assets().path(filename)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -46,9 +46,8 @@ class MeowsteryClient(QWidget):
 
         self.title_image = QLabel()
 
-        pixmap = QPixmap(self.get_image_path("title.png"))
+        pixmap = get_image_assets().pixmap("title.png", 400)
         if not pixmap.isNull():
-            pixmap = pixmap.scaledToWidth(400, Qt.SmoothTransformation)
             self.title_image.setPixmap(pixmap)
             self.title_image.setAlignment(Qt.AlignCenter)
         else:
@@ -58,13 +57,13 @@ class MeowsteryClient(QWidget):
 
         ip_layout = QHBoxLayout()
         ip_label = QLabel("Server IP:")
-        ip_label.setFont(QFont(self.barriecito_font.family(), 16))
+        ip_label.setFont(theme.font(16))
         ip_label.setStyleSheet("color: black;")
         ip_layout.addWidget(ip_label)
 
         self.ip_field = QLineEdit()
         self.ip_field.setFixedHeight(40)
-        self.ip_field.setFont(QFont(self.barriecito_font.family(), 14))
+        self.ip_field.setFont(theme.font(14))
         self.ip_field.setStyleSheet("""
             border: 2px solid black;
             padding-left: 10px;
@@ -77,7 +76,7 @@ class MeowsteryClient(QWidget):
         self.connect_button = QPushButton("Connect")
         self.connect_button.setCursor(QCursor(Qt.PointingHandCursor))
         self.connect_button.setFixedHeight(45)
-        self.connect_button.setFont(QFont(self.barriecito_font.family(), 18, QFont.Bold))
+        self.connect_button.setFont(theme.font(18, bold=True))
         self.connect_button.setStyleSheet("""
             QPushButton {
                 background-color: black;
@@ -103,13 +102,9 @@ class MeowsteryClient(QWidget):
             return
 
         try:
-            orb_args = ["-ORBInitRef", f"NameService=corbaloc::{ip}:1050/NameService"]
-            self.orb = CORBA.ORB_init(orb_args)
-
-            obj = self.orb.resolve_initial_references("NameService")
-            self.naming_context = obj._narrow(CosNaming.NamingContext)
-            if self.naming_context is None:
-                raise RuntimeError("Failed to narrow the root naming context")
+            registry = get_registry()
+            self.naming_context = registry.connect(ip, 1050)
+            self.orb = registry.orb
 
             QMessageBox.information(self, "Connected", f"Successfully connected to NameService at {ip}")
 
@@ -126,10 +121,28 @@ class MeowsteryClient(QWidget):
 
 
 def main():
+    setup_logging()
     app = QApplication(sys.argv)
+    theme.install(app)
+    install_event_loop(app)
+
+    metrics_config = load_metrics_config()
+    metrics = get_call_metrics()
+    dumper = None
+    if metrics_config['jsonl_path']:
+        dumper = MetricsDumper(metrics, metrics_config['jsonl_path'], metrics_config['dump_interval']).start()
+    tracer = get_tracer()
+
     client = MeowsteryClient()
     client.show()
-    sys.exit(app.exec_())
+    get_image_assets().preload_screens("login", "register")
+    exit_code = run_event_loop(app)
+    if dumper is not None:
+        dumper.stop()
+    if metrics_config['trace_path']:
+        tracer.export(metrics_config['trace_path'])
+        logger.info("Guess latencies (ms):\n%s", format_figures(tracer.percentiles()))
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from PyQt5.QtCore import QTimer
+
+
+logger = logging.getLogger(__name__)
+
+try:
+    import qasync
+except ImportError:  # Optional: without it a QTimer drives the asyncio loop
+    qasync = None
+
+
+LOOP_TICK_MS = 10  # How often the QTimer driver lets asyncio run, while it has work, when qasync is missing
+
+_loop = None
+_loop_driver = None
+
+
+def install_event_loop(app=None):
+    """Run asyncio inside the Qt event loop. Call once, right after creating the QApplication.
+
+    With qasync installed its QEventLoop is used and run_event_loop() must
+    replace app.exec_(). Otherwise a QTimer gives asyncio one pass every
+    LOOP_TICK_MS and app.exec_() keeps working as before. That timer only
+    runs while asyncio has work: CallScope.spawn() starts it and it stops
+    itself once the loop is idle, so an idle client is not woken up.
+    """
+    global _loop, _loop_driver
+    if _loop is not None:
+        return _loop
+    if qasync is not None and app is not None:
+        _loop = qasync.QEventLoop(app)
+    else:
+        _loop = asyncio.new_event_loop()
+        _loop_driver = QTimer()
+        _loop_driver.setInterval(LOOP_TICK_MS)
+        _loop_driver.timeout.connect(_run_loop_once)
+    asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def run_event_loop(app):
+    """Replacement for app.exec_() that also runs asyncio; returns the exit code."""
+    if _loop is None:
+        install_event_loop(app)
+    if _loop_driver is None:
+        with _loop:
+            return _loop.run_forever()
+    return app.exec_()
+
+
+def get_event_loop():
+    return _loop if _loop is not None else install_event_loop()
+
+
+def _wake_driver():
+    if _loop_driver is not None and not _loop_driver.isActive():
+        _loop_driver.start()
+
+
+def _run_loop_once():
+    # A stop() queued first makes run_forever() handle what is ready and return
+    _loop.call_soon(_loop.stop)
+    _loop.run_forever()
+    if not _has_pending_work():
+        _loop_driver.stop()
+
+
+def _has_pending_work():
+    # Unfinished tasks, timers (sleeps, wait_for timeouts) or callbacks queued from worker threads
+    return bool(asyncio.all_tasks(_loop) or _loop._scheduled or _loop._ready)
+
+
+class CallScope:
+    """Tasks started for one screen, cancelled together when the screen goes away.
+
+    Cancelling stops the awaiting coroutine; a remote call already running in
+    the pool finishes in the background and its result is dropped.
+    """
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.closed = False
+        self._tasks = set()
+
+    def spawn(self, coro):
+        if self.closed:
+            coro.close()
+            return None
+        task = asyncio.ensure_future(coro, loop=get_event_loop())
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        _wake_driver()
+        return task
+
+    def cancel(self):
+        self.closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        self._tasks.clear()
+
+    def _task_done(self, task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Task in %s failed: %r", self.name or 'scope', task.exception())
+
+
+class AsyncService:
+    """Awaitable view of one CORBA service: await game.getWordMask(user)."""
+
+    def __init__(self, facade, target, name: str):
+        self._facade = facade
+        self._target = target
+        self._name = name
+
+    def __getattr__(self, op):
+        if op.startswith("__"):
+            raise AttributeError(op)
+
+        async def call(*args, timeout=None):
+            return await self._facade.run(self._name, getattr(self._target, op), *args, timeout=timeout)
+
+        call.__name__ = op
+        return call
+
+    def __repr__(self):
+        return f"<AsyncService {self._name}>"
+
+
+class AsyncCorba:
+    """Runs blocking omniORB calls on a bounded pool so coroutines on the GUI thread can await them.
+
+    Each service gets its own concurrency limit; a slot is held until the
+    remote call really returns, even if the caller timed out or was cancelled.
+    """
+
+    DEFAULT_TIMEOUT_SECONDS = 10
+    DEFAULT_SERVICE_LIMIT = 2
+
+    def __init__(self, max_workers: int = 8, default_timeout: float = DEFAULT_TIMEOUT_SECONDS,
+                 service_limits: Optional[Dict[str, int]] = None):
+        self.default_timeout = default_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="corba-async")
+        self._service_limits = dict(service_limits or {})
+        self._semaphores = {}
+
+    def service(self, target, name: Optional[str] = None) -> AsyncService:
+        name = name or getattr(target, "service_name", None) or type(target).__name__
+        return AsyncService(self, target, name)
+
+    async def run(self, service_name: str, fn, *args, timeout: Optional[float] = None):
+        """Await fn(*args) on the pool under service_name's limit; raises asyncio.TimeoutError."""
+        timeout = self.default_timeout if timeout is None else timeout
+        loop = asyncio.get_event_loop()
+        semaphore = self._semaphore(service_name)
+        await semaphore.acquire()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(lambda _: self._release_from_worker(loop, semaphore))
+        return await asyncio.wait_for(asyncio.wrap_future(future, loop=loop), timeout)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+    def _semaphore(self, service_name):
+        semaphore = self._semaphores.get(service_name)
+        if semaphore is None:
+            limit = self._service_limits.get(service_name, self.DEFAULT_SERVICE_LIMIT)
+            semaphore = self._semaphores[service_name] = asyncio.Semaphore(limit)
+        return semaphore
+
+    @staticmethod
+    def _release_from_worker(loop, semaphore):
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:
+            pass  # Loop already closed at shutdown
+
+
+_async_corba = None
+_async_corba_lock = threading.Lock()
+
+
+def get_async_corba():
+    global _async_corba
+    with _async_corba_lock:
+        if _async_corba is None:
+            _async_corba = AsyncCorba()
+        return _async_corba
@@ -0,0 +1,153 @@
+import bisect
+import json
+import logging
+import math
+import threading
+import time
+from collections import Counter
+
+from meowstery.python_client.player.model.service_registry import get_registry
+
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bounds in milliseconds; the last bucket catches everything slower.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; constant memory however many calls are recorded."""
+
+    def __init__(self, bounds_ms=LATENCY_BUCKETS_MS):
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms):
+        self.counts[bisect.bisect_left(self.bounds_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of calls (max_ms for the overflow bucket)."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return float(self.bounds_ms[index]) if index < len(self.bounds_ms) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self):
+        labels = [f"<={b}" for b in self.bounds_ms] + [f">{self.bounds_ms[-1]}"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets_ms": {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+
+class OperationStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = Counter()
+        self.latency = LatencyHistogram()
+
+    def to_dict(self):
+        return {"calls": self.calls, "errors": dict(self.errors), "latency": self.latency.to_dict()}
+
+
+class CallMetrics:
+    """Per-IDL-operation call counts, error counts by exception type and latency histograms.
+
+    Installed as a ServiceRegistry call observer, so it sees every call made
+    through a service proxy (everything resolve_service returns). Errors are
+    keyed by exception class name: GameNotFound, TRANSIENT, COMM_FAILURE...
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations = {}
+        self.started = time.time()
+
+    def __call__(self, service_name, operation, seconds, error):
+        key = f"{service_name}.{operation}"
+        with self._lock:
+            stats = self._operations.get(key)
+            if stats is None:
+                stats = self._operations[key] = OperationStats()
+            stats.calls += 1
+            stats.latency.record(seconds * 1000.0)
+            if error is not None:
+                stats.errors[type(error).__name__] += 1
+
+    def snapshot(self):
+        """{"Service.operation": {"calls", "errors", "latency"}} as plain, JSON-ready data."""
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self._operations.items()}
+
+    def reset(self):
+        with self._lock:
+            self._operations.clear()
+            self.started = time.time()
+
+
+class MetricsDumper:
+    """Appends a timestamped CallMetrics snapshot to a JSON lines file every interval_seconds."""
+
+    def __init__(self, metrics, path, interval_seconds=10.0):
+        self.metrics = metrics
+        self.path = path
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="metrics-dump", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the thread and write one final line."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        self.dump()
+
+    def dump(self):
+        line = {"time": time.time(), "since": self.metrics.started, "operations": self.metrics.snapshot()}
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(line) + "\n")
+        except OSError as e:
+            logger.warning("Could not write %s: %s", self.path, e)
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            self.dump()
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_call_metrics():
+    """Process-wide CallMetrics, registered with the service registry on first use."""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = CallMetrics()
+            get_registry().add_call_observer(_metrics)
+        return _metrics
@@ -0,0 +1,112 @@
+import logging
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import service
+import service__POA
+from meowstery.python_client.player.model.service_registry import get_registry
+
+
+logger = logging.getLogger(__name__)
+
+
+class GameEventBridge(QObject):
+    """Re-emits server-pushed game events as Qt signals.
+
+    Servant methods run on omniORB threads; emitting from there is safe because
+    receivers living in the GUI thread get the signals as queued calls.
+    """
+    round_started = pyqtSignal(str, int, str)
+    word_mask_changed = pyqtSignal(str, str, object)
+    score_changed = pyqtSignal(str, str, int)
+    game_finished = pyqtSignal(str, str)
+    heartbeat = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.last_event_time = None
+
+    def touch(self):
+        self.last_event_time = time.monotonic()
+
+    def seconds_since_last_event(self):
+        if self.last_event_time is None:
+            return None
+        return time.monotonic() - self.last_event_time
+
+
+class GameEventListenerServant(service__POA.GameEventListener):
+    def __init__(self, bridge: GameEventBridge):
+        self._bridge = bridge
+
+    def onRoundStarted(self, gameId, roundNumber, startTime):
+        self._bridge.touch()
+        self._bridge.round_started.emit(gameId, roundNumber, startTime)
+
+    def onWordMaskChanged(self, gameId, username, mask):
+        self._bridge.touch()
+        self._bridge.word_mask_changed.emit(gameId, username, mask)
+
+    def onScoreChanged(self, gameId, username, roundsWon):
+        self._bridge.touch()
+        self._bridge.score_changed.emit(gameId, username, roundsWon)
+
+    def onGameFinished(self, gameId, winnerUsername):
+        self._bridge.touch()
+        self._bridge.game_finished.emit(gameId, winnerUsername)
+
+    def onHeartbeat(self, gameId):
+        self._bridge.touch()
+        self._bridge.heartbeat.emit(gameId)
+
+
+class GameEventSubscription:
+    """Activates a listener servant on the client ORB and registers it for one game."""
+
+    def __init__(self, event_service, game_id: str, username: str):
+        self.event_service = event_service
+        self.game_id = game_id
+        self.username = username
+        self.bridge = GameEventBridge()
+        self._servant = None
+        self._object_id = None
+        self.active = False
+
+    def subscribe(self):
+        """Return True when the server accepted the listener, False when push is unavailable."""
+        if not self.event_service:
+            return False
+        try:
+            poa = get_registry().root_poa()
+            self._servant = GameEventListenerServant(self.bridge)
+            self._object_id = poa.activate_object(self._servant)
+            listener = poa.id_to_reference(self._object_id)._narrow(service.GameEventListener)
+            self.event_service.subscribe(self.game_id, self.username, listener)
+            self.bridge.touch()
+            self.active = True
+            logger.info("Subscribed to events for game %s", self.game_id)
+        except Exception as e:
+            logger.info("Push events unavailable, staying on polling: %s", e)
+            self._deactivate()
+            self.active = False
+        return self.active
+
+    def unsubscribe(self):
+        if self.active:
+            try:
+                self.event_service.unsubscribe(self.game_id, self.username)
+            except Exception as e:
+                logger.warning("Error unsubscribing from game %s: %s", self.game_id, e)
+        self.active = False
+        self._deactivate()
+
+    def _deactivate(self):
+        if self._object_id is None:
+            return
+        try:
+            get_registry().root_poa().deactivate_object(self._object_id)
+        except Exception as e:
+            logger.warning("Error deactivating listener: %s", e)
+        self._object_id = None
+        self._servant = None
@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GameStateSnapshot:
+    """One player's view of a game as fetched in a single tick. Never mutated."""
+    game_id: str
+    username: str
+    round_number: int
+    status: Optional[str] = None
+    word_mask: Optional[object] = None
+    round_start_time: str = ""
+    status_error: Optional[Exception] = None
+    mask_error: Optional[Exception] = None
+    fetched_at: float = 0.0
+
+    @property
+    def masked_word(self):
+        return self.word_mask.maskedWord if self.word_mask else ""
+
+    @property
+    def guesses_left(self):
+        return self.word_mask.guessesLeft if self.word_mask else None
+
+    @property
+    def game_exists(self):
+        return bool(self.masked_word)
+
+    def age(self):
+        return time.monotonic() - self.fetched_at
+
+    def raise_for_status(self):
+        if self.status_error is not None:
+            raise self.status_error
+
+    def raise_for_mask(self):
+        if self.mask_error is not None:
+            raise self.mask_error
+
+
+class GameStateSnapshotter:
+    """Fetches a GameStateSnapshot at most once per tick and shares it between readers.
+
+    Readers asking while a fetch is running wait for that fetch instead of
+    starting their own. Known round start times never change, so they are
+    kept for the whole game and only missing rounds are asked for again.
+    When a clock estimator is given and wants a sample, the tick also takes
+    one getServerTime round trip for it.
+    """
+
+    def __init__(self, game_service, game_id: str, username: str, tick_seconds: float = 0.9, clock=None):
+        self.game_service = game_service
+        self.clock = clock
+        self.game_id = game_id
+        self.username = username
+        self.tick_seconds = tick_seconds
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._in_flight = None
+        self._round_start_times = {}
+        self._missing_rounds = {}
+
+    def current(self, round_number: int, max_age: Optional[float] = None) -> GameStateSnapshot:
+        """Return a snapshot for round_number no older than max_age (default: one tick)."""
+        max_age = self.tick_seconds if max_age is None else max_age
+        with self._lock:
+            snapshot = self._snapshot
+            if (snapshot is not None and snapshot.round_number == round_number
+                    and snapshot.age() <= max_age):
+                return snapshot
+            future = self._in_flight
+            owner = future is None
+            if owner:
+                future = self._in_flight = Future()
+
+        if not owner:
+            snapshot = future.result()
+            if snapshot.round_number == round_number:
+                return snapshot
+            return self.current(round_number, max_age)
+
+        try:
+            snapshot = self._fetch(round_number)
+        except BaseException as e:
+            with self._lock:
+                self._in_flight = None
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._snapshot = snapshot
+            self._in_flight = None
+        future.set_result(snapshot)
+        return snapshot
+
+    def refresh(self, round_number: int) -> GameStateSnapshot:
+        """Fetch a new snapshot now, e.g. right after submitting a guess."""
+        return self.current(round_number, max_age=0)
+
+    def apply_word_mask(self, word_mask):
+        """Fold a pushed word mask into the current snapshot so readers see it without a fetch."""
+        with self._lock:
+            if self._snapshot is not None:
+                self._snapshot = replace(self._snapshot, word_mask=word_mask, mask_error=None)
+
+    def round_start_time(self, round_number: int) -> str:
+        """Return the start time of round_number, or an empty string if it has not started yet."""
+        with self._lock:
+            start_time = self._round_start_times.get(round_number)
+            if start_time:
+                return start_time
+            checked_at = self._missing_rounds.get(round_number)
+            if checked_at is not None and time.monotonic() - checked_at <= self.tick_seconds:
+                return ""
+
+        start_time = self.game_service.getRoundStartTime(self.game_id, round_number)
+        with self._lock:
+            if start_time:
+                self._round_start_times[round_number] = start_time
+                self._missing_rounds.pop(round_number, None)
+            else:
+                self._missing_rounds[round_number] = time.monotonic()
+        return start_time or ""
+
+    def known_round_start_time(self, round_number: int) -> str:
+        """Return the start time of round_number if it was already fetched, else an empty string; never calls the server."""
+        with self._lock:
+            return self._round_start_times.get(round_number, "")
+
+    def invalidate(self):
+        """Drop the current snapshot; known round start times are kept."""
+        with self._lock:
+            self._snapshot = None
+            self._missing_rounds.clear()
+
+    def _fetch(self, round_number):
+        status = status_error = None
+        word_mask = mask_error = None
+        round_start_time = ""
+
+        try:
+            status = self.game_service.getGameStatus(self.username)
+        except Exception as e:
+            status_error = e
+
+        try:
+            word_mask = self.game_service.getWordMask(self.username)
+        except Exception as e:
+            # Kept as-is so readers can tell GameNotFound / NoOpponentFound apart
+            mask_error = e
+
+        if status_error is None and status == "PLAYING":
+            try:
+                round_start_time = self.round_start_time(round_number)
+            except Exception as e:
+                logger.warning("Error getting start of round %s: %s", round_number, e)
+
+        if self.clock is not None and status_error is None and self.clock.wants_sample():
+            try:
+                self.clock.measure(self.game_service)
+            except Exception as e:
+                logger.debug("Server time sample failed: %s", e)
+
+        return GameStateSnapshot(
+            game_id=self.game_id,
+            username=self.username,
+            round_number=round_number,
+            status=status,
+            word_mask=word_mask,
+            round_start_time=round_start_time,
+            status_error=status_error,
+            mask_error=mask_error,
+            fetched_at=time.monotonic(),
+        )
@@ -0,0 +1,71 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import service
+
+from meowstery.python_client.player.model.tracing import get_tracer
+
+
+logger = logging.getLogger(__name__)
+
+
+class GuessPipeline(QObject):
+    """Sends letter guesses off the GUI thread, one at a time and in order.
+
+    Each guess is followed by a fresh getWordMask so the controller can
+    reconcile its optimistic mask. Results come back as signals; receivers in
+    the GUI thread get them as queued calls. Both calls are spans of the
+    guess's trace when it was submitted with one active.
+    """
+    guess_confirmed = pyqtSignal(str, object)  # letter, WordMaskInfo (None if unavailable)
+    guess_rejected = pyqtSignal(str, str)  # letter, reason from InvalidGuess
+    guess_failed = pyqtSignal(str, object)  # letter, exception
+
+    def __init__(self, game_service, username: str, game_state=None):
+        super().__init__()
+        self.game_service = game_service
+        self.username = username
+        self.game_state = game_state
+        # A single worker keeps guesses in the order they were typed
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="guess-submit")
+        self._closed = False
+
+    def submit(self, letter: str):
+        if self._closed:
+            return None
+        return self._executor.submit(self._send_traced, letter, get_tracer().current())
+
+    def close(self):
+        """Stop accepting guesses; queued ones still run but their results are dropped."""
+        self._closed = True
+        self._executor.shutdown(wait=False)
+
+    def _send_traced(self, letter, trace):
+        with trace.activate() if trace is not None else nullcontext():
+            self._send(letter)
+
+    def _send(self, letter):
+        try:
+            self.game_service.submitGuess(self.username, letter)
+        except service.InvalidGuess as e:
+            self._emit(self.guess_rejected, letter, e.reason)
+            return
+        except Exception as e:
+            self._emit(self.guess_failed, letter, e)
+            return
+
+        word_mask_info = None
+        try:
+            word_mask_info = self.game_service.getWordMask(self.username)
+            if self.game_state is not None and word_mask_info and word_mask_info.maskedWord:
+                self.game_state.apply_word_mask(word_mask_info)
+        except Exception as e:
+            logger.warning("Guess '%s' accepted but word mask refresh failed: %s", letter, e)
+        self._emit(self.guess_confirmed, letter, word_mask_info)
+
+    def _emit(self, signal, *args):
+        if not self._closed:
+            signal.emit(*args)
@@ -0,0 +1,232 @@
+import bisect
+import logging
+import time
+from collections import namedtuple
+from typing import Dict, Optional, Tuple
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from omniORB import CORBA
+
+import service
+from meowstery.python_client.player.model.async_corba import CallScope, get_async_corba
+from meowstery.python_client.player.model.service_registry import get_registry
+
+
+logger = logging.getLogger(__name__)
+
+
+# rank is 1-based over the whole leaderboard, not the page
+LeaderboardRow = namedtuple("LeaderboardRow", "rank username wins")
+
+
+class LeaderboardCache(QObject):
+    """Leaderboard pages shared by every screen, served stale-while-revalidate.
+
+    get() returns the cached rows of a page at once, even if they are old,
+    and refreshes a stale page in the background on the CORBA pool; updated
+    is emitted when the new rows arrive. invalidate() makes every page stale,
+    e.g. after a game ends; a fetch already running at that point may
+    predate the change, so its result is dropped and the fetch repeated.
+
+    Servers with getLeaderboardSince are synced by version: the first call
+    downloads the whole table, later ones only the (username, wins) pairs
+    that changed. The cache keeps the table ranked as the server ranks it
+    (wins descending, then username), applies each delta in place and
+    re-emits only the pages whose rows moved. Without that operation pages
+    are fetched one by one with getTopPlayersRange, or cut from
+    getTopPlayers on older servers still.
+    """
+
+    updated = pyqtSignal(int, int, list)  # offset, count, rows
+    refresh_failed = pyqtSignal(int, int)  # offset, count
+
+    DEFAULT_TTL_SECONDS = 30.0
+
+    def __init__(self, leaderboard_service=None, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        super().__init__()
+        self._service = leaderboard_service
+        self.ttl_seconds = ttl_seconds
+        self._pages: Dict[Tuple[int, int], list] = {}
+        self._fetched_at: Dict[Tuple[int, int], float] = {}
+        self._refreshing = set()
+        self._supports_range = None  # Unknown until the first call
+        self._supports_delta = None
+        self._version = 0  # Leaderboard version of _ranked; 0 before the first sync
+        self._ranked = []  # (-wins, username) in rank order
+        self._wins: Dict[str, int] = {}
+        self._synced_at = None
+        self._syncing = False
+        self._generation = 0  # Bumped by invalidate()
+        self._scope = CallScope("leaderboard")
+
+    def get(self, offset=0, count=10):
+        """Cached rows of the page (empty before its first fetch); starts a refresh if they are stale."""
+        key = (offset, count)
+        if self._supports_delta is not False:
+            if self._version and key not in self._pages:
+                # The whole table is held locally, so a new page is served from it
+                self._pages[key] = self._page_rows(offset, count)
+                self._fetched_at[key] = self._synced_at
+            if self.is_stale(offset, count):
+                self._pages.setdefault(key, [])
+                self.sync()
+        elif self.is_stale(offset, count):
+            self.refresh(offset, count)
+        return list(self._pages.get(key, []))
+
+    def is_stale(self, offset=0, count=10):
+        fetched_at = self._fetched_at.get((offset, count))
+        return fetched_at is None or time.monotonic() - fetched_at > self.ttl_seconds
+
+    def refresh(self, offset=0, count=10):
+        """Fetch the page in the background unless a fetch for it is already running."""
+        key = (offset, count)
+        if key in self._refreshing:
+            return None
+        self._refreshing.add(key)
+        return self._scope.spawn(self._refresh_async(offset, count))
+
+    async def _refresh_async(self, offset, count):
+        key = (offset, count)
+        generation = self._generation
+        try:
+            rows = await get_async_corba().run("LeaderboardService", self.fetch, offset, count)
+        except Exception as e:
+            logger.warning("Leaderboard refresh failed, keeping cached rows: %s", e)
+            self.refresh_failed.emit(offset, count)
+            return
+        finally:
+            self._refreshing.discard(key)
+        if generation != self._generation:
+            self.refresh(offset, count)
+            return
+        self._pages[key] = rows
+        self._fetched_at[key] = time.monotonic()
+        self.updated.emit(offset, count, rows)
+
+    def sync(self):
+        """Bring the local table up to the server's version in the background."""
+        if self._syncing:
+            return None
+        self._syncing = True
+        return self._scope.spawn(self._sync_async())
+
+    async def _sync_async(self):
+        generation = self._generation
+        try:
+            delta = await get_async_corba().run("LeaderboardService", self.fetch_delta, self._version)
+        except Exception as e:
+            logger.warning("Leaderboard sync failed, keeping cached rows: %s", e)
+            for offset, count in list(self._pages):
+                self.refresh_failed.emit(offset, count)
+            return
+        finally:
+            self._syncing = False
+        if delta is None:
+            # No getLeaderboardSince: fall back to fetching each page
+            for offset, count in list(self._pages):
+                self.refresh(offset, count)
+            return
+        if generation != self._generation:
+            # Leaving _version alone makes the next delta cover this one too
+            self.sync()
+            return
+        self._apply_delta(delta)
+
+    def fetch_delta(self, version, leaderboard_service=None):
+        """Blocking getLeaderboardSince(version); None if the server lacks it. Call it off the GUI thread."""
+        leaderboard_service = leaderboard_service or self._leaderboard_service()
+        if leaderboard_service is None or self._supports_delta is False:
+            return None
+        try:
+            delta = leaderboard_service.getLeaderboardSince(version)
+        except (CORBA.BAD_OPERATION, CORBA.NO_IMPLEMENT) as e:
+            logger.info("getLeaderboardSince not supported by server, fetching pages instead: %s", e)
+            self._supports_delta = False
+            return None
+        self._supports_delta = True
+        return delta
+
+    def _apply_delta(self, delta):
+        if delta.full:
+            self._wins = {entry.username: entry.wins for entry in delta.changed}
+            self._ranked = sorted((-wins, username) for username, wins in self._wins.items())
+            first_moved = 0
+        else:
+            first_moved = len(self._ranked)
+            for username in delta.removed:
+                first_moved = min(first_moved, self._unrank(username))
+            for entry in delta.changed:
+                first_moved = min(first_moved, self._unrank(entry.username))
+                key = (-entry.wins, entry.username)
+                position = bisect.bisect_left(self._ranked, key)
+                self._ranked.insert(position, key)
+                self._wins[entry.username] = entry.wins
+                first_moved = min(first_moved, position)
+        self._version = delta.version
+        self._synced_at = time.monotonic()
+
+        for (offset, count), old_rows in list(self._pages.items()):
+            key = (offset, count)
+            fresh = key in self._fetched_at
+            self._fetched_at[key] = self._synced_at
+            if fresh and offset + count <= first_moved:
+                continue  # Every row of the page ranks above the first change
+            rows = self._page_rows(offset, count)
+            if not fresh or rows != old_rows:
+                self._pages[key] = rows
+                self.updated.emit(offset, count, rows)
+
+    def _unrank(self, username):
+        """Take username out of the ranking; returns where it was (or len(_ranked) if absent)."""
+        wins = self._wins.pop(username, None)
+        if wins is None:
+            return len(self._ranked)
+        position = bisect.bisect_left(self._ranked, (-wins, username))
+        del self._ranked[position]
+        return position
+
+    def _page_rows(self, offset, count):
+        return [LeaderboardRow(offset + index + 1, username, -negative_wins)
+                for index, (negative_wins, username) in enumerate(self._ranked[offset:offset + count])]
+
+    def invalidate(self):
+        """Mark every page stale; readers keep seeing the old rows until the refresh lands."""
+        self._generation += 1
+        self._fetched_at.clear()
+
+    def fetch(self, offset, count, leaderboard_service=None):
+        """Blocking fetch of count rows starting at offset; call it off the GUI thread."""
+        leaderboard_service = leaderboard_service or self._leaderboard_service()
+        if leaderboard_service is None:
+            return []
+        if self._supports_range is not False:
+            try:
+                players = leaderboard_service.getTopPlayersRange(offset, count)
+                self._supports_range = True
+                return self._to_rows(players, offset)
+            except (CORBA.BAD_OPERATION, CORBA.NO_IMPLEMENT) as e:
+                logger.info("getTopPlayersRange not supported by server, downloading the whole table: %s", e)
+                self._supports_range = False
+        players = leaderboard_service.getTopPlayers()
+        return self._to_rows(players[offset:offset + count], offset)
+
+    def _leaderboard_service(self):
+        if self._service is None:
+            self._service = get_registry().resolve("LeaderboardService", service.LeaderboardService)
+        return self._service
+
+    @staticmethod
+    def _to_rows(players, offset):
+        return [LeaderboardRow(offset + index + 1, p.username, p.wins) for index, p in enumerate(players)]
+
+
+_cache: Optional[LeaderboardCache] = None
+
+
+def get_leaderboard_cache() -> LeaderboardCache:
+    """The client's LeaderboardCache; create it from the GUI thread."""
+    global _cache
+    if _cache is None:
+        _cache = LeaderboardCache()
+    return _cache
@@ -0,0 +1,200 @@
+from array import array
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class LeaderboardTableModel(QAbstractTableModel):
+    """Leaderboard rows for a QTableView, loaded one page at a time as the view scrolls.
+
+    Rows are stored column-wise, as a list of usernames and an array of wins,
+    so a row costs two entries instead of two QTableWidgetItems. Only rows
+    the view scrolls to are loaded: canFetchMore/fetchMore ask the
+    LeaderboardCache for the next page. A refreshed page is compared with the
+    stored rows and only the cells that changed are announced; a short last
+    page drops the rows past it (players removed from the leaderboard).
+
+    The columns stay in server rank order. sort() only rearranges a
+    permutation of row numbers, and wins descending is the server's own
+    order, so it needs none.
+    """
+
+    HEADERS = ("Username", "Meows")
+    USERNAME, WINS = range(2)
+    PAGE_SIZE = 200
+
+    def __init__(self, cache, page_size=PAGE_SIZE, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.page_size = page_size
+        self._usernames = []
+        self._wins = array('l')
+        self._order = None  # view row -> stored row while sorted differently from the server
+        self._sort_column = self.WINS
+        self._sort_order = Qt.DescendingOrder
+        self._pending = set()
+        self._exhausted = False
+        cache.updated.connect(self._on_page)
+        cache.refresh_failed.connect(self._on_page_failed)
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._usernames)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            row = self._stored_row(index.row())
+            return self._usernames[row] if index.column() == self.USERNAME else self._wins[row]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted and len(self._usernames) not in self._pending
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Load the next page: cached rows at once, fresh ones when the cache's refresh lands."""
+        offset = len(self._usernames)
+        self._pending.add(offset)
+        rows = self.cache.get(offset, self.page_size)
+        if rows:
+            self._apply_page(offset, rows)
+        elif not self.cache.is_stale(offset, self.page_size):
+            # A fresh, empty page: the leaderboard ends here
+            self._pending.discard(offset)
+            self._exhausted = True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column, self._sort_order = column, order
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        stored = [self._stored_row(index.row()) for index in persistent]
+        self._resort()
+        if persistent:
+            view_rows = self._view_rows()
+            self.changePersistentIndexList(
+                persistent, [self.index(view_rows[row], index.column()) for row, index in zip(stored, persistent)])
+        self.layoutChanged.emit()
+
+    # Loading and updates
+
+    def refresh(self):
+        """Revalidate every loaded page; changes arrive as in-place updates."""
+        for offset in range(0, len(self._usernames), self.page_size):
+            self.cache.get(offset, self.page_size)
+
+    def reload(self):
+        """Forget every row; the view fetches the first page again."""
+        self.beginResetModel()
+        self._usernames = []
+        self._wins = array('l')
+        self._order = None
+        self._pending.clear()
+        self._exhausted = False
+        self.endResetModel()
+
+    def detach(self):
+        """Stop listening to the cache (when the screen closes)."""
+        for signal, slot in ((self.cache.updated, self._on_page), (self.cache.refresh_failed, self._on_page_failed)):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass  # Already disconnected
+
+    def _on_page(self, offset, count, rows):
+        if count == self.page_size and offset % self.page_size == 0:
+            self._apply_page(offset, rows)
+
+    def _on_page_failed(self, offset, count):
+        if count == self.page_size:
+            self._pending.discard(offset)
+
+    def _apply_page(self, offset, rows):
+        self._pending.discard(offset)
+        loaded = len(self._usernames)
+        if offset > loaded:
+            return  # Not contiguous with what is loaded; fetchMore will ask for it again
+
+        overlap = min(len(rows), loaded - offset)
+        first_changed = last_changed = None
+        for i in range(overlap):
+            row, entry = offset + i, rows[i]
+            if self._usernames[row] != entry.username or self._wins[row] != entry.wins:
+                self._usernames[row] = entry.username
+                self._wins[row] = entry.wins
+                first_changed = row if first_changed is None else first_changed
+                last_changed = row
+
+        new_rows = rows[overlap:]
+        if new_rows:
+            self.beginInsertRows(QModelIndex(), loaded, loaded + len(new_rows) - 1)
+            self._usernames.extend(entry.username for entry in new_rows)
+            self._wins.extend(entry.wins for entry in new_rows)
+            if self._order is not None:
+                self._order.extend(range(loaded, loaded + len(new_rows)))
+            self.endInsertRows()
+        end = offset + len(rows)
+        if len(rows) < self.page_size and end < len(self._usernames):
+            self._truncate(end)
+        if len(rows) < self.page_size:
+            self._exhausted = True
+
+        if self._order is not None and (new_rows or first_changed is not None):
+            self.sort(self._sort_column, self._sort_order)
+        elif first_changed is not None:
+            self.dataChanged.emit(self.index(first_changed, 0), self.index(last_changed, len(self.HEADERS) - 1))
+
+    def _truncate(self, length):
+        """Drop the stored rows from length on."""
+        if self._order is None:
+            self.beginRemoveRows(QModelIndex(), length, len(self._usernames) - 1)
+            del self._usernames[length:]
+            del self._wins[length:]
+            self.endRemoveRows()
+            return
+        # Sorted: the dropped rows are scattered through the view, so relayout
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        stored = [self._stored_row(index.row()) for index in persistent]
+        del self._usernames[length:]
+        del self._wins[length:]
+        self._resort()
+        view_rows = self._view_rows()
+        self.changePersistentIndexList(
+            persistent, [self.index(view_rows[row], index.column()) if row < length else QModelIndex()
+                         for row, index in zip(stored, persistent)])
+        self.layoutChanged.emit()
+
+    def _resort(self):
+        if self._sort_column == self.WINS and self._sort_order == Qt.DescendingOrder:
+            self._order = None  # Server rank order
+            return
+        if self._sort_column == self.WINS:
+            # A stable sort keeps tied players in rank order
+            key = self._wins.__getitem__
+        else:
+            folded = [name.casefold() for name in self._usernames]
+            key = folded.__getitem__
+        self._order = array('l', sorted(range(len(self._usernames)), key=key,
+                                        reverse=self._sort_order == Qt.DescendingOrder))
+
+    def _stored_row(self, view_row):
+        return self._order[view_row] if self._order is not None else view_row
+
+    def _view_rows(self):
+        if self._order is None:
+            return range(len(self._usernames))
+        view_rows = array('l', [0]) * len(self._order)
+        for view_row, row in enumerate(self._order):
+            view_rows[row] = view_row
+        return view_rows
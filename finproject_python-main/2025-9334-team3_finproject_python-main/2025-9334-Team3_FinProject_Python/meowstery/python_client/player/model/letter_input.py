@@ -0,0 +1,120 @@
+import logging
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from PyQt5.QtCore import QTimer
+
+from meowstery.python_client.player.model.tracing import get_tracer
+
+
+logger = logging.getLogger(__name__)
+
+
+class LetterInputQueue:
+    """Filters and orders letter guesses from clicks and the physical keyboard before the controller sees them.
+
+    offer() drops anything that is not A-Z and letters already taken this
+    round. Accepted letters are queued and handed to the handler in order
+    on the next event loop turn, so a burst of keys costs one pass (and one
+    repaint) instead of one per key. A letter stays taken until
+    release() (the server rejected it) or reset() (new round); one the
+    handler did not apply (e.g. between rounds) is released at once.
+
+    Every input is timestamped; applied() closes the measurement when the
+    key shows the guess, and stats() reports those input latencies. Each
+    accepted letter also opens a "guess" trace, active while the handler
+    runs, which the word display finishes once it has repainted.
+    """
+
+    def __init__(self, handler: Optional[Callable[[str], None]] = None, max_samples=200):
+        self.handler = handler
+        self._queue = deque()
+        self._taken = set()
+        self._typed_at: Dict[str, float] = {}
+        self._traces = {}
+        self._drain_scheduled = False
+        self._latencies_ms = deque(maxlen=max_samples)
+        self.accepted = 0
+        self.dropped = 0
+
+    def set_handler(self, handler: Callable[[str], None]):
+        self.handler = handler
+
+    def offer(self, letter, received_at: Optional[float] = None) -> bool:
+        """Queue letter unless it is invalid or already taken; received_at is a perf_counter() time."""
+        letter = (letter or "").upper()
+        if len(letter) != 1 or not 'A' <= letter <= 'Z' or letter in self._taken:
+            self.dropped += 1
+            return False
+        self._taken.add(letter)
+        self._typed_at[letter] = received_at if received_at is not None else time.perf_counter()
+        self._traces[letter] = get_tracer().start("guess", key=letter, started=self._typed_at[letter], letter=letter)
+        self._queue.append(letter)
+        self.accepted += 1
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            QTimer.singleShot(0, self._drain)
+        return True
+
+    def release(self, letter):
+        """Let letter be guessed again."""
+        letter = letter.upper()
+        self._taken.discard(letter)
+        self._typed_at.pop(letter, None)
+
+    def applied(self, letter):
+        """The guess of letter is visible; records its input latency."""
+        typed_at = self._typed_at.pop(letter.upper(), None)
+        if typed_at is not None:
+            self._latencies_ms.append((time.perf_counter() - typed_at) * 1000.0)
+
+    def reset(self):
+        """New round: every letter can be guessed again and queued input is dropped."""
+        self.dropped += len(self._queue)
+        self._queue.clear()
+        self._taken.clear()
+        self._typed_at.clear()
+        for trace in self._traces.values():
+            trace.cancel()
+        self._traces.clear()
+
+    def stats(self):
+        latencies = sorted(self._latencies_ms)
+
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else None
+
+        return {
+            "accepted": self.accepted,
+            "dropped": self.dropped,
+            "queued": len(self._queue),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "max_ms": latencies[-1] if latencies else None,
+        }
+
+    def _drain(self):
+        self._drain_scheduled = False
+        while self._queue:
+            letter = self._queue.popleft()
+            trace = self._traces.pop(letter, None)
+            if trace is not None:
+                trace.add_span("input.queued", trace.started, time.perf_counter())
+            try:
+                if self.handler is not None:
+                    if trace is not None:
+                        with trace.activate():
+                            self.handler(letter)
+                    else:
+                        self.handler(letter)
+            except Exception as e:
+                logger.warning("Letter '%s' handler failed: %s", letter, e)
+            if letter in self._typed_at:
+                # Not shown as guessed, so the handler turned it away
+                self.release(letter)
+                if trace is not None:
+                    trace.cancel()
+            elif trace is not None:
+                # Finishes now, or after the word display repaints the letters it revealed
+                trace.settle()
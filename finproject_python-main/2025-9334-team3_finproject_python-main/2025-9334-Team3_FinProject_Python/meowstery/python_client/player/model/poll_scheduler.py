@@ -0,0 +1,256 @@
+import heapq
+import itertools
+import logging
+import random
+import time
+from typing import Callable, Dict, Optional
+
+from PyQt5.QtCore import QObject, QTimer
+
+
+logger = logging.getLogger(__name__)
+
+
+class PollLoop:
+    """One periodic remote check, scheduled by the shared PollScheduler.
+
+    Keeps the start/stop/isActive/setInterval surface of the QTimer it
+    replaces. On top of that the interval adapts:
+
+    - the first run is immediate; every later delay gets +/- jitter so
+      clients that joined together drift apart;
+    - set_floor() stretches it (e.g. while push events cover the same data);
+    - expect_at() polls at fast_ms around a moment something is due, such as
+      a round start, and sleeps until that window opens;
+    - report_error() backs off exponentially, with full jitter, until
+      report_success(). A callback that raises counts as an error, so a
+      callback that catches its own errors must report both itself.
+    """
+
+    def __init__(self, scheduler, name, callback: Callable[[], None], interval_ms,
+                 jitter=0.15, max_backoff_ms=30000):
+        self.scheduler = scheduler
+        self.name = name
+        self.callback = callback
+        self.interval_ms = interval_ms
+        self.jitter = jitter
+        self.max_backoff_ms = max_backoff_ms
+        self.floor_ms = 0
+        self.expected_at = None
+        self.fast_ms = 250
+        self.window_seconds = 2.0
+        self.errors_in_row = 0
+
+        self.active = False
+        self.generation = 0
+        self.due = None
+        self.removed = False
+        self.refused_starts = 0
+
+        self.runs = 0
+        self.errors = 0
+        self.callback_seconds = 0.0
+        self.lateness_seconds = 0.0
+        self.last_delay_ms = None
+
+    # QTimer-compatible surface
+
+    def start(self, interval_ms=None):
+        """Start (or restart) the loop with a run right away; jitter applies from the second run on."""
+        if interval_ms is not None:
+            self.interval_ms = interval_ms
+        if self.removed:
+            # Its owner is gone; nothing would ever stop it again
+            self.refused_starts += 1
+            logger.error("Poll loop %s started after it was removed; not scheduled", self.name)
+            return
+        self.active = True
+        self.scheduler._schedule(self, 0)
+
+    def stop(self):
+        self.active = False
+        self.generation += 1
+        self.due = None
+
+    def isActive(self):
+        return self.active
+
+    def setInterval(self, interval_ms):
+        self.interval_ms = interval_ms
+        if self.active:
+            self.scheduler._schedule(self, self.next_delay_ms())
+
+    def interval(self):
+        return self.interval_ms
+
+    # Adaptation
+
+    def set_floor(self, floor_ms):
+        """Never poll more often than floor_ms outside an expect_at() window (0 removes the floor)."""
+        if floor_ms != self.floor_ms:
+            self.floor_ms = floor_ms
+            if self.active:
+                self.scheduler._schedule(self, self.next_delay_ms())
+
+    def expect_at(self, when: Optional[float], fast_ms=250, window_seconds=2.0):
+        """Poll every fast_ms from window_seconds before the wall-clock time when until as long after it."""
+        self.expected_at = when
+        self.fast_ms = fast_ms
+        self.window_seconds = window_seconds
+        if self.active and when is not None:
+            delay = self.next_delay_ms()
+            if self.due is None or time.monotonic() + delay / 1000.0 < self.due:
+                self.scheduler._schedule(self, delay)
+
+    def report_error(self):
+        self.errors += 1
+        self.errors_in_row += 1
+
+    def report_success(self):
+        self.errors_in_row = 0
+
+    def next_delay_ms(self):
+        base = self._base_ms()
+        if self.errors_in_row:
+            ceiling = min(self.max_backoff_ms, base * (2 ** self.errors_in_row))
+            delay = random.uniform(base, max(base, ceiling))
+        else:
+            delay = base * random.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+        return self._fit_expectation(delay, time.time())
+
+    def _base_ms(self):
+        return max(self.interval_ms, self.floor_ms)
+
+    def _fit_expectation(self, delay_ms, now):
+        if self.expected_at is None or self.errors_in_row:
+            return delay_ms
+        opens = self.expected_at - self.window_seconds
+        closes = self.expected_at + self.window_seconds
+        if now > closes:
+            self.expected_at = None
+            return delay_ms
+        if now < opens:
+            return min(delay_ms, (opens - now) * 1000.0)
+        return min(delay_ms, self.fast_ms)
+
+    def stats(self):
+        return {
+            "active": self.active,
+            "interval_ms": self._base_ms(),
+            "last_delay_ms": round(self.last_delay_ms, 1) if self.last_delay_ms is not None else None,
+            "runs": self.runs,
+            "errors": self.errors,
+            "errors_in_row": self.errors_in_row,
+            "mean_callback_ms": self.callback_seconds * 1000.0 / self.runs if self.runs else 0.0,
+            "mean_lateness_ms": self.lateness_seconds * 1000.0 / self.runs if self.runs else 0.0,
+        }
+
+
+class PollScheduler(QObject):
+    """Runs every PollLoop of the client from one single-shot QTimer, armed for the earliest due loop.
+
+    Also measures its own overhead (time spent scheduling, excluding the
+    callbacks) so the cost of the machinery stays visible.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_due)
+        self._loops: Dict[str, PollLoop] = {}
+        self._heap = []
+        self._sequence = itertools.count()
+        self.ticks = 0
+        self.overhead_seconds = 0.0
+
+    def loop(self, name, callback, interval_ms, **options) -> PollLoop:
+        """Create the named loop (stopped), replacing and stopping any loop of the same name."""
+        old = self._loops.get(name)
+        if old is not None:
+            old.stop()
+            old.removed = True
+        loop = self._loops[name] = PollLoop(self, name, callback, interval_ms, **options)
+        return loop
+
+    def get(self, name) -> Optional[PollLoop]:
+        return self._loops.get(name)
+
+    def remove(self, name):
+        """Stop and forget the loop; starting it again is refused."""
+        loop = self._loops.pop(name, None)
+        if loop is not None:
+            loop.stop()
+            loop.removed = True
+
+    def remove_prefix(self, prefix):
+        """Stop and forget every loop whose name starts with prefix (one controller's loops)."""
+        for name in [n for n in self._loops if n.startswith(prefix)]:
+            self.remove(name)
+
+    def active_loops(self):
+        return [name for name, loop in self._loops.items() if loop.active]
+
+    def _schedule(self, loop, delay_ms):
+        loop.generation += 1
+        loop.last_delay_ms = delay_ms
+        loop.due = time.monotonic() + max(0.0, delay_ms) / 1000.0
+        heapq.heappush(self._heap, (loop.due, next(self._sequence), loop.generation, loop))
+        self._rearm()
+
+    def _rearm(self):
+        # Drop entries superseded by a stop or reschedule
+        while self._heap and self._heap[0][2] != self._heap[0][3].generation:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            self._timer.stop()
+            return
+        delay_ms = max(0, int((self._heap[0][0] - time.monotonic()) * 1000))
+        self._timer.start(delay_ms)
+
+    def _run_due(self):
+        started = time.perf_counter()
+        callbacks = 0.0
+        now = time.monotonic()
+        due = []
+        while self._heap and self._heap[0][0] <= now + 0.002:
+            _, _, generation, loop = heapq.heappop(self._heap)
+            if generation == loop.generation and loop.active:
+                due.append((loop, generation))
+
+        for loop, generation in due:
+            loop.runs += 1
+            loop.lateness_seconds += max(0.0, now - loop.due)
+            call_started = time.perf_counter()
+            try:
+                loop.callback()
+            except Exception as e:
+                loop.report_error()
+                logger.warning("Poll loop %s failed: %s", loop.name, e)
+            callbacks += time.perf_counter() - call_started
+            # The callback may have stopped, restarted or rescheduled its own loop
+            if loop.active and loop.generation == generation:
+                self._schedule(loop, loop.next_delay_ms())
+
+        self._rearm()
+        self.ticks += 1
+        self.overhead_seconds += (time.perf_counter() - started) - callbacks
+
+    def stats(self):
+        return {
+            "ticks": self.ticks,
+            "overhead_ms": self.overhead_seconds * 1000.0,
+            "overhead_us_per_tick": self.overhead_seconds * 1e6 / self.ticks if self.ticks else 0.0,
+            "loops": {name: loop.stats() for name, loop in self._loops.items()},
+        }
+
+
+_scheduler = None
+
+
+def get_poll_scheduler() -> PollScheduler:
+    """The client's PollScheduler; create it from the GUI thread."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = PollScheduler()
+    return _scheduler
@@ -0,0 +1,205 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional
+
+from omniORB import CORBA
+
+
+logger = logging.getLogger(__name__)
+
+# Formats tried after datetime.fromisoformat, e.g. for fractions that are not 3 or 6 digits
+SERVER_TIME_FORMATS = ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S")
+
+
+def _parse(text):
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        pass
+    for fmt in SERVER_TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).timestamp()
+        except ValueError:
+            continue
+    logger.warning("Could not parse server time '%s'", text)
+    return None
+
+
+@lru_cache(maxsize=256)
+def parse_server_time(text) -> Optional[float]:
+    """Server timestamp string -> epoch seconds (None if empty or unparseable).
+
+    Cached: round and session start times are asked for on every poll but
+    only change once per round.
+    """
+    if not text:
+        return None
+    return _parse(text)
+
+
+class ClockOffsetEstimator:
+    """NTP-style estimate of the server clock relative to the local monotonic clock.
+
+    A sample brackets one server timestamp between the local send and
+    receive times of the call that returned it: the offset is the timestamp
+    minus the midpoint, and it is wrong by at most half the round trip. The
+    estimate is the sample with the shortest round trip among the last
+    window samples, as in NTP's clock filter, because a fast reply leaves
+    the least room for asymmetric delays.
+
+    Until a sample arrives, or if the server does not implement
+    getServerTime, the local wall clock stands in for the server's.
+    """
+
+    def __init__(self, window=8, burst=4, resample_seconds=30.0):
+        self.window = window
+        self.burst = burst
+        self.resample_seconds = resample_seconds
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=window)
+        self._best = None
+        self._last_sample_at = None
+        self._local_offset = time.time() - time.monotonic()
+        self.supported = True
+
+    def add_sample(self, sent, server_time, received):
+        """Record one call: monotonic send time, server epoch seconds, monotonic receive time."""
+        round_trip = received - sent
+        if server_time is None or round_trip < 0:
+            return
+        sample = (round_trip, server_time - (sent + received) / 2.0)
+        with self._lock:
+            self._samples.append(sample)
+            self._best = min(self._samples)
+            self._last_sample_at = received
+
+    def wants_sample(self):
+        """True while the first burst is incomplete or the newest sample is older than resample_seconds."""
+        if not self.supported:
+            return False
+        with self._lock:
+            if len(self._samples) < self.burst:
+                return True
+            return time.monotonic() - self._last_sample_at >= self.resample_seconds
+
+    def measure(self, game_service):
+        """Sample the offset with one getServerTime call; call it from a worker thread."""
+        sent = time.monotonic()
+        try:
+            server_time = game_service.getServerTime()
+        except (CORBA.BAD_OPERATION, CORBA.NO_IMPLEMENT):
+            self.supported = False
+            logger.info("Server has no getServerTime; round clocks use the local clock")
+            return
+        self.add_sample(sent, _parse(server_time) if server_time else None, time.monotonic())
+
+    def offset(self):
+        """Seconds to add to time.monotonic() to get server epoch time."""
+        with self._lock:
+            return self._best[1] if self._best is not None else self._local_offset
+
+    def uncertainty(self):
+        """Half the best round trip in seconds, or None before the first sample."""
+        with self._lock:
+            return self._best[0] / 2.0 if self._best is not None else None
+
+    def server_now(self):
+        return time.monotonic() + self.offset()
+
+    def to_local(self, server_time):
+        """Convert a server epoch time to the local wall clock (for PollLoop.expect_at)."""
+        return time.time() + (server_time - self.server_now())
+
+    def stats(self):
+        with self._lock:
+            best = self._best
+            samples = len(self._samples)
+        return {
+            "samples": samples,
+            "offset_ms": (best[1] - self._local_offset) * 1000.0 if best else 0.0,
+            "uncertainty_ms": best[0] * 500.0 if best else None,
+            "supported": self.supported,
+        }
+
+
+class RoundClock:
+    """The current round's countdown in server time; every game timer reads it.
+
+    Start times are taken from the server's round start timestamps (parsed
+    once per round), so clients that saw the round start at different
+    moments still agree on when it ends. Runs on the monotonic clock, so a
+    local clock change mid-round does not move the deadline.
+    """
+
+    def __init__(self, estimator: ClockOffsetEstimator, duration_seconds=30):
+        self.estimator = estimator
+        self.duration_seconds = duration_seconds
+        self.round_number = None
+        self.start = None
+        self._round_starts: Dict[int, float] = {}
+
+    def round_start(self, round_number, start_text) -> Optional[float]:
+        """Server epoch start of round_number from its timestamp string, remembered for the round."""
+        start = self._round_starts.get(round_number)
+        if start is None:
+            start = parse_server_time(start_text)
+            if start is not None:
+                self._round_starts[round_number] = start
+        return start
+
+    def start_round(self, round_number, start_text="", duration_seconds=None):
+        """Start counting round_number down; from now if the server's start time is not known yet."""
+        if duration_seconds is not None:
+            self.duration_seconds = duration_seconds
+        start = self.round_start(round_number, start_text)
+        self.round_number = round_number
+        self.start = start if start is not None else self.now()
+
+    def stop(self):
+        self.start = None
+
+    def now(self):
+        return self.estimator.server_now()
+
+    def seconds_until(self, server_time):
+        return server_time - self.now()
+
+    def elapsed(self):
+        return self.now() - self.start if self.start is not None else 0.0
+
+    def remaining(self):
+        if self.start is None:
+            return float(self.duration_seconds)
+        # Clamped both ways: a start slightly in the future must not show more than a full round
+        return min(float(self.duration_seconds), max(0.0, self.duration_seconds - self.elapsed()))
+
+    def remaining_display(self):
+        """Whole seconds to show; only reaches 0 when the round is over."""
+        return math.ceil(self.remaining())
+
+    def expired(self):
+        return self.start is not None and self.remaining() <= 0.0
+
+    def ms_to_next_tick(self):
+        """Milliseconds until the displayed second changes, so the last tick lands on the deadline."""
+        remaining = self.remaining()
+        fraction = remaining - math.floor(remaining)
+        return max(1, int(math.ceil((fraction or 1.0) * 1000)))
+
+
+_estimator = None
+_estimator_lock = threading.Lock()
+
+
+def get_clock_estimator() -> ClockOffsetEstimator:
+    """Process-wide estimator; every game talks to the same server clock."""
+    global _estimator
+    with _estimator_lock:
+        if _estimator is None:
+            _estimator = ClockOffsetEstimator()
+        return _estimator
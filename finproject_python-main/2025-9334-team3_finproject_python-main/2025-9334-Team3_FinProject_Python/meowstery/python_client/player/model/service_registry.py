@@ -0,0 +1,279 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from omniORB import CORBA
+import CosNaming
+
+from meowstery.python_client.config.config_reader import load_orb_config
+
+
+logger = logging.getLogger(__name__)
+
+
+ORB_OPTIONS = [
+    "-ORBclientCallTimeOutPeriod", "10000",  # 10 second timeout
+    "-ORBconnectTimeOutPeriod", "10000",  # 10 second connection timeout
+    "-ORBgiopMaxMsgSize", "209715200",
+]
+
+
+# System exceptions worth retrying after a pause: the server or network is briefly unavailable
+RETRYABLE_CORBA_ERRORS = (CORBA.TRANSIENT, CORBA.COMM_FAILURE, CORBA.TIMEOUT)
+
+
+class ServiceProxy:
+    """Forwards calls to the registry's cached reference for one service.
+
+    On CORBA.TRANSIENT only this service's reference is dropped and
+    re-resolved; the call is retried once, and only if it never reached
+    the server (COMPLETED_NO).
+    """
+
+    def __init__(self, registry, name, interface):
+        self._registry = registry
+        self._name = name
+        self._interface = interface
+
+    @property
+    def service_name(self):
+        return self._name
+
+    def __getattr__(self, attr):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        target = getattr(self._registry.reference(self._name, self._interface), attr)
+        if not callable(target):
+            return target
+
+        def call(*args):
+            started = time.perf_counter()
+            error = None
+            try:
+                try:
+                    return getattr(self._registry.reference(self._name, self._interface), attr)(*args)
+                except CORBA.TRANSIENT as e:
+                    logger.debug("TRANSIENT on %s.%s, re-resolving %s", self._name, attr, self._name)
+                    self._registry.invalidate(self._name)
+                    # The server may already have run a call that did not complete cleanly; never send it twice
+                    if e.completed != CORBA.COMPLETED_NO:
+                        raise
+                    return getattr(self._registry.reference(self._name, self._interface), attr)(*args)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                self._registry.notify_call(self._name, attr, time.perf_counter() - started, error)
+
+        call.__name__ = attr
+        return call
+
+    def __repr__(self):
+        return f"<ServiceProxy {self._name}>"
+
+
+class ServiceRegistry:
+    """Process-wide owner of the ORB, the naming context and narrowed service references."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._orb = None
+        self._naming_context = None
+        self._host = None
+        self._port = None
+        self._references = {}
+        self._proxies = {}
+        self._pending = {}
+        self._executor = None
+        self._root_poa = None
+        self._call_observers = []
+
+    def configure(self, host, port):
+        """Point the registry at a naming service, dropping references from a previous one."""
+        with self._lock:
+            host, port = str(host), str(port)
+            if (host, port) != (self._host, self._port):
+                self._host, self._port = host, port
+                self._naming_context = None
+                self._references.clear()
+
+    @property
+    def endpoint(self):
+        with self._lock:
+            if self._host is None:
+                host, port = load_orb_config()
+                self._host, self._port = str(host), str(port)
+            return self._host, self._port
+
+    @property
+    def orb(self):
+        with self._lock:
+            if self._orb is None:
+                host, port = self.endpoint
+                orb_args = ["-ORBInitRef", f"NameService=corbaloc::{host}:{port}/NameService"] + ORB_OPTIONS
+                logger.info("Initializing ORB with args: %s", orb_args)
+                self._orb = CORBA.ORB_init(orb_args, CORBA.ORB_ID)
+            return self._orb
+
+    def root_poa(self):
+        """Return the RootPOA with its manager active, for client-side callback servants."""
+        with self._lock:
+            if self._root_poa is None:
+                poa = self.orb.resolve_initial_references("RootPOA")
+                poa._get_the_POAManager().activate()
+                self._root_poa = poa
+            return self._root_poa
+
+    def naming_context(self):
+        with self._lock:
+            if self._naming_context is None:
+                host, port = self.endpoint
+                obj = self.orb.string_to_object(f"corbaloc::{host}:{port}/NameService")
+                # Unchecked: a checked narrow costs an extra _is_a round-trip.
+                naming_context = obj._unchecked_narrow(CosNaming.NamingContext)
+                if naming_context is None:
+                    raise RuntimeError("Failed to narrow Naming Service")
+                self._naming_context = naming_context
+            return self._naming_context
+
+    def connect(self, host, port):
+        """Configure the endpoint and check the naming service answers."""
+        self.configure(host, port)
+        naming_context = self.naming_context()
+        if naming_context._non_existent():
+            raise RuntimeError(f"Naming service at {host}:{port} does not exist")
+        return naming_context
+
+    def reference(self, name, interface):
+        """Return the cached narrowed reference for name, resolving it on first use."""
+        with self._lock:
+            cached = self._references.get(name)
+        if cached is not None:
+            return cached
+
+        naming_context = self.naming_context()
+        resolved_obj = naming_context.resolve([CosNaming.NameComponent(name, "")])
+        narrowed = resolved_obj._narrow(interface)
+        if narrowed is None:
+            raise RuntimeError(f"Failed to narrow {name}")
+
+        with self._lock:
+            return self._references.setdefault(name, narrowed)
+
+    def proxy(self, name, interface):
+        with self._lock:
+            proxy = self._proxies.get(name)
+            if proxy is None:
+                proxy = self._proxies[name] = ServiceProxy(self, name, interface)
+            return proxy
+
+    def add_call_observer(self, observer):
+        """observer(service_name, operation, seconds, error_or_None) runs after every proxied call."""
+        with self._lock:
+            self._call_observers = self._call_observers + [observer]
+
+    def remove_call_observer(self, observer):
+        with self._lock:
+            self._call_observers = [o for o in self._call_observers if o is not observer]
+
+    def notify_call(self, name, operation, seconds, error):
+        for observer in self._call_observers:
+            try:
+                observer(name, operation, seconds, error)
+            except Exception as e:
+                logger.warning("Call observer failed: %s", e)
+
+    def is_resolved(self, name):
+        with self._lock:
+            return name in self._references
+
+    def invalidate(self, name):
+        """Forget one service reference so the next call re-resolves it."""
+        with self._lock:
+            self._references.pop(name, None)
+
+    def reset(self):
+        """Forget the naming context and every reference, keeping the ORB."""
+        with self._lock:
+            self._naming_context = None
+            self._references.clear()
+            self._pending.clear()
+
+    def resolve(self, name, interface, max_retries=3, retry_delay=2):
+        """Resolve name with retries and return a proxy for it."""
+        for attempt in range(max_retries):
+            try:
+                self.reference(name, interface)
+                return self.proxy(name, interface)
+            except CosNaming.NamingContext.NotFound:
+                logger.warning("Service %s not found in naming service (attempt %s/%s)",
+                               name, attempt + 1, max_retries)
+                error = RuntimeError(
+                    f"Service {name} not found in naming service after {max_retries} attempts. "
+                    f"Please check if the server is running.")
+            except (CORBA.TRANSIENT, CORBA.COMM_FAILURE, CORBA.OBJECT_NOT_EXIST) as e:
+                host, port = self.endpoint
+                logger.warning("Naming service at %s:%s unreachable (attempt %s/%s): %s",
+                               host, port, attempt + 1, max_retries, e)
+                with self._lock:
+                    self._naming_context = None
+                error = RuntimeError(
+                    f"Could not connect to CORBA naming service at {host}:{port} after {max_retries} attempts. "
+                    f"Please check if the server is running and the naming service is started.")
+            except Exception as e:
+                logger.warning("Error resolving service %s (attempt %s/%s): %s", name, attempt + 1, max_retries, e)
+                error = RuntimeError(f"Error resolving service {name} after {max_retries} attempts: {e}")
+
+            if attempt < max_retries - 1:
+                time.sleep(retry_delay)
+        raise error
+
+    def resolve_async(self, name, interface, max_retries=3, retry_delay=2):
+        """Resolve name on the registry's thread pool and return a Future for its proxy.
+
+        Concurrent requests for the same service share one in-flight resolution.
+        """
+        with self._lock:
+            if name in self._references:
+                future = Future()
+                future.set_result(self.proxy(name, interface))
+                return future
+            future = self._pending.get(name)
+            if future is not None and not future.done():
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="corba-resolve")
+            # Create the ORB on the calling thread so workers never race to initialize it.
+            self.orb
+            future = self._executor.submit(self.resolve, name, interface, max_retries, retry_delay)
+            self._pending[name] = future
+            return future
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            self._pending.clear()
+            if self._orb is not None:
+                try:
+                    self._orb.destroy()
+                except Exception as e:
+                    logger.warning("Error destroying ORB: %s", e)
+            self._orb = None
+            self._root_poa = None
+            self._naming_context = None
+            self._references.clear()
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ServiceRegistry()
+        return _registry
@@ -0,0 +1,105 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from omniORB import CORBA
+
+import service
+
+
+logger = logging.getLogger(__name__)
+
+
+class GameSessionCache:
+    """gameId -> GameSession lookups shared by the lobby and game controllers.
+
+    Within ttl_seconds every lookup is served from one fetch. Servers that
+    implement GameManagerService.getGameSession are asked for the single
+    session; older servers fall back to one listActiveGameSessions download
+    that refreshes every entry at once.
+
+    game_manager_service may also be a zero-argument callable, looked up on
+    every call, for a service that is still being resolved.
+    """
+
+    DEFAULT_TTL_SECONDS = 0.9  # Just under one poll tick, so each tick fetches at most once
+
+    def __init__(self, game_manager_service, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._game_manager_service = game_manager_service
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, object] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._listed_at = None
+        self._stale = set()
+        self._supports_get_session = None  # Unknown until the first call
+
+    @property
+    def game_manager_service(self):
+        source = self._game_manager_service
+        return source() if callable(source) else source
+
+    def get(self, game_id: str, max_age: Optional[float] = None):
+        """Return the GameSession for game_id, or None if the server has no such session."""
+        if not game_id or not self.game_manager_service:
+            return None
+        max_age = self.ttl_seconds if max_age is None else max_age
+
+        with self._lock:
+            if self._is_fresh(game_id, time.monotonic(), max_age):
+                return self._sessions.get(game_id)
+
+        if self._supports_get_session is not False:
+            try:
+                session = self.game_manager_service.getGameSession(game_id)
+                self._supports_get_session = True
+                self._store(game_id, session)
+                return session
+            except service.GameNotFound:
+                self._supports_get_session = True
+                self._store(game_id, None)
+                return None
+            except (CORBA.BAD_OPERATION, CORBA.NO_IMPLEMENT) as e:
+                logger.debug("getGameSession not supported by server, using session list: %s", e)
+                self._supports_get_session = False
+
+        self.refresh()
+        with self._lock:
+            return self._sessions.get(game_id)
+
+    def refresh(self):
+        """Download every active session and replace the cached view."""
+        sessions = self.game_manager_service.listActiveGameSessions()
+        with self._lock:
+            self._sessions = {s.gameId: s for s in sessions}
+            self._fetched_at.clear()
+            self._stale.clear()
+            self._listed_at = time.monotonic()
+        return sessions
+
+    def invalidate(self, game_id: Optional[str] = None):
+        with self._lock:
+            if game_id is None:
+                self._fetched_at.clear()
+                self._listed_at = None
+            else:
+                self._fetched_at.pop(game_id, None)
+                self._stale.add(game_id)
+
+    def _is_fresh(self, game_id, now, max_age):
+        if game_id in self._stale:
+            return False
+        fetched_at = self._fetched_at.get(game_id)
+        if fetched_at is not None and now - fetched_at <= max_age:
+            return True
+        return self._listed_at is not None and now - self._listed_at <= max_age
+
+    def _store(self, game_id, session):
+        with self._lock:
+            if session is None:
+                self._sessions.pop(game_id, None)
+            else:
+                self._sessions[game_id] = session
+            self._fetched_at[game_id] = time.monotonic()
+            self._stale.discard(game_id)
@@ -0,0 +1,194 @@
+import logging
+import os
+import weakref
+from typing import Callable, Dict, List, Optional
+
+from PyQt5.QtCore import Qt, QTimer
+
+from meowstery.python_client.player.model.poll_scheduler import PollLoop, get_poll_scheduler
+
+
+logger = logging.getLogger(__name__)
+
+# With MEOWSTERY_STRICT_TIMERS=1 a leaked timer raises instead of only being logged
+STRICT_TIMERS = os.environ.get("MEOWSTERY_STRICT_TIMERS", "").lower() in ("1", "true", "yes")
+
+
+class TimerLeakError(RuntimeError):
+    pass
+
+
+class TimerRegistry:
+    """Owns every QTimer, single-shot and poll loop of one controller.
+
+    Creating a timer under a name that is already registered stops and
+    deletes the old one, so restarting a phase cannot leave a twin firing in
+    the background. close() stops everything the controller owns and keeps
+    weak references to it; after that, any of it running again (or a poll
+    loop someone tried to restart) is a leak and is reported by check_leaks().
+    """
+
+    _all = weakref.WeakSet()
+
+    def __init__(self, owner: str):
+        self.owner = owner
+        self._timers: Dict[str, QTimer] = {}
+        self._loops: Dict[str, PollLoop] = {}
+        self._single_shots: List[QTimer] = []
+        self._closed_refs: List[tuple] = []  # (name, weakref) of everything close() let go of
+        self._prefix = f"{owner}:{id(self)}:"
+        self.closed = False
+        TimerRegistry._all.add(self)
+
+    def timer(self, name, callback: Callable, interval_ms: Optional[int] = None, single_shot=False,
+              precise=False) -> QTimer:
+        """Return a new stopped QTimer registered under name (replacing any previous one).
+
+        precise=True asks Qt for millisecond accuracy instead of the default
+        coarse timer, which may fire up to 5% of the interval late.
+        """
+        self._discard_timer(name)
+        timer = QTimer()
+        timer.setSingleShot(single_shot)
+        if precise:
+            timer.setTimerType(Qt.PreciseTimer)
+        if interval_ms is not None:
+            timer.setInterval(interval_ms)
+        timer.timeout.connect(callback)
+        self._timers[name] = timer
+        self._warn_if_closed(name)
+        return timer
+
+    def single_shot(self, delay_ms, callback: Callable):
+        """Tracked replacement for QTimer.singleShot; forgotten once it fires, stopped by close()."""
+        if self._warn_if_closed("single_shot"):
+            return None
+        timer = QTimer()
+        timer.setSingleShot(True)
+
+        def fire():
+            if timer in self._single_shots:
+                self._single_shots.remove(timer)
+            timer.deleteLater()
+            callback()
+
+        timer.timeout.connect(fire)
+        self._single_shots.append(timer)
+        timer.start(max(0, int(delay_ms)))
+        return timer
+
+    def poll_loop(self, name, callback: Callable, interval_ms, **options) -> PollLoop:
+        """Scheduler poll loop owned by this registry (replacing any previous loop under name)."""
+        loop = get_poll_scheduler().loop(self._prefix + name, callback, interval_ms, **options)
+        self._loops[name] = loop
+        self._warn_if_closed(name)
+        return loop
+
+    def stop(self, name):
+        timer = self._timers.get(name) or self._loops.get(name)
+        if timer is not None:
+            timer.stop()
+
+    def stop_all(self):
+        """Stop every timer, single-shot and poll loop; the registry stays usable."""
+        for timer in self._timers.values():
+            timer.stop()
+        for timer in self._single_shots:
+            timer.stop()
+            timer.deleteLater()
+        self._single_shots.clear()
+        for loop in self._loops.values():
+            loop.stop()
+
+    def close(self):
+        """Tear down for good: stop everything, free the QTimers and drop the poll loops.
+
+        Safe to call again; what an earlier close() let go of stays tracked.
+        """
+        refs = list(self._timers.items()) + list(self._loops.items())
+        refs += [("single_shot", timer) for timer in self._single_shots]
+        self._closed_refs.extend((name, weakref.ref(timer)) for name, timer in refs)
+        self.stop_all()
+        for name in list(self._timers):
+            self._discard_timer(name)
+        get_poll_scheduler().remove_prefix(self._prefix)
+        self._loops.clear()
+        self.closed = True
+
+    def live(self) -> List[str]:
+        """Names of timers and loops that are currently running."""
+        names = [name for name, timer in self._timers.items() if timer.isActive()]
+        names += [name for name, loop in self._loops.items() if loop.isActive()]
+        names += ["single_shot"] * sum(1 for timer in self._single_shots if timer.isActive())
+        return names + self._revived()
+
+    def _revived(self) -> List[str]:
+        # Things close() let go of that were started again since
+        names = []
+        for name, ref in self._closed_refs:
+            timer = ref()
+            if timer is None:
+                continue
+            try:
+                if timer.isActive() or getattr(timer, "refused_starts", 0):
+                    names.append(name)
+            except RuntimeError:
+                pass  # The QTimer's C++ object was already deleted
+        return names
+
+    def expect_idle(self, context):
+        """Report anything still running at a screen transition where this owner should be quiet."""
+        names = self.live()
+        if names:
+            _report_leak(f"{self.owner} still running {names} at {context}")
+        return names
+
+    def _discard_timer(self, name):
+        old = self._timers.pop(name, None)
+        if old is not None:
+            old.stop()
+            old.deleteLater()
+
+    def _warn_if_closed(self, name):
+        if self.closed:
+            _report_leak(f"{self.owner} created timer '{name}' after it was closed")
+            return True
+        return False
+
+
+_leaks_reported = 0
+
+
+def live_timers():
+    """{owner: [running timer names]} for every registry with something running."""
+    report = {}
+    for registry in list(TimerRegistry._all):
+        names = registry.live()
+        if names:
+            report.setdefault(registry.owner, []).extend(names)
+    return report
+
+
+def check_leaks(context=""):
+    """Report timers still running in closed registries; returns them. Raises in strict mode."""
+    leaks = {}
+    for registry in list(TimerRegistry._all):
+        names = registry.live() if registry.closed else []
+        if names:
+            leaks.setdefault(registry.owner, []).extend(names)
+    if leaks:
+        _report_leak(f"Timers survived {context or 'teardown'}: {leaks}")
+    return leaks
+
+
+def leaks_reported():
+    """How many leaks have been reported in this process (the load harness fails on any)."""
+    return _leaks_reported
+
+
+def _report_leak(message):
+    global _leaks_reported
+    _leaks_reported += 1
+    logger.error(message)
+    if STRICT_TIMERS:
+        raise TimerLeakError(message)
@@ -0,0 +1,300 @@
+import argparse
+import itertools
+import json
+import logging
+import math
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(values_ms):
+    values = sorted(values_ms)
+    return {
+        "count": len(values),
+        "p50_ms": percentile(values, 0.50),
+        "p95_ms": percentile(values, 0.95),
+        "p99_ms": percentile(values, 0.99),
+        "max_ms": values[-1] if values else 0.0,
+    }
+
+
+class Trace:
+    """One traced interaction, e.g. a guess from keypress to repainted word.
+
+    Spans record the work done for it on any thread. The trace finishes
+    when settle() has been called and every hold() has been released (a
+    repaint it waits for); the time from start to then is its latency.
+    mark() records how long after the start something later happened,
+    such as the server confirming the guess.
+    """
+
+    def __init__(self, tracer, name, key, started, args):
+        self.tracer = tracer
+        self.name = name
+        self.key = key
+        self.started = started
+        self.args = args
+        self.id = next(tracer._ids)
+        self.finished = None
+        self._holds = 0
+        self._settled = False
+
+    @contextmanager
+    def span(self, name, **args):
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_span(name, start, time.perf_counter(), **args)
+
+    def add_span(self, name, start, end, **args):
+        self.tracer._add_event(self, name, start, end, args)
+
+    @contextmanager
+    def activate(self):
+        """Make this the current trace of the calling thread (remote calls made meanwhile become spans)."""
+        local = self.tracer._local
+        previous = getattr(local, "trace", None)
+        local.trace = self
+        try:
+            yield self
+        finally:
+            local.trace = previous
+
+    def hold(self):
+        if self.finished is None:
+            with self.tracer._lock:
+                self._holds += 1
+
+    def release(self):
+        with self.tracer._lock:
+            self._holds = max(0, self._holds - 1)
+            done = self._settled and self._holds == 0
+        if done:
+            self.finish()
+
+    def settle(self):
+        """Nothing else will hold this trace; finish it once current holds are released."""
+        with self.tracer._lock:
+            self._settled = True
+            done = self._holds == 0
+        if done:
+            self.finish()
+
+    def finish(self):
+        if self.finished is not None:
+            return
+        self.finished = time.perf_counter()
+        self.tracer._add_event(self, self.name, self.started, self.finished, self.args)
+        self.tracer._forget(self)
+
+    def cancel(self):
+        """Drop the trace without recording it, e.g. for input that was turned away."""
+        if self.finished is None:
+            self.finished = time.perf_counter()
+            with self.tracer._lock:
+                if self.tracer._open.get((self.name, self.key)) is self:
+                    del self.tracer._open[(self.name, self.key)]
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.tracer.record(f"{self.name}.{name}", (now - self.started) * 1000.0)
+        self.tracer._add_instant(self, f"{self.name}.{name}", now)
+
+
+class Tracer:
+    """Collects traces as Chrome trace events and keeps rolling latency percentiles.
+
+    Registered as a ServiceRegistry call observer: a remote call made while
+    a trace is active on the calling thread becomes one of its spans.
+    Events are kept in a ring of max_events and figures over the last
+    window samples of each span or trace name.
+    """
+
+    def __init__(self, max_events=20000, window=500):
+        self.epoch = time.perf_counter()
+        self.started_at = time.time()
+        self.window = window
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+        self._events = deque(maxlen=max_events)
+        self._samples: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.window))
+        self._open: Dict[tuple, Trace] = {}
+        self._finished: Dict[tuple, Trace] = {}
+        self._thread_names: Dict[int, str] = {}
+
+    def __call__(self, service_name, operation, seconds, error):
+        trace = self.current()
+        if trace is not None:
+            end = time.perf_counter()
+            args = {"error": type(error).__name__} if error is not None else {}
+            trace.add_span(f"{service_name}.{operation}", end - seconds, end, **args)
+
+    def start(self, name, key=None, started: Optional[float] = None, **args) -> Trace:
+        """Open a trace; started is a perf_counter() time, e.g. when the input event arrived."""
+        trace = Trace(self, name, key, started if started is not None else time.perf_counter(), args)
+        with self._lock:
+            self._open[(name, key)] = trace
+        return trace
+
+    def find(self, name, key) -> Optional[Trace]:
+        """The latest trace started as (name, key), until the next one replaces it."""
+        with self._lock:
+            return self._open.get((name, key)) or self._finished.get((name, key))
+
+    def current(self) -> Optional[Trace]:
+        return getattr(self._local, "trace", None)
+
+    def span(self, name, **args):
+        """Span on the calling thread's current trace; does nothing without one."""
+        trace = self.current()
+        return trace.span(name, **args) if trace is not None else nullcontext()
+
+    def record(self, name, ms):
+        with self._lock:
+            self._samples[name].append(ms)
+
+    def percentiles(self):
+        """{name: {count, p50_ms, p95_ms, p99_ms, max_ms}} over the rolling window."""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+        return {name: summarize(values) for name, values in sorted(samples.items())}
+
+    def chrome_trace(self):
+        """The recorded events in Chrome trace-event format (chrome://tracing, Perfetto)."""
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._thread_names)
+        pid = os.getpid()
+        metadata = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                    for tid, name in threads.items()]
+        return {
+            "traceEvents": metadata + [dict(event, pid=pid) for event in events],
+            "displayTimeUnit": "ms",
+            "otherData": {"started_at": self.started_at, "percentiles": self.percentiles()},
+        }
+
+    def export(self, path):
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.chrome_trace(), f)
+        except OSError as e:
+            logger.warning("Could not write trace %s: %s", path, e)
+
+    def _forget(self, trace):
+        with self._lock:
+            key = (trace.name, trace.key)
+            if self._open.get(key) is trace:
+                del self._open[key]
+            # Still found for marks that arrive after the repaint, like the server's reply
+            self._finished[key] = trace
+            self._samples[trace.name].append((trace.finished - trace.started) * 1000.0)
+
+    def _add_event(self, trace, name, start, end, args):
+        tid = self._tid()
+        event = {"name": name, "cat": trace.name, "ph": "X", "tid": tid,
+                 "ts": (start - self.epoch) * 1e6, "dur": max(0.0, end - start) * 1e6,
+                 "args": dict(args, trace=trace.id)}
+        with self._lock:
+            self._events.append(event)
+            if name != trace.name:
+                self._samples[name].append((end - start) * 1000.0)
+
+    def _add_instant(self, trace, name, when):
+        event = {"name": name, "cat": trace.name, "ph": "i", "s": "t", "tid": self._tid(),
+                 "ts": (when - self.epoch) * 1e6, "args": {"trace": trace.id}}
+        with self._lock:
+            self._events.append(event)
+
+    def _tid(self):
+        ident = threading.get_ident()
+        if ident not in self._thread_names:
+            with self._lock:
+                self._thread_names.setdefault(ident, threading.current_thread().name)
+        return ident
+
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Process-wide Tracer, registered with the service registry on first use."""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            from meowstery.python_client.player.model.service_registry import get_registry
+            _tracer = Tracer()
+            get_registry().add_call_observer(_tracer)
+        return _tracer
+
+
+def traced(name):
+    """Decorator: each call is a span named name on the calling thread's current trace, if any."""
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def figures_from_trace_file(path):
+    """Percentiles per event name recomputed from a Chrome trace file written by Tracer.export."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    durations = defaultdict(list)
+    for event in data.get("traceEvents", []):
+        if event.get("ph") == "X":
+            durations[event["name"]].append(event.get("dur", 0.0) / 1000.0)
+    figures = {name: summarize(values) for name, values in sorted(durations.items())}
+    # Marks (e.g. guess.confirmed) only exist as rolling figures
+    for name, stats in data.get("otherData", {}).get("percentiles", {}).items():
+        figures.setdefault(name, stats)
+    return figures
+
+
+def format_figures(figures):
+    lines = [f"{'name':<40}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"]
+    for name, stats in figures.items():
+        lines.append(f"{name[-40:]:<40}{stats['count']:>7}{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}"
+                     f"{stats['p99_ms']:>9.1f}{stats['max_ms']:>9.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print p50/p95/p99 latencies from a client trace file")
+    parser.add_argument("trace", help="Chrome trace JSON written by the client ([METRICS] trace_path)")
+    parser.add_argument("--json", action="store_true", help="print the figures as JSON")
+    args = parser.parse_args(argv)
+    try:
+        figures = figures_from_trace_file(args.trace)
+    except (OSError, ValueError) as e:
+        print(f"Could not read {args.trace}: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(figures, indent=2) if args.json else format_figures(figures))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,154 +1,122 @@
-from datetime import time
+import logging
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError, wait
 from random import random
 
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
-from omniORB import CORBA
-import CosNaming
 from typing import List, Optional
 
 import service
-from service import PlayerAccount
-from meowstery.python_client.config.config_reader import load_orb_config
+from meowstery.python_client.player.model.leaderboard_cache import LeaderboardRow, get_leaderboard_cache
+from meowstery.python_client.player.model.service_registry import get_registry
+from meowstery.python_client.player.model.session_cache import GameSessionCache
+
+
+logger = logging.getLogger(__name__)
 
 
 def resolve_service(name: str, interface):
-    max_retries = 3
-    retry_delay = 2  # seconds
+    """Return a proxy for name backed by the shared ServiceRegistry."""
+    return get_registry().resolve(name, interface)
 
-    for attempt in range(max_retries):
-        try:
-            host, port = load_orb_config()
-            print(f"[CORBA] Attempt {attempt + 1}/{max_retries} to resolve service {name} at {host}:{port}")
 
-            # Add timeout and retry settings
-            orb_args = [
-                "-ORBInitRef", f"NameService=corbaloc::{host}:{port}/NameService",
-                "-ORBclientCallTimeOutPeriod", "10000",  # 10 second timeout
-                "-ORBconnectTimeOutPeriod", "10000",  # 10 second connection timeout
-                "-ORBretryCount", "3",  # Number of retries for each operation
-                "-ORBretryDelay", "1000"  # Delay between retries in milliseconds
-            ]
+class _OptionalService:
+    """CorbaUserModel attribute backed by a background resolution future."""
 
-            print(f"[CORBA] Initializing ORB with args: {orb_args}")
-            orb = CORBA.ORB_init(orb_args, CORBA.ORB_ID)
+    def __set_name__(self, owner, name):
+        self.attr = name
 
-            try:
-                print("[CORBA] Attempting to resolve NameService...")
-                obj = orb.resolve_initial_references("NameService")
-                print(f"[CORBA] Successfully resolved NameService")
-            except Exception as e:
-                print(f"[CORBA] Failed to resolve NameService: {e}")
-                print(f"[CORBA] Detailed error: {str(e)}")
-                if attempt < max_retries - 1:
-                    print(f"[CORBA] Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                raise RuntimeError(
-                    f"Could not connect to CORBA naming service at {host}:{port} after {max_retries} attempts. Please check if the server is running and the naming service is started.")
-
-            naming_context = obj._narrow(CosNaming.NamingContext)
-            if naming_context is None:
-                print("[CORBA] Failed to narrow Naming Service")
-                if attempt < max_retries - 1:
-                    print(f"[CORBA] Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                raise RuntimeError("Failed to narrow Naming Service")
-
-            service_name = [CosNaming.NameComponent(name, "")]
-            try:
-                print(f"[CORBA] Attempting to resolve service {name}...")
-                resolved_obj = naming_context.resolve(service_name)
-                print(f"[CORBA] Successfully resolved service {name}")
-            except CosNaming.NamingContext.NotFound as e:
-                print(f"[CORBA] Service {name} not found in naming service")
-                print(f"[CORBA] Available services: {[str(n) for n in naming_context.list(0)[0]]}")
-                if attempt < max_retries - 1:
-                    print(f"[CORBA] Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                raise RuntimeError(
-                    f"Service {name} not found in naming service after {max_retries} attempts. Please check if the server is running.")
-            except Exception as e:
-                print(f"[CORBA] Error resolving service {name}: {e}")
-                print(f"[CORBA] Detailed error: {str(e)}")
-                if attempt < max_retries - 1:
-                    print(f"[CORBA] Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                raise RuntimeError(f"Error resolving service {name} after {max_retries} attempts: {e}")
-
-            narrowed = resolved_obj._narrow(interface)
-            if narrowed is None:
-                print(f"[CORBA] Failed to narrow {name}")
-                if attempt < max_retries - 1:
-                    print(f"[CORBA] Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                raise RuntimeError(f"Failed to narrow {name}")
-
-            print(f"[CORBA] Successfully narrowed service {name}")
-            return narrowed
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance._optional_service(self.attr)
 
-        except Exception as e:
-            print(f"[CORBA] Error in resolve_service for {name}: {e}")
-            print(f"[CORBA] Detailed error: {str(e)}")
-            if attempt < max_retries - 1:
-                print(f"[CORBA] Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                continue
-            raise
+    def __set__(self, instance, value):
+        instance._services[self.attr] = value
 
 
 class CorbaUserModel:
+    # Login and registration cannot work without these, so construction blocks on them.
+    REQUIRED_SERVICES = (
+        ("admin_service", "AdminService", service.AdminService),
+        ("login_service", "LoginService", service.LoginService),
+    )
+    # Resolved in the background; None if unavailable when first read after the deadline.
+    OPTIONAL_SERVICES = (
+        ("leaderboard_service", "LeaderboardService", service.LeaderboardService),
+        ("game_manager_service", "GameManagerService", service.GameManagerService),
+        ("game_service", "GameService", service.GameService),
+        ("word_service", "WordService", service.WordService),
+        ("game_event_service", "GameEventService", service.GameEventService),
+    )
+    RESOLVE_DEADLINE_SECONDS = 10
+
+    leaderboard_service = _OptionalService()
+    game_manager_service = _OptionalService()
+    game_service = _OptionalService()
+    word_service = _OptionalService()
+    game_event_service = _OptionalService()
+
     def __init__(self):
         self.admin_service = None
         self.login_service = None
-        self.leaderboard_service = None
-        self.game_manager_service = None
-        self.game_service = None
-        self.word_service = None
+        self._services = {}
+        self._deadline = 0
+        self._session_cache = None
 
         self._initialize_services()
 
     def _initialize_services(self):
-        try:
-            self.admin_service = resolve_service("AdminService", service.AdminService)
-            self.login_service = resolve_service("LoginService", service.LoginService)
-
-            try:
-                self.leaderboard_service = resolve_service("LeaderboardService", service.LeaderboardService)
-            except Exception as e:
-                print(f"[CORBA Error] Could not connect to LeaderboardService: {e}")
-                self.leaderboard_service = None
-
-            try:
-                self.game_manager_service = resolve_service("GameManagerService", service.GameManagerService)
-            except Exception as e:
-                print(f"[CORBA Error] Could not connect to GameManagerService: {e}")
-                self.game_manager_service = None
-
-            try:
-                self.game_service = resolve_service("GameService", service.GameService)
-            except Exception as e:
-                print(f"[CORBA Error] Could not connect to GameService: {e}")
-                self.game_service = None
-
+        registry = get_registry()
+        self._deadline = time.monotonic() + self.RESOLVE_DEADLINE_SECONDS
+
+        # Submit everything first so required and optional services resolve concurrently.
+        required = {attr: registry.resolve_async(name, interface)
+                    for attr, name, interface in self.REQUIRED_SERVICES}
+        for attr, name, interface in self.OPTIONAL_SERVICES:
+            self._services[attr] = registry.resolve_async(name, interface)
+
+        done, not_done = wait(required.values(), timeout=self.RESOLVE_DEADLINE_SECONDS)
+        for attr, future in required.items():
+            if future in not_done:
+                logger.error("Timed out resolving %s after %ss", attr, self.RESOLVE_DEADLINE_SECONDS)
+                raise RuntimeError(f"Failed to initialize CORBA services: timed out resolving {attr}")
             try:
-                self.word_service = resolve_service("WordService", service.WordService)
+                setattr(self, attr, future.result())
             except Exception as e:
-                print(f"[CORBA Error] Could not connect to WordService: {e}")
-                self.word_service = None
+                logger.error("Failed to initialize services: %s", e)
+                raise RuntimeError(f"Failed to initialize CORBA services: {e}")
 
+    def _optional_service(self, attr):
+        value = self._services.get(attr)
+        if not isinstance(value, Future):
+            return value
+        try:
+            result = value.result(timeout=max(0, self._deadline - time.monotonic()))
+        except FutureTimeoutError:
+            logger.warning("%s not resolved before the deadline, treating as unavailable", attr)
+            return None
         except Exception as e:
-            print(f"[CORBA Error] Failed to initialize services: {e}")
-            raise RuntimeError(f"Failed to initialize CORBA services: {e}")
+            logger.warning("Could not connect to %s: %s", attr, e)
+            result = None
+        self._services[attr] = result
+        return result
+
+    @property
+    def session_cache(self):
+        """Session lookups shared by every controller that uses this model."""
+        if self._session_cache is None:
+            # Looked up per call: the service may not be resolved yet when the cache is first used
+            self._session_cache = GameSessionCache(lambda: self.game_manager_service)
+        return self._session_cache
 
     def reset_services(self):
         """Reset all CORBA service connections"""
-        print("[CORBA] Resetting all service connections...")
+        logger.info("Resetting all service connections...")
+        get_registry().reset()
+        self._session_cache = None
         self._initialize_services()
-        print("[CORBA] Service connections reset complete.")
+        logger.info("Service connections reset complete.")
 
     def register_player(self, username: str, password: str):
         try:
@@ -191,21 +159,14 @@ class CorbaUserModel:
         except Exception as ex:
             raise RuntimeError(f"Error during login: {ex}")
 
-    def get_top_players(self, limit=5) -> List[PlayerAccount]:
+    def get_top_players(self, limit=5) -> List[LeaderboardRow]:
+        """Blocking fetch of the top limit rows (only those rows on servers with getTopPlayersRange)."""
         if not self.leaderboard_service:
             return []
         try:
-            corba_players = self.leaderboard_service.getTopPlayers()
-            # Create new PlayerAccount instances properly
-            result = []
-            for p in corba_players[:limit]:
-                player = PlayerAccount()
-                player.username = p.username
-                player.wins = p.wins
-                result.append(player)
-            return result
+            return get_leaderboard_cache().fetch(0, limit, self.leaderboard_service)
         except Exception as e:
-            print(f"[CORBA Error] Failed to fetch top players: {e}")
+            logger.warning("Failed to fetch top players: %s", e)
             return []
 
 
@@ -304,7 +265,7 @@ class LobbyModel(QObject):
         current_session = self.get_current_session_from_server()
         if current_session:
             player_count = len(current_session.playerUsernames)
-            print(f"Players in lobby: {player_count}, players: {current_session.playerUsernames}")
+            logger.debug("Players in lobby: %s, players: %s", player_count, current_session.playerUsernames)
 
             if player_count >= 2 and not self._game_started_emitted:
                 self._game_started_emitted = True
@@ -315,32 +276,27 @@ class LobbyModel(QObject):
 
 
 class LeaderboardModel(QObject):
+    """Top players from the shared LeaderboardCache; leaderboard_changed fires with cached rows, then fresh ones."""
     leaderboard_changed = pyqtSignal(list)
 
     def __init__(self):
         super().__init__()
         self.top_players = []
-
-        try:
-            self.leaderboard_service = resolve_service("LeaderboardService", service.LeaderboardService)
-        except Exception as e:
-            print(f"[LeaderboardModel] Error resolving LeaderboardService: {e}")
-            self.leaderboard_service = None
+        self.limit = 10
+        self.cache = get_leaderboard_cache()
+        self.cache.updated.connect(self._on_rows_updated)
 
     def get_top_players(self, limit=10):
-        if not self.leaderboard_service:
-            return
-        try:
-            players = self.leaderboard_service.getTopPlayers(limit)
-            self.top_players = []
-            for p in players:
-                player = PlayerAccount()
-                player.username = p.username
-                player.wins = p.wins
-                self.top_players.append(player)
+        self.limit = limit
+        self.top_players = self.cache.get(0, limit)
+        if self.top_players:
+            self.leaderboard_changed.emit(self.top_players)
+
+    def _on_rows_updated(self, offset, count, rows):
+        # Pages other callers fetched (e.g. a longer or shorter top list) are not ours
+        if (offset, count) == (0, self.limit):
+            self.top_players = rows
             self.leaderboard_changed.emit(self.top_players)
-        except Exception as e:
-            print(f"[LeaderboardModel] Error fetching leaderboard: {e}")
 
 
 class GameModel(QObject):
@@ -466,7 +422,7 @@ class GameModel(QObject):
         try:
             return self.current_round
         except Exception as e:
-            print(f"[GameController] Error getting total rounds: {e}")
+            logger.warning("Error getting total rounds: %s", e)
             return self.current_round
 
     def get_player_wins(self, username):
@@ -475,7 +431,7 @@ class GameModel(QObject):
             # Use local tracking since server method is not available
             return self.player_rounds_won.get(username, 0)
         except Exception as e:
-            print(f"[GameController] Error getting wins for {username}: {e}")
+            logger.warning("Error getting wins for %s: %s", username, e)
             return self.player_rounds_won.get(username, 0)
 
     def get_current_winner(self):
@@ -490,5 +446,5 @@ class GameModel(QObject):
                     winner = user
             return winner
         except Exception as e:
-            print(f"[GameController] Error getting current winner: {e}")
+            logger.warning("Error getting current winner: %s", e)
             return None
\ No newline at end of file
@@ -0,0 +1,62 @@
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class RoundWordCache:
+    """(gameId, round number) -> word, so each round asks WordService once.
+
+    A word the server already gave for an earlier round of the same game is
+    returned but not stored: the server has not moved on to the new round
+    yet, and the next lookup asks again.
+    """
+
+    def __init__(self, word_service):
+        self.word_service = word_service
+        self._lock = threading.Lock()
+        self._words: Dict[Tuple[str, int], str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, game_id: str, round_number: int) -> Optional[str]:
+        key = (game_id, round_number)
+        with self._lock:
+            word = self._words.get(key)
+            if word:
+                self.hits += 1
+                return word
+            self.misses += 1
+
+        if not self.word_service or not game_id:
+            return None
+        word = self.word_service.getRandomWord(game_id)
+        if not word:
+            return word
+
+        with self._lock:
+            earlier_rounds = {w for (g, r), w in self._words.items() if g == game_id and r < round_number}
+            if word in earlier_rounds:
+                logger.debug("Server still on the previous word for round %s, not caching", round_number)
+            else:
+                self._words[key] = word
+        return word
+
+    def peek(self, game_id: str, round_number: int) -> Optional[str]:
+        with self._lock:
+            return self._words.get((game_id, round_number))
+
+    def invalidate(self, game_id: Optional[str] = None, round_number: Optional[int] = None):
+        with self._lock:
+            if game_id is None:
+                self._words.clear()
+            elif round_number is None:
+                self._words = {k: w for k, w in self._words.items() if k[0] != game_id}
+            else:
+                self._words.pop((game_id, round_number), None)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._words)}
@@ -2,11 +2,13 @@ from PyQt5.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
     QMessageBox, QFrame, QApplication
 )
-from PyQt5.QtGui import QFont, QPixmap, QColor, QFontDatabase
+from PyQt5.QtGui import QColor
 from PyQt5.QtCore import Qt
-import os
 import sys
 
+from meowstery.python_client.player.view import theme
+from meowstery.python_client.player.view.images import get_image_assets
+
 
 class GameFinishedView(QWidget):
     def __init__(self, player_names):
@@ -21,17 +23,7 @@ class GameFinishedView(QWidget):
         self._init_ui()
 
     def _load_custom_font(self):
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        font_path = os.path.join(base_path, "res", "Barriecito-Regular.ttf")
-        if os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            if font_id != -1:
-                families = QFontDatabase.applicationFontFamilies(font_id)
-                if families:
-                    self.custom_font = families[0]
-        if not self.custom_font:
-            print("Using fallback font")
-            self.custom_font = "Arial"
+        self.custom_font = theme.font_family()
 
     def _init_ui(self):
         self.setWindowTitle("Meowstery Game - Results")
@@ -44,7 +36,7 @@ class GameFinishedView(QWidget):
 
         title_label = QLabel("Game Results")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setFont(QFont(self.custom_font, 64, QFont.Bold))
+        title_label.setFont(theme.font(64, bold=True))
         main_layout.addWidget(title_label)
 
         content_layout = QHBoxLayout()
@@ -59,7 +51,7 @@ class GameFinishedView(QWidget):
         self.scores_panel.setLayout(scores_layout)
 
         scores_title = QLabel("Final Scores")
-        scores_title.setFont(QFont(self.custom_font, 28, QFont.Bold))
+        scores_title.setFont(theme.font(28, bold=True))
         scores_title.setAlignment(Qt.AlignCenter)
         scores_layout.addWidget(scores_title)
         scores_layout.addSpacing(20)
@@ -72,7 +64,7 @@ class GameFinishedView(QWidget):
 
         self.result_message = QLabel()
         self.result_message.setAlignment(Qt.AlignCenter)
-        self.result_message.setFont(QFont(self.custom_font, 48, QFont.Bold))
+        self.result_message.setFont(theme.font(48, bold=True))
         center_panel.addWidget(self.result_message)
 
         self.word_display_panel = QHBoxLayout()
@@ -84,21 +76,16 @@ class GameFinishedView(QWidget):
         bottom_panel.addStretch(1)
 
         self.close_button = QPushButton("Return to Main Menu")
-        self.close_button.setFont(QFont(self.custom_font, 24, QFont.Bold))
+        self.close_button.setFont(theme.font(24, bold=True))
         self.close_button.setFixedSize(300, 60)
         bottom_panel.addWidget(self.close_button)
         bottom_panel.addSpacing(20)
 
-        # Cat image with correct fixed path
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        cat_path = os.path.join(base_path, "res", "images", "16.png")
-        if os.path.exists(cat_path):
-            cat_pixmap = QPixmap(cat_path).scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        cat_pixmap = get_image_assets().pixmap("16.png", 150, 150)
+        if not cat_pixmap.isNull():
             cat_label = QLabel()
             cat_label.setPixmap(cat_pixmap)
             bottom_panel.addWidget(cat_label)
-        else:
-            print(f"Image not found at: {cat_path}")
 
         bottom_panel.addStretch(1)
         main_layout.addLayout(bottom_panel)
@@ -116,12 +103,12 @@ class GameFinishedView(QWidget):
                 widget.deleteLater()
 
         intro_label = QLabel("The word was:")
-        intro_label.setFont(QFont(self.custom_font, 24))
+        intro_label.setFont(theme.font(24))
         self.word_display_panel.addWidget(intro_label)
 
         for letter in self.current_word.upper():
             letter_label = QLabel(letter)
-            letter_label.setFont(QFont(self.custom_font, 60, QFont.Bold))
+            letter_label.setFont(theme.font(60, bold=True))
             letter_label.setFixedSize(60, 80)
             letter_label.setAlignment(Qt.AlignCenter)
             self.word_display_panel.addWidget(letter_label)
@@ -136,7 +123,7 @@ class GameFinishedView(QWidget):
 
         for name, score in zip(self.player_names, self.player_scores):
             score_label = QLabel(f"{name}: {score}")
-            score_label.setFont(QFont(self.custom_font, 24, QFont.Bold))
+            score_label.setFont(theme.font(24, bold=True))
             score_label.setStyleSheet("padding: 5px 0 5px 10px;")
             self.scores_panel.layout().addWidget(score_label)
 
@@ -152,7 +139,7 @@ class GameFinishedView(QWidget):
 
         for i, (name, score) in enumerate(zip(self.player_names, self.player_scores)):
             score_label = QLabel(f"{name}: {score}")
-            score_label.setFont(QFont(self.custom_font, 24, QFont.Bold))
+            score_label.setFont(theme.font(24, bold=True))
             style = "padding: 5px 0 5px 10px;"
             if i == winner_index:
                 style = "color: rgb(0, 150, 0); padding: 5px 0 5px 10px;"
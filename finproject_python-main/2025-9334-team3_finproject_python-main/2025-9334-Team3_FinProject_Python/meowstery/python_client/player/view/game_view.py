@@ -1,12 +1,22 @@
+import logging
 import sys
-import os
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFontDatabase, QFont, QPixmap
+import time
+from PyQt5.QtCore import Qt, QTimer, QRect, QRectF
+from PyQt5.QtGui import QFont, QKeySequence, QPainter, QColor, QPen
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-    QGridLayout, QMainWindow
+    QGridLayout, QMainWindow, QShortcut
 )
 
+from meowstery.python_client.config.config_reader import load_ui_config
+from meowstery.python_client.player.model.letter_input import LetterInputQueue
+from meowstery.python_client.player.model.tracing import get_tracer
+from meowstery.python_client.player.view import theme
+from meowstery.python_client.player.view.images import get_image_assets
+
+
+logger = logging.getLogger(__name__)
+
 
 class KeyboardPanel(QWidget):
     def __init__(self, font):
@@ -43,21 +53,9 @@ class KeyboardPanel(QWidget):
         btn = QPushButton(letter)
         btn.setFont(self.font)
         btn.setFixedSize(60, 60)
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f0f0f0;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                color: #333333;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:disabled {
-                background-color: #dddddd;
-                color: #888888;
-            }
-        """)
+        # Styled by the theme stylesheet; the "state" property picks the colours
+        btn.setProperty("role", "key")
+        btn.setProperty("state", theme.IDLE)
         return btn
 
     def disable_letter_button(self, letter, is_correct):
@@ -65,92 +63,268 @@ class KeyboardPanel(QWidget):
         if letter in self.buttons:
             btn = self.buttons[letter]
             btn.setDisabled(True)
-            if is_correct:
-                btn.setStyleSheet("""
-                    QPushButton:disabled {
-                        background-color: #a5d6a7;
-                        color: #2e7d32;
-                    }
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton:disabled {
-                        background-color: #ef9a9a;
-                        color: #c62828;
-                    }
-                """)
+            theme.set_state(btn, theme.CORRECT if is_correct else theme.WRONG)
 
     def reset(self):
-        for letter, btn in self.buttons.items():
+        for btn in self.buttons.values():
             btn.setDisabled(False)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f0f0f0;
-                    border: 2px solid #cccccc;
-                    border-radius: 5px;
-                    color: #333333;
-                }
-                QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-                QPushButton:disabled {
-                    background-color: #dddddd;
-                    color: #888888;
-                }
-            """)
+            theme.set_state(btn, theme.IDLE)
+
+    def enable_letter_button(self, letter):
+        """Re-enable one key, e.g. when the server rejects a guess."""
+        letter = letter.upper()
+        if letter in self.buttons:
+            btn = self.buttons[letter]
+            btn.setDisabled(False)
+            theme.set_state(btn, theme.IDLE)
 
     def disable_all_buttons(self):
         for btn in self.buttons.values():
             btn.setDisabled(True)
 
     def set_letter_button_listener(self, callback):
+        """Route key clicks to callback, replacing the previous game's listener."""
         for letter, btn in self.buttons.items():
+            try:
+                btn.clicked.disconnect()
+            except TypeError:
+                pass  # No listener yet
             # Capture letter correctly in lambda
             btn.clicked.connect(lambda _, l=letter: callback(l))
 
 
+class PaintedKeyboardPanel(QWidget):
+    """KeyboardPanel drawn by a single widget: no per-key buttons, stylesheets or closures.
+
+    Key states live in one bytearray; a state change repaints only that
+    key's rectangle. Clicks are hit-tested against the fixed key
+    rectangles. Typed letters are left to GameView, like with
+    KeyboardPanel. Same layout, colours and API as KeyboardPanel.
+    """
+    IDLE, CORRECT, WRONG, DISABLED = range(4)
+    ROWS = (("ABCDEFGHIJ", 0), ("KLMNOPQRS", 1), ("TUVWXYZ", 2))  # letters, offset in key columns
+    KEY_SIZE = 60
+    SPACING = 10
+
+    # state -> (background, text); hover only applies to IDLE
+    COLOURS = {
+        IDLE: (QColor("#f0f0f0"), QColor("#333333")),
+        CORRECT: (QColor("#a5d6a7"), QColor("#2e7d32")),
+        WRONG: (QColor("#ef9a9a"), QColor("#c62828")),
+        DISABLED: (QColor("#dddddd"), QColor("#888888")),
+    }
+    HOVER = QColor("#e0e0e0")
+    BORDER = QColor("#cccccc")
+
+    def __init__(self, font):
+        super().__init__()
+        self.font = font
+        self._states = bytearray(26)
+        self._rects = [None] * 26
+        step = self.KEY_SIZE + self.SPACING
+        for row, (letters, offset) in enumerate(self.ROWS):
+            for column, letter in enumerate(letters):
+                self._rects[ord(letter) - ord('A')] = QRect(
+                    (column + offset) * step, row * step, self.KEY_SIZE, self.KEY_SIZE)
+        self._hover = -1
+        self._pressed = -1
+        self._callback = None
+        self.setFixedSize(10 * step - self.SPACING, len(self.ROWS) * step - self.SPACING)
+        self.setMouseTracking(True)
+        self.setCursor(Qt.PointingHandCursor)
+
+    # KeyboardPanel API
+
+    def set_letter_button_listener(self, callback):
+        """Route key clicks and typed letters to callback, replacing the previous listener."""
+        self._callback = callback
+
+    def disable_letter_button(self, letter, is_correct):
+        self._set_state(letter, self.CORRECT if is_correct else self.WRONG)
+
+    def enable_letter_button(self, letter):
+        self._set_state(letter, self.IDLE)
+
+    def disable_all_buttons(self):
+        for key, state in enumerate(self._states):
+            if state == self.IDLE:
+                self._states[key] = self.DISABLED
+        self.update()
+
+    def reset(self):
+        if any(self._states):
+            self._states[:] = bytes(26)
+            self.update()
+
+    # Painting and input
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.font)
+        dirty = event.rect()
+        for key, rect in enumerate(self._rects):
+            if not rect.intersects(dirty):
+                continue
+            state = self._states[key]
+            background, text = self.COLOURS[state]
+            if state == self.IDLE and key == self._hover:
+                background = self.HOVER
+            painter.setBrush(background)
+            painter.setPen(QPen(self.BORDER, 2) if state == self.IDLE else Qt.NoPen)
+            painter.drawRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), 5, 5)
+            painter.setPen(text)
+            painter.drawText(rect, Qt.AlignCenter, chr(ord('A') + key))
+
+    def mouseMoveEvent(self, event):
+        key = self._key_at(event.pos())
+        if key != self._hover:
+            self._repaint_key(self._hover)
+            self._hover = key
+            self._repaint_key(key)
+
+    def leaveEvent(self, event):
+        self._repaint_key(self._hover)
+        self._hover = -1
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._pressed = self._key_at(event.pos())
+
+    def mouseReleaseEvent(self, event):
+        # Like a button, a click only counts if released over the key it started on
+        key, self._pressed = self._pressed, -1
+        if event.button() == Qt.LeftButton and key >= 0 and key == self._key_at(event.pos()):
+            self._click(key)
+
+    def _key_at(self, pos):
+        # Rows and columns are a fixed grid, so the key is found arithmetically
+        step = self.KEY_SIZE + self.SPACING
+        row, y = divmod(pos.y(), step)
+        if not 0 <= row < len(self.ROWS) or y >= self.KEY_SIZE or pos.x() < 0:
+            return -1
+        letters, offset = self.ROWS[row]
+        column, x = divmod(pos.x(), step)
+        column -= offset
+        if not 0 <= column < len(letters) or x >= self.KEY_SIZE:
+            return -1
+        return ord(letters[column]) - ord('A')
+
+    def _click(self, key):
+        if self._states[key] == self.IDLE and self._callback is not None:
+            self._callback(chr(ord('A') + key))
+
+    def _set_state(self, letter, state):
+        letter = letter.upper()
+        if len(letter) != 1 or not 'A' <= letter <= 'Z':
+            return
+        key = ord(letter) - ord('A')
+        if self._states[key] != state:
+            self._states[key] = state
+            self._repaint_key(key)
+
+    def _repaint_key(self, key):
+        if key >= 0:
+            self.update(self._rects[key])
+
+
+class LetterSlot(QLabel):
+    """A word display label that tells traces waiting for it when it has painted its new text."""
+
+    def __init__(self, text):
+        super().__init__(text)
+        self._waiting = []
+
+    def wait_for_paint(self, trace):
+        trace.hold()
+        self._waiting.append(trace)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        waiting, self._waiting = self._waiting, []
+        for trace in waiting:
+            trace.release()
+
+
 class WordDisplayPanel(QWidget):
+    """One letter slot per character of the word, from a pool of labels that outlives rounds.
+
+    A new round shows or hides pooled labels instead of recreating them,
+    and mask updates only touch slots whose character changed, with
+    repaints held until every changed slot is set. A slot changed while a
+    guess trace is active finishes that trace when it repaints.
+    """
+    POOL_SIZE = 16  # Longest expected word; the pool grows for longer ones
+
     def __init__(self, font):
         super().__init__()
         self.font = font
-        self.labels = []
+        self.labels = []  # The visible slots
+        self._pool = []
+        self._cells = []  # Character shown in each visible slot
         self.initUI()
 
     def initUI(self):
         self.layout = QHBoxLayout()
         self.layout.setSpacing(15)
         self.setLayout(self.layout)
+        self._grow(self.POOL_SIZE)
 
-    def set_word_length(self, length):
-        for i in reversed(range(self.layout.count())):
-            widget = self.layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        self.labels = []
-
-        for _ in range(length):
-            label = QLabel("_")
+    def _grow(self, size):
+        while len(self._pool) < size:
+            label = LetterSlot("_")
             label.setFont(self.font)
             label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet("""
-                QLabel {
-                    border-bottom: 3px solid #333333;
-                    padding: 0 10px;
-                    min-width: 40px;
-                    font-size: 36px;
-                }
-            """)
-            self.labels.append(label)
+            label.setProperty("role", "letter-slot")
+            label.hide()
+            self._pool.append(label)
             self.layout.addWidget(label)
 
+    def set_word_length(self, length):
+        if length > len(self._pool):
+            self._grow(length)
+        self.setUpdatesEnabled(False)
+        try:
+            for i, label in enumerate(self._pool):
+                if i < length:
+                    if i >= len(self._cells) or self._cells[i] != "_":
+                        label.setText("_")
+                    if label.isHidden():
+                        label.show()
+                elif not label.isHidden():
+                    label.hide()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.labels = self._pool[:length]
+        self._cells = ["_"] * length
+
     def reveal_letter(self, letter, position):
-        if 0 <= position < len(self.labels):
-            self.labels[position].setText(letter.upper())
+        if 0 <= position < len(self._cells):
+            self._set_cell(position, letter.upper())
 
     def update_word_display(self, masked_word):
-        for i, char in enumerate(masked_word):
-            if i < len(self.labels):
-                self.labels[i].setText(char.upper() if char != '_' else "_")
+        changed = [(i, char.upper()) for i, char in enumerate(masked_word[:len(self._cells)])
+                   if self._cells[i] != char.upper()]
+        if not changed:
+            return
+        if len(changed) == 1:
+            self._set_cell(*changed[0])
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            for i, char in changed:
+                self._set_cell(i, char)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _set_cell(self, position, char):
+        if self._cells[position] != char:
+            self._cells[position] = char
+            self._pool[position].setText(char)
+            trace = get_tracer().current()
+            if trace is not None and trace.finished is None:
+                self._pool[position].wait_for_paint(trace)
 
 
 class PlayerScoresPanel(QWidget):
@@ -161,23 +335,34 @@ class PlayerScoresPanel(QWidget):
         self.initUI(players)
 
     def initUI(self, players):
-        layout = QVBoxLayout()
-        layout.setSpacing(15)
+        self.layout = QVBoxLayout()
+        self.layout.setSpacing(15)
 
         title = QLabel("Player Scores")
         title.setFont(self.font)
         title.setStyleSheet("font-weight: bold; font-size: 24px;")
-        layout.addWidget(title)
+        self.layout.addWidget(title)
+        self.layout.addStretch()
+        self.setLayout(self.layout)
+        self.set_players(players)
 
+    def set_players(self, players):
+        """Show players with a score of 0; labels of players already shown are reused."""
+        old_labels, self.labels = self.labels, {}
         for player in players:
-            lbl = QLabel(f"{player}: 0")
-            lbl.setFont(self.font)
-            lbl.setStyleSheet("font-size: 20px;")
+            lbl = old_labels.pop(player, None)
+            if lbl is None:
+                lbl = QLabel()
+                lbl.setFont(self.font)
+                lbl.setStyleSheet("font-size: 20px;")
+            else:
+                self.layout.removeWidget(lbl)
+            lbl.setText(f"{player}: 0")
             self.labels[player] = lbl
-            layout.addWidget(lbl)
-
-        layout.addStretch()
-        self.setLayout(layout)
+            # In players order, before the stretch
+            self.layout.insertWidget(self.layout.count() - 1, lbl)
+        for lbl in old_labels.values():
+            lbl.setParent(None)
 
     def update_score(self, player, score):
         if player in self.labels:
@@ -245,6 +430,10 @@ class RoundInfoPanel(QWidget):
     def reset_timer(self, time):
         self.update_timer(time)
 
+    def reset(self, time=30):
+        self.update_round(1)
+        self.update_timer(time)
+
 
 class GameOverlayPanel(QWidget):
     def __init__(self):
@@ -267,39 +456,63 @@ class GameOverlayPanel(QWidget):
         self.main_layout.addWidget(widget)
 
 
+class MetricsOverlayPanel(QLabel):
+    """Debug overlay listing the busiest remote operations; refreshed once a second while visible."""
+    MAX_ROWS = 10
+
+    def __init__(self, snapshot_fn):
+        super().__init__()
+        self.snapshot_fn = snapshot_fn
+        self.setFont(QFont("Courier New", 10))
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.setStyleSheet("background-color: rgba(0, 0, 0, 170); color: #c8facc; padding: 6px;")
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start(1000)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        snapshot = self.snapshot_fn()
+        rows = sorted(snapshot.items(), key=lambda kv: -kv[1]["calls"])[:self.MAX_ROWS]
+        lines = [f"{'operation':<40}{'calls':>7}{'err':>5}{'p50':>7}{'p95':>7}{'max':>7}"]
+        for name, stats in rows:
+            latency = stats["latency"]
+            lines.append(f"{name[-40:]:<40}{stats['calls']:>7}{sum(stats['errors'].values()):>5}"
+                         f"{latency['p50_ms']:>7.0f}{latency['p95_ms']:>7.0f}{latency['max_ms']:>7.0f}")
+        self.setText("\n".join(lines) if rows else "No remote calls yet")
+        self.adjustSize()
+
+
 class GameView(QMainWindow):
-    def __init__(self, players):
+    """The game window. Built once and reused: prepare() readies it for the next game's players."""
+
+    def __init__(self, players=()):
         super().__init__()
         self.setWindowTitle("Meowstery Game")
         self.setFixedSize(1500, 900)
 
-        self.custom_font = self.load_custom_font()
+        theme.install()
+        self.custom_font = theme.font(20)
         self.current_round = 1
         self.time_remaining = 30
         self.word_length = 0
         self.lives_remaining = 5
 
         self.guessed_letters_label = None  # Add attribute for guessed letters display
+        self.metrics_overlay = None
+        # Clicks and typed letters both go through this queue before reaching the listener
+        self.letter_input = LetterInputQueue()
 
         self.initUI(players)
 
-    def load_custom_font(self):
-        font_paths = [
-            "meowstery/python_client/res/Barriecito-Regular.ttf",
-            "meowstery/res/Barriecito-Regular.ttf",
-            "res/Barriecito-Regular.ttf"
-        ]
-        font_id = -1
-        for path in font_paths:
-            if os.path.exists(path):
-                font_id = QFontDatabase.addApplicationFont(path)
-                if font_id != -1:
-                    break
-        if font_id == -1:
-            return QFont("Arial", 20)
-        family = QFontDatabase.applicationFontFamilies(font_id)[0]
-        return QFont(family, 20)
-
     def initUI(self, players):
         main_widget = QWidget()
         main_layout = QVBoxLayout()
@@ -307,7 +520,7 @@ class GameView(QMainWindow):
 
         # Add guessed letters label above word display
         self.guessed_letters_label = QLabel("")
-        self.guessed_letters_label.setFont(QFont(self.custom_font.family(), 28, QFont.Bold))
+        self.guessed_letters_label.setFont(theme.font(28, bold=True))
         self.guessed_letters_label.setAlignment(Qt.AlignCenter)
         self.guessed_letters_label.setStyleSheet("color: #2e7d32; letter-spacing: 8px; margin-bottom: 10px;")
         main_layout.addWidget(self.guessed_letters_label, alignment=Qt.AlignCenter)
@@ -321,7 +534,10 @@ class GameView(QMainWindow):
         main_layout.addWidget(self.word_display_panel, alignment=Qt.AlignCenter)
 
         # Keyboard panel
-        self.keyboard_panel = KeyboardPanel(self.custom_font)
+        if load_ui_config()['keyboard'] == 'painted':
+            self.keyboard_panel = PaintedKeyboardPanel(self.custom_font)
+        else:
+            self.keyboard_panel = KeyboardPanel(self.custom_font)
         main_layout.addWidget(self.keyboard_panel, alignment=Qt.AlignCenter)
 
         # Lives indicator
@@ -330,9 +546,8 @@ class GameView(QMainWindow):
 
         # Optional: Add paw print image below lives indicator
         paw_label = QLabel()
-        paw_path = "meowstery/python_client/res/images/paw__print.png"
-        if os.path.exists(paw_path):
-            pixmap = QPixmap(paw_path).scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        pixmap = get_image_assets().pixmap("paw__print.png", 80, 80)
+        if not pixmap.isNull():
             paw_label.setPixmap(pixmap)
             paw_label.setAlignment(Qt.AlignCenter)
             main_layout.addWidget(paw_label, alignment=Qt.AlignCenter)
@@ -357,6 +572,20 @@ class GameView(QMainWindow):
         self.overlay_panel.setGeometry(0, 0, 1500, 900)
         self.overlay_panel.hide()
 
+    def prepare(self, players):
+        """Reset every panel for a new game between players."""
+        self.current_round = 1
+        self.time_remaining = 30
+        self.lives_remaining = 5
+        self.hide_overlay()
+        self.set_word_length(0)
+        self.keyboard_panel.reset()
+        self.lives_indicator_panel.reset()
+        self.round_info_panel.reset(self.time_remaining)
+        self.letter_input.reset()
+        self.player_scores_panel.set_players(players)
+        self.update_guessed_letters_display(())
+
     def set_word_length(self, length):
         self.word_length = length
         self.word_display_panel.set_word_length(length)
@@ -369,32 +598,23 @@ class GameView(QMainWindow):
 
     def disable_letter_button(self, letter, is_correct):
         self.keyboard_panel.disable_letter_button(letter, is_correct)
+        self.letter_input.applied(letter)
+
+    def enable_letter_button(self, letter):
+        self.keyboard_panel.enable_letter_button(letter)
+        self.letter_input.release(letter)
 
     def disable_all_letter_buttons(self):
         self.keyboard_panel.disable_all_buttons()
 
     def reset(self):
         """Reset all buttons to initial state"""
-        for letter, btn in self.buttons.items():
-            btn.setEnabled(True)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f0f0f0;
-                    border: 2px solid #cccccc;
-                    border-radius: 5px;
-                    color: #333333;
-                }
-                QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-                QPushButton:disabled {
-                    background-color: #dddddd;
-                    color: #888888;
-                }
-            """)
+        self.keyboard_panel.reset()
 
     def reset_keyboard(self):
         self.keyboard_panel.reset()
+        logger.debug("Letter input: %s", self.letter_input.stats())
+        self.letter_input.reset()
 
     def update_score(self, player, score):
         self.player_scores_panel.update_score(player, score)
@@ -413,7 +633,7 @@ class GameView(QMainWindow):
 
     def show_overlay_message(self, message):
         label = QLabel(message)
-        label.setFont(QFont(self.custom_font.family(), 28, QFont.Bold))
+        label.setFont(theme.font(28, bold=True))
         label.setAlignment(Qt.AlignCenter)
         self.overlay_panel.set_content(label)
         self.overlay_panel.show()
@@ -422,7 +642,35 @@ class GameView(QMainWindow):
         self.overlay_panel.hide()
 
     def set_letter_button_listener(self, callback):
-        self.keyboard_panel.set_letter_button_listener(callback)
+        self.letter_input.set_handler(callback)
+        self.keyboard_panel.set_letter_button_listener(self.letter_input.offer)
+
+    def keyPressEvent(self, event):
+        """Letters typed anywhere in the window are guesses; held keys do not repeat them."""
+        received_at = time.perf_counter()
+        text = event.text().upper()
+        if len(text) == 1 and 'A' <= text <= 'Z' and not event.modifiers() & (Qt.ControlModifier | Qt.AltModifier):
+            if not event.isAutoRepeat():
+                self.letter_input.offer(text, received_at)
+            return
+        super().keyPressEvent(event)
+
+    def set_metrics_source(self, snapshot_fn, visible=False):
+        """Enable the remote-call debug overlay; F3 toggles it."""
+        if self.metrics_overlay is None:
+            self.metrics_overlay = MetricsOverlayPanel(snapshot_fn)
+            self.metrics_overlay.setParent(self)
+            self.metrics_overlay.move(10, 10)
+            QShortcut(QKeySequence(Qt.Key_F3), self, self.toggle_metrics_overlay)
+        self.metrics_overlay.snapshot_fn = snapshot_fn
+        self.metrics_overlay.setVisible(visible)
+        if visible:
+            self.metrics_overlay.raise_()
+
+    def toggle_metrics_overlay(self):
+        if self.metrics_overlay is not None:
+            self.metrics_overlay.setVisible(not self.metrics_overlay.isVisible())
+            self.metrics_overlay.raise_()
 
     def update_guessed_letters_display(self, guessed_letters):
         """Update the guessed letters label above the word display."""
@@ -1,13 +1,15 @@
-import os
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QTextEdit, QPushButton, QFrame
 )
 from PyQt5.QtGui import (
-    QFontDatabase, QFont, QPainter, QColor, QPixmap, QCursor, QBrush, QLinearGradient
+    QFont, QPainter, QColor, QCursor, QBrush, QLinearGradient
 )
 from PyQt5.QtCore import Qt
 from future.moves import sys
 
+from meowstery.python_client.player.view import theme
+from meowstery.python_client.player.view.images import get_image_assets
+
 
 class RoundedPanel(QFrame):
     def __init__(self, radius=30, bg_color=QColor(50, 50, 50), parent=None):
@@ -32,7 +34,7 @@ class RoundedButton(QPushButton):
         super().__init__(text, parent)
         self.radius = 25
         self.setCursor(QCursor(Qt.PointingHandCursor))
-        self.setFont(QFont("Barriecito", 32))
+        self.setFont(theme.font(32))
         self.setStyleSheet("color: white;")
         self.bg_color = QColor(50, 50, 50)
         self.setMinimumSize(300, 80)
@@ -69,15 +71,7 @@ class HowToPlayView(QWidget):
         self.init_ui()
 
     def load_barriecito_font(self):
-        # Go two levels up from current file directory, then into res/
-        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "res"))
-        font_path = os.path.join(base_path, "Barriecito-Regular.ttf")
-        if os.path.exists(font_path):
-            QFontDatabase.addApplicationFont(font_path)
-            self.barriecito_font = QFont("Barriecito")
-        else:
-            print(f"Warning: Font not found at {font_path}. Using Arial instead.")
-            self.barriecito_font = QFont("Arial")
+        self.barriecito_font = theme.font()
 
     def init_ui(self):
         title_label = QLabel("How To Meow", self)
@@ -97,7 +91,7 @@ class HowToPlayView(QWidget):
         desc_text = QTextEdit(desc_panel)
         desc_text.setReadOnly(True)
         desc_text.setStyleSheet("background: transparent; border: none; color: white;")
-        desc_text.setFont(QFont(self.barriecito_font.family(), 24))
+        desc_text.setFont(theme.font(24))
         desc_text.setGeometry(0, 0, 800, 450)
         desc_text.setText(
             "Ready to sharpen your claws and outsmart the other cats? When at least two cats join within 10 seconds, the guessing game begins!\n\n"
@@ -109,14 +103,14 @@ class HowToPlayView(QWidget):
         desc_text.setContentsMargins(40, 30, 40, 30)
 
         meow_button = RoundedButton("Meow", self)
-        meow_button.setFont(QFont(self.barriecito_font.family(), 32))
+        meow_button.setFont(theme.font(32))
         meow_button.setStyleSheet("color: white;")
         meow_button.move(650, 740)
         meow_button.clicked.connect(self.on_meow_clicked)
 
         # Paths relative to res/
-        left_cat = self.load_scaled_image("images/cat3.png", 300, 300)
-        right_cat = self.load_scaled_image("images/cat3.png", 300, 300)
+        left_cat = self.load_scaled_image("cat3.png", 300, 300)
+        right_cat = self.load_scaled_image("cat3.png", 300, 300)
 
         if left_cat:
             left_cat_label = QLabel(self)
@@ -130,23 +124,16 @@ class HowToPlayView(QWidget):
 
         self.add_paw_prints()
 
-    def load_scaled_image(self, relative_path, width, height):
-        # Go two levels up from current file directory, then into res/
-        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "res"))
-        abs_path = os.path.join(base_path, relative_path)
-        if os.path.exists(abs_path):
-            pixmap = QPixmap(abs_path)
-            return pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        else:
-            print(f"Error loading image: {relative_path}")
-            return None
+    def load_scaled_image(self, name, width, height):
+        pixmap = get_image_assets().pixmap(name, width, height)
+        return None if pixmap.isNull() else pixmap
 
     def add_paw_prints(self):
         paw_positions = [
             (120, 180), (220, 150), (1300, 200), (1400, 160),
             (200, 850), (300, 880), (1300, 850), (1400, 880)
         ]
-        paw_pixmap = self.load_scaled_image("images/paw__print.png", 60, 60)
+        paw_pixmap = self.load_scaled_image("paw__print.png", 60, 60)
         if not paw_pixmap:
             return
         for x, y in paw_positions:
@@ -0,0 +1,122 @@
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QGuiApplication, QImage, QPixmap, QPixmapCache
+
+
+logger = logging.getLogger(__name__)
+
+IMAGES_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "res", "images"))
+
+# Scaled variants live in QPixmapCache, which evicts least recently used first
+PIXMAP_CACHE_KB = 32 * 1024
+
+# (file, width, height) of every image a screen shows; height None means scaled to width.
+# The next screens' entries are decoded and scaled in the background while the current one is up.
+SCREEN_IMAGES = {
+    "connect": [("title.png", 400, None)],
+    "login": [("title.png", 600, None), ("catmoon.png", 450, None)],
+    "register": [("title.png", 500, None), ("cat5.png", 400, None)],
+    "main": [("title.png", 400, None), ("cat1.png", 500, 500)],
+    "howto": [("cat3.png", 300, 300), ("paw__print.png", 60, 60)],
+    "lobby": [("catmoon2.png", 300, 300)],
+    "game": [("paw__print.png", 80, 80)],
+    "finished": [("16.png", 150, 150)],
+}
+
+
+class ImageAssets:
+    """Decodes each PNG of res/images once and hands out scaled QPixmaps from a cache.
+
+    A variant is keyed by (file, size, device pixel ratio): it is scaled to
+    physical pixels so it stays sharp on high-DPI screens. preload() decodes
+    and scales on a worker thread into QImages, which the GUI thread only has
+    to turn into QPixmaps; QPixmap and QPixmapCache are GUI-thread only.
+    """
+
+    def __init__(self, images_dir=IMAGES_DIR):
+        self.images_dir = images_dir
+        self._lock = threading.Lock()
+        self._originals: Dict[str, QImage] = {}
+        self._pending: Dict[Tuple, Future] = {}
+        self._executor = None
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_KB))
+
+    def path(self, name):
+        return os.path.join(self.images_dir, name)
+
+    def pixmap(self, name, width=None, height=None) -> QPixmap:
+        """name scaled to fit width x height (to width alone if height is None); a null pixmap if missing."""
+        dpr = self._device_pixel_ratio()
+        key = (name, width, height, dpr)
+        cache_key = "meowstery:%s:%sx%s@%s" % key
+        pixmap = QPixmap()
+        if QPixmapCache.find(cache_key, pixmap):
+            return pixmap
+
+        with self._lock:
+            future = self._pending.pop(key, None)
+        image = future.result() if future is not None else self._scaled(name, width, height, dpr)
+        if image.isNull():
+            return QPixmap()
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
+
+    def preload(self, entries: Iterable[Tuple[str, Optional[int], Optional[int]]]):
+        """Decode and scale entries in the background so the next pixmap() calls for them are cheap."""
+        dpr = self._device_pixel_ratio()
+        for name, width, height in entries:
+            key = (name, width, height, dpr)
+            if QPixmapCache.find("meowstery:%s:%sx%s@%s" % key, QPixmap()):
+                continue
+            with self._lock:
+                if key in self._pending:
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-preload")
+                self._pending[key] = self._executor.submit(self._scaled, name, width, height, dpr)
+
+    def preload_screens(self, *screens):
+        for screen in screens:
+            self.preload(SCREEN_IMAGES.get(screen, ()))
+
+    def _original(self, name) -> QImage:
+        with self._lock:
+            image = self._originals.get(name)
+        if image is None:
+            image = QImage(self.path(name))
+            if image.isNull():
+                logger.warning("Image not found or unreadable: %s", self.path(name))
+            with self._lock:
+                image = self._originals.setdefault(name, image)
+        return image
+
+    def _scaled(self, name, width, height, dpr) -> QImage:
+        image = self._original(name)
+        if image.isNull() or width is None:
+            return image
+        if height is None:
+            return image.scaledToWidth(round(width * dpr), Qt.SmoothTransformation)
+        return image.scaled(round(width * dpr), round(height * dpr), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    @staticmethod
+    def _device_pixel_ratio():
+        app = QGuiApplication.instance()
+        return app.devicePixelRatio() if app is not None else 1.0
+
+
+_assets: Optional[ImageAssets] = None
+
+
+def get_image_assets() -> ImageAssets:
+    """The client's ImageAssets; create it from the GUI thread."""
+    global _assets
+    if _assets is None:
+        _assets = ImageAssets()
+    return _assets
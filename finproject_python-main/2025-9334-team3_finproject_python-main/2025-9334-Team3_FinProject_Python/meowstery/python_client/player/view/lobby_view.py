@@ -1,9 +1,11 @@
-import os
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QApplication
 )
-from PyQt5.QtGui import QPixmap, QFont, QFontDatabase
+from PyQt5.QtGui import QPixmap
+
+from meowstery.python_client.player.view import theme
+from meowstery.python_client.player.view.images import get_image_assets
 
 class LobbyView(QWidget):
     ICON_WIDTH = 300
@@ -37,24 +39,11 @@ class LobbyView(QWidget):
         self.move(frameGm.topLeft())
 
     def load_custom_font(self):
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(base_dir, "../../"))
-        font_path = os.path.join(project_root, "res", "Barriecito-Regular.ttf")
-        self.custom_font_family = "Sans Serif"
-        if os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            families = QFontDatabase.applicationFontFamilies(font_id)
-            if families:
-                self.custom_font_family = families[0]
-        else:
-            print("Font not found:", font_path)
+        self.custom_font_family = theme.font_family()
 
     def setup_ui(self):
         self.setMinimumSize(1100, 700)
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(base_dir, "../../"))
-        image_path = os.path.join(project_root, "res", "images", "catmoon2.png")
-        cat_pixmap = self.load_and_scale_icon(image_path)
+        cat_pixmap = self.load_and_scale_icon("catmoon2.png")
 
         # Positions of icons
         self.top_left_label = QLabel(self)
@@ -91,32 +80,32 @@ class LobbyView(QWidget):
         # Waiting message label
         self.message_label = QLabel("Waiting for players")
         self.message_label.setAlignment(Qt.AlignCenter)
-        self.message_label.setFont(QFont(self.custom_font_family, 24))
+        self.message_label.setFont(theme.font(24))
         self.center_layout.addWidget(self.message_label)
 
         # Matchmaking timer label
         self.matchmaking_timer_label = QLabel()
         self.matchmaking_timer_label.setAlignment(Qt.AlignCenter)
-        self.matchmaking_timer_label.setFont(QFont(self.custom_font_family, 38))
+        self.matchmaking_timer_label.setFont(theme.font(38))
         self.matchmaking_timer_label.setVisible(False)
         self.center_layout.addWidget(self.matchmaking_timer_label)
 
         # Status label
         self.status_label = QLabel("Game Status: Waiting")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setFont(QFont(self.custom_font_family, 18))
+        self.status_label.setFont(theme.font(18))
         self.center_layout.addWidget(self.status_label)
 
         # Players label
         self.players_label = QLabel("Players: Waiting for opponent...")
         self.players_label.setAlignment(Qt.AlignCenter)
-        self.players_label.setFont(QFont(self.custom_font_family, 18))
+        self.players_label.setFont(theme.font(18))
         self.center_layout.addWidget(self.players_label)
 
         # Countdown label (for start countdown)
         self.countdown_label = QLabel("")
         self.countdown_label.setAlignment(Qt.AlignCenter)
-        self.countdown_label.setFont(QFont(self.custom_font_family, 36))
+        self.countdown_label.setFont(theme.font(36))
         self.countdown_label.setVisible(False)
         self.center_layout.addWidget(self.countdown_label)
 
@@ -133,14 +122,12 @@ class LobbyView(QWidget):
         self.center_panel.setGeometry((w - 600) // 2, (h - 300) // 2, 600, 300)
         super().resizeEvent(event)
 
-    def load_and_scale_icon(self, file_path):
-        if os.path.exists(file_path):
-            pixmap = QPixmap(file_path)
-        else:
-            print("Image not found:", file_path)
+    def load_and_scale_icon(self, name):
+        pixmap = get_image_assets().pixmap(name, self.ICON_WIDTH, self.ICON_HEIGHT)
+        if pixmap.isNull():
             pixmap = QPixmap(self.ICON_WIDTH, self.ICON_HEIGHT)
             pixmap.fill(Qt.transparent)
-        return pixmap.scaled(self.ICON_WIDTH, self.ICON_HEIGHT, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return pixmap
 
     def animate_dots(self):
         self.dot_count = (self.dot_count + 1) % 4
@@ -205,7 +192,7 @@ class LobbyView(QWidget):
             self.button_layout.addStretch()
 
             self.restart_button = QPushButton("Find Match Again")
-            self.restart_button.setFont(QFont(self.custom_font_family, 16))
+            self.restart_button.setFont(theme.font(16))
             self.restart_button.setFixedSize(200, 40)
             self.restart_button.setStyleSheet("""
                 QPushButton {
@@ -222,7 +209,7 @@ class LobbyView(QWidget):
             self.button_layout.addWidget(self.restart_button)
 
             self.main_menu_button = QPushButton("Return to Main Menu")
-            self.main_menu_button.setFont(QFont(self.custom_font_family, 16))
+            self.main_menu_button.setFont(theme.font(16))
             self.main_menu_button.setFixedSize(200, 40)
             self.main_menu_button.setStyleSheet("""
                 QPushButton {
@@ -1,12 +1,13 @@
 import sys
-import os
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QVBoxLayout, QHBoxLayout,
     QPushButton, QSplitter, QFrame
 )
-from PyQt5.QtGui import QFont, QFontDatabase, QPixmap
 from PyQt5.QtCore import Qt, QSize
 
+from meowstery.python_client.player.view import theme
+from meowstery.python_client.player.view.images import get_image_assets
+
 
 class ImagePanel(QWidget):
     def __init__(self):
@@ -29,24 +30,14 @@ class ImagePanel(QWidget):
         self.load_images()
 
     def load_images(self):
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        resource_path = os.path.abspath(os.path.join(base_path, "..", "..", "res", "images"))
-
-        title_path = os.path.join(resource_path, "title.png")
-        catmoon_path = os.path.join(resource_path, "catmoon.png")
-
-        logo_pixmap = QPixmap(title_path)
-        catmoon_pixmap = QPixmap(catmoon_path)
+        assets = get_image_assets()
+        logo_pixmap = assets.pixmap("title.png", 600)
+        catmoon_pixmap = assets.pixmap("catmoon.png", 450)
 
         if not logo_pixmap.isNull():
-            self.logo.setPixmap(logo_pixmap.scaledToWidth(600, Qt.SmoothTransformation))
-        else:
-            print(f"Logo image not found at: {title_path}")
-
+            self.logo.setPixmap(logo_pixmap)
         if not catmoon_pixmap.isNull():
-            self.catmoon.setPixmap(catmoon_pixmap.scaledToWidth(450, Qt.SmoothTransformation))
-        else:
-            print(f"Catmoon image not found at: {catmoon_path}")
+            self.catmoon.setPixmap(catmoon_pixmap)
 
 
 class UserLoginView(QWidget):
@@ -56,18 +47,7 @@ class UserLoginView(QWidget):
         self.setFixedSize(1100, 700)
         self.setGeometry(100, 100, 1100, 700)
 
-        # Load custom font
-        font_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "res", "Barriecito-Regular.ttf"))
-        if os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            font_families = QFontDatabase.applicationFontFamilies(font_id)
-            if font_families:
-                self.custom_font = font_families[0]
-            else:
-                self.custom_font = "Barriecito"
-        else:
-            print("Custom font not found, using default.")
-            self.custom_font = "Barriecito"
+        self.custom_font = theme.font_family()
 
         splitter = QSplitter(Qt.Horizontal)
         splitter.setHandleWidth(0)
@@ -80,25 +60,25 @@ class UserLoginView(QWidget):
         self.username = QLineEdit()
         self.username.setPlaceholderText("Username")
         self.username.setStyleSheet("padding: 10px; border: 1px solid #ccc; border-radius: 8px;")
-        self.username.setFont(QFont(self.custom_font, 14))
+        self.username.setFont(theme.font(14))
 
         self.password = QLineEdit()
         self.password.setEchoMode(QLineEdit.Password)
         self.password.setPlaceholderText("Password")
         self.password.setStyleSheet("padding: 10px; border: 1px solid #ccc; border-radius: 8px;")
-        self.password.setFont(QFont(self.custom_font, 14))
+        self.password.setFont(theme.font(14))
 
         self.login_btn = QPushButton("Login")
         self.login_btn.setFixedSize(QSize(120, 35))
-        self.login_btn.setFont(QFont(self.custom_font, 14))
+        self.login_btn.setFont(theme.font(14))
 
         self.sign_up_btn = QPushButton("Sign Up")
         self.sign_up_btn.setFixedSize(QSize(120, 35))
-        self.sign_up_btn.setFont(QFont(self.custom_font, 14))
+        self.sign_up_btn.setFont(theme.font(14))
 
         self.back_btn = QPushButton("Back")
         self.back_btn.setFixedSize(QSize(80, 30))
-        self.back_btn.setFont(QFont(self.custom_font, 12))
+        self.back_btn.setFont(theme.font(12))
 
         form_layout = QVBoxLayout()
         form_layout.addWidget(self.username)
@@ -108,7 +88,7 @@ class UserLoginView(QWidget):
         form_layout.addSpacing(20)
 
         sign_up_label = QLabel("Don't have an account yet?")
-        sign_up_label.setFont(QFont(self.custom_font, 12))
+        sign_up_label.setFont(theme.font(12))
         sign_up_label.setAlignment(Qt.AlignCenter)
         form_layout.addWidget(sign_up_label)
         form_layout.addWidget(self.sign_up_btn, alignment=Qt.AlignCenter)
@@ -1,9 +1,11 @@
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout, QFrame
 )
-from PyQt5.QtGui import QFont, QCursor, QPainter, QColor, QPixmap, QFontDatabase
+from PyQt5.QtGui import QCursor, QPainter, QColor
 from PyQt5.QtCore import Qt, QRect, pyqtSignal
-import os
+
+from meowstery.python_client.player.view import theme
+from meowstery.python_client.player.view.images import get_image_assets
 
 
 class RoundedButton(QFrame):
@@ -17,27 +19,18 @@ class RoundedButton(QFrame):
         self.fg_color = QColor(255, 255, 255)
         self.setCursor(QCursor(Qt.PointingHandCursor))
 
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        font_path = os.path.normpath(os.path.join(base_path, "..", "..", "res", "Barriecito-Regular.ttf"))
-
-        if os.path.exists(font_path):
-            QFontDatabase.addApplicationFont(font_path)
-            font_family = "Barriecito"
-        else:
-            font_family = "SansSerif"
-
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
         main_label = QLabel(main_text)
-        main_font = QFont(font_family, 24, QFont.Bold)
+        main_font = theme.font(24, bold=True)
         main_label.setFont(main_font)
         main_label.setStyleSheet("color: white;")
         main_label.setAlignment(Qt.AlignCenter)
 
         sub_label = QLabel(sub_text)
-        sub_font = QFont(font_family, 14)
+        sub_font = theme.font(14)
         sub_label.setFont(sub_font)
         sub_label.setStyleSheet("color: white;")
         sub_label.setAlignment(Qt.AlignCenter)
@@ -67,15 +60,7 @@ class UserMainView(QWidget):
         self.setFixedSize(1096, 612)
         self.setStyleSheet("background-color: white;")
 
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        image_path = os.path.normpath(os.path.join(base_path, "..", "..", "res", "images"))
-        font_path = os.path.normpath(os.path.join(base_path, "..", "..", "res", "Barriecito-Regular.ttf"))
-
-        if os.path.exists(font_path):
-            QFontDatabase.addApplicationFont(font_path)
-            self.font_family = "Barriecito"
-        else:
-            self.font_family = "SansSerif"
+        self.font_family = theme.font_family()
 
         main_layout = QHBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -88,23 +73,19 @@ class UserMainView(QWidget):
         left_layout.setContentsMargins(0, 10, 0, 0)
         left_layout.setSpacing(0)
 
-        title_path = os.path.join(image_path, "title.png")
-        title_pixmap = QPixmap(title_path)
+        title_pixmap = get_image_assets().pixmap("title.png", 400)
         title_label = QLabel()
         if not title_pixmap.isNull():
-            scaled_title = title_pixmap.scaledToWidth(400, Qt.SmoothTransformation)
-            title_label.setPixmap(scaled_title)
+            title_label.setPixmap(title_pixmap)
         else:
             title_label.setText("Title Image Missing")
         title_label.setAlignment(Qt.AlignCenter)
         left_layout.addWidget(title_label)
 
-        cat_path = os.path.join(image_path, "cat1.png")
-        cat_pixmap = QPixmap(cat_path)
+        cat_pixmap = get_image_assets().pixmap("cat1.png", 500, 500)
         cat_label = QLabel()
         if not cat_pixmap.isNull():
-            scaled_cat = cat_pixmap.scaled(500, 500, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            cat_label.setPixmap(scaled_cat)
+            cat_label.setPixmap(cat_pixmap)
         else:
             cat_label.setText("Cat Image Missing")
         cat_label.setAlignment(Qt.AlignCenter)
@@ -122,7 +103,7 @@ class UserMainView(QWidget):
         right_layout.setSpacing(40)
 
         username_label = QLabel(f"meow, {username}")
-        username_font = QFont(self.font_family, 18)
+        username_font = theme.font(18)
         username_label.setFont(username_font)
         username_label.setAlignment(Qt.AlignRight)
         right_layout.addWidget(username_label)
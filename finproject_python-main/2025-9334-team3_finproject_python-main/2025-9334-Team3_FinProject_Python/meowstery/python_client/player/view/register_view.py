@@ -1,8 +1,9 @@
-import os
 from PyQt5.QtWidgets import QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QSplitter, QFrame
-from PyQt5.QtGui import QFont, QPixmap, QFontDatabase
 from PyQt5.QtCore import Qt
 
+from meowstery.python_client.player.view import theme
+from meowstery.python_client.player.view.images import get_image_assets
+
 
 class RegisterPanel(QWidget):
     def __init__(self, controller=None):
@@ -22,27 +23,17 @@ class RegisterPanel(QWidget):
         left_layout = QVBoxLayout(left_panel)
         left_panel.setStyleSheet("background-color: #f5f5f5;")
 
-        # Fix: Go up two levels from this file location to get correct res/images path
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        resource_path = os.path.abspath(os.path.join(base_path, "..", "..", "res", "images"))
-
-        title_path = os.path.join(resource_path, "title.png")
-        cat_path = os.path.join(resource_path, "cat5.png")
-
+        assets = get_image_assets()
         title = QLabel()
-        title_pixmap = QPixmap(title_path)
+        title_pixmap = assets.pixmap("title.png", 500)
         if not title_pixmap.isNull():
-            title.setPixmap(title_pixmap.scaledToWidth(500, Qt.SmoothTransformation))
-        else:
-            print(f"Failed to load image at: {title_path}")
+            title.setPixmap(title_pixmap)
         title.setAlignment(Qt.AlignCenter)
 
         cat = QLabel()
-        cat_pixmap = QPixmap(cat_path)
+        cat_pixmap = assets.pixmap("cat5.png", 400)
         if not cat_pixmap.isNull():
-            cat.setPixmap(cat_pixmap.scaledToWidth(400, Qt.SmoothTransformation))
-        else:
-            print(f"Failed to load image at: {cat_path}")
+            cat.setPixmap(cat_pixmap)
         cat.setAlignment(Qt.AlignCenter)
 
         left_layout.addWidget(title)
@@ -54,36 +45,36 @@ class RegisterPanel(QWidget):
         form_layout.setContentsMargins(80, 50, 80, 50)
 
         form_title = QLabel("Create New Account")
-        form_title.setFont(QFont(self.barriecito_font.family(), 24, QFont.Bold))
+        form_title.setFont(theme.font(24, bold=True))
         form_title.setAlignment(Qt.AlignCenter)
 
         self.username = QLineEdit()
         self.username.setPlaceholderText("Username")
         self.username.setStyleSheet("padding: 10px; border: 1px solid #ccc; border-radius: 8px;")
-        self.username.setFont(QFont(self.barriecito_font.family(), 14))
+        self.username.setFont(theme.font(14))
 
         self.password = QLineEdit()
         self.password.setEchoMode(QLineEdit.Password)
         self.password.setPlaceholderText("Password")
         self.password.setStyleSheet("padding: 10px; border: 1px solid #ccc; border-radius: 8px;")
-        self.password.setFont(QFont(self.barriecito_font.family(), 14))
+        self.password.setFont(theme.font(14))
 
         self.confirm_password = QLineEdit()
         self.confirm_password.setEchoMode(QLineEdit.Password)
         self.confirm_password.setPlaceholderText("Confirm Password")
         self.confirm_password.setStyleSheet("padding: 10px; border: 1px solid #ccc; border-radius: 8px;")
-        self.confirm_password.setFont(QFont(self.barriecito_font.family(), 14))
+        self.confirm_password.setFont(theme.font(14))
 
         self.register_btn = QPushButton("Register")
         self.register_btn.setFixedHeight(40)
         self.register_btn.setStyleSheet("background-color: black; color: white; border-radius: 20px;")
-        self.register_btn.setFont(QFont(self.barriecito_font.family(), 16))
+        self.register_btn.setFont(theme.font(16))
         self.register_btn.clicked.connect(self.on_register)
 
         self.back_btn = QPushButton("Back to Login")
         self.back_btn.setFixedHeight(30)
         self.back_btn.setStyleSheet("color: black; background: none; text-decoration: underline;")
-        self.back_btn.setFont(QFont(self.barriecito_font.family(), 12))
+        self.back_btn.setFont(theme.font(12))
         if self.controller:
             self.back_btn.clicked.connect(self.controller.show_login_view)
 
@@ -105,14 +96,7 @@ class RegisterPanel(QWidget):
         layout.addWidget(splitter)
 
     def load_barriecito_font(self):
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        font_path = os.path.abspath(os.path.join(base_path, "..", "..", "res", "Barriecito-Regular.ttf"))
-        if os.path.exists(font_path):
-            QFontDatabase.addApplicationFont(font_path)
-            self.barriecito_font = QFont("Barriecito")
-        else:
-            print(f"Warning: Barriecito font not found at {font_path}. Using Arial instead.")
-            self.barriecito_font = QFont("Arial")
+        self.barriecito_font = theme.font()
 
     def on_register(self):
         user = self.username.text().strip()
@@ -0,0 +1,144 @@
+import logging
+import time
+from typing import Callable, Dict, Optional
+
+from meowstery.python_client.player.model.timer_registry import TimerRegistry
+from meowstery.python_client.player.view.game_view import GameView
+
+
+logger = logging.getLogger(__name__)
+
+# Budget from "session is PLAYING" to a keyboard that reacts to clicks
+TRANSITION_BUDGET_MS = 50.0
+
+
+class ScreenFactory:
+    """Callable stand-in for a view class: calling it acquires the screen, prebuild() builds it early."""
+
+    def __init__(self, manager, name):
+        self.manager = manager
+        self.name = name
+
+    def __call__(self, *args):
+        return self.manager.acquire(self.name, *args)
+
+    def prebuild(self, delay_ms=200, timers=None):
+        self.manager.prebuild(self.name, delay_ms, timers)
+
+
+class ScreenManager:
+    """Builds screens before they are needed and reuses them instead of rebuilding.
+
+    Each screen is registered with a build function, which creates it with
+    no game data, and a prepare function, which resets it for a new use.
+    One instance per screen is kept. acquire() prepares it, building it
+    first if prebuild() has not done so yet.
+
+    Widgets can only be created on the GUI thread, so prebuild() cannot run
+    in the background. Instead it builds the screen at a quiet moment, such
+    as the lobby wait, so the transition itself does not pay for it. Its
+    delay is a timer of the caller's TimerRegistry (the manager's own by
+    default), so the caller's teardown and leak checks cover it.
+    """
+
+    def __init__(self):
+        self._builders: Dict[str, Callable] = {}
+        self._preparers: Dict[str, Callable] = {}
+        self._screens: Dict[str, object] = {}
+        self._scheduled = {}  # name -> pending prebuild timer
+        self.timers = TimerRegistry("ScreenManager")
+        self.build_ms: Dict[str, float] = {}
+        self.prepare_ms: Dict[str, float] = {}
+        self.transitions = []  # ms from trigger to interactive, newest last
+        self.over_budget = 0
+
+    def register(self, name, build: Callable[[], object], prepare: Callable[..., None]):
+        self._builders[name] = build
+        self._preparers[name] = prepare
+
+    def factory(self, name) -> ScreenFactory:
+        return ScreenFactory(self, name)
+
+    def prebuild(self, name, delay_ms=200, timers: Optional[TimerRegistry] = None):
+        """Build name after delay_ms (time for the current screen to paint) unless it already exists."""
+        if name in self._screens or self._prebuild_pending(name):
+            return
+
+        def build():
+            self._scheduled.pop(name, None)
+            self.get(name)
+
+        timer = (timers or self.timers).single_shot(delay_ms, build)
+        if timer is not None:
+            self._scheduled[name] = timer
+
+    def get(self, name):
+        """The screen's instance, built now if needed; not prepared."""
+        if self._prebuild_pending(name):
+            self._scheduled[name].stop()
+        self._scheduled.pop(name, None)
+        screen = self._screens.get(name)
+        if screen is None:
+            started = time.perf_counter()
+            screen = self._screens[name] = self._builders[name]()
+            self.build_ms[name] = (time.perf_counter() - started) * 1000.0
+            logger.debug("Built screen %s in %.1f ms", name, self.build_ms[name])
+        return screen
+
+    def _prebuild_pending(self, name):
+        # The owning registry may have stopped and freed the timer (e.g. the lobby closed)
+        timer = self._scheduled.get(name)
+        try:
+            return timer is not None and timer.isActive()
+        except RuntimeError:
+            return False
+
+    def acquire(self, name, *args):
+        """The screen, prepared for a new use with args."""
+        screen = self.get(name)
+        started = time.perf_counter()
+        self._preparers[name](screen, *args)
+        self.prepare_ms[name] = (time.perf_counter() - started) * 1000.0
+        return screen
+
+    def discard(self, name):
+        """Forget name's instance, e.g. after it was destroyed; the next acquire() builds a new one."""
+        screen = self._screens.pop(name, None)
+        if screen is not None:
+            screen.close()
+
+    def measure_transition(self, label, started):
+        """Record the time from started (perf_counter) until the event loop is free to handle input again."""
+
+        def done():
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            self.transitions = self.transitions[-49:] + [elapsed_ms]
+            if elapsed_ms > TRANSITION_BUDGET_MS:
+                self.over_budget += 1
+                logger.warning("%s took %.1f ms (budget %.0f ms)", label, elapsed_ms, TRANSITION_BUDGET_MS)
+            else:
+                logger.info("%s took %.1f ms", label, elapsed_ms)
+
+        self.timers.single_shot(0, done)
+
+    def stats(self):
+        return {
+            "screens": sorted(self._screens),
+            "build_ms": dict(self.build_ms),
+            "prepare_ms": dict(self.prepare_ms),
+            "last_transition_ms": self.transitions[-1] if self.transitions else None,
+            "max_transition_ms": max(self.transitions) if self.transitions else None,
+            "over_budget": self.over_budget,
+        }
+
+
+_manager: Optional[ScreenManager] = None
+
+
+def get_screen_manager() -> ScreenManager:
+    """The client's ScreenManager; create it from the GUI thread."""
+    global _manager
+    if _manager is None:
+        _manager = ScreenManager()
+        _manager.register("game", GameView, GameView.prepare)
+    return _manager
@@ -0,0 +1,89 @@
+import logging
+import os
+from functools import lru_cache
+
+from PyQt5.QtGui import QFont, QFontDatabase
+from PyQt5.QtWidgets import QApplication
+
+
+logger = logging.getLogger(__name__)
+
+FONT_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                          "..", "..", "res", "Barriecito-Regular.ttf"))
+FALLBACK_FAMILY = "Arial"
+
+# Values of the "state" property of keyboard keys
+IDLE, CORRECT, WRONG = "idle", "correct", "wrong"
+
+# One stylesheet for the whole application. Widgets opt in with the "role"
+# property and change look through "state", so Qt parses it once instead of
+# once per setStyleSheet call on every key.
+STYLESHEET = """
+QPushButton[role="key"] {
+    background-color: #f0f0f0;
+    border: 2px solid #cccccc;
+    border-radius: 5px;
+    color: #333333;
+}
+QPushButton[role="key"]:hover {
+    background-color: #e0e0e0;
+}
+QPushButton[role="key"]:disabled {
+    background-color: #dddddd;
+    color: #888888;
+}
+QPushButton[role="key"][state="correct"]:disabled {
+    background-color: #a5d6a7;
+    color: #2e7d32;
+}
+QPushButton[role="key"][state="wrong"]:disabled {
+    background-color: #ef9a9a;
+    color: #c62828;
+}
+QLabel[role="letter-slot"] {
+    border-bottom: 3px solid #333333;
+    padding: 0 10px;
+    min-width: 40px;
+    font-size: 36px;
+}
+"""
+
+_installed = False
+
+
+@lru_cache(maxsize=None)
+def font_family() -> str:
+    """Family of the Barriecito font, registered with Qt on the first call of the process."""
+    if os.path.exists(FONT_PATH):
+        font_id = QFontDatabase.addApplicationFont(FONT_PATH)
+        families = QFontDatabase.applicationFontFamilies(font_id) if font_id != -1 else []
+        if families:
+            return families[0]
+    logger.warning("Barriecito font not found at %s, using %s", FONT_PATH, FALLBACK_FAMILY)
+    return FALLBACK_FAMILY
+
+
+@lru_cache(maxsize=64)
+def font(point_size=20, bold=False) -> QFont:
+    """Shared Barriecito QFont; setFont() copies it, but do not modify the returned object."""
+    return QFont(font_family(), point_size, QFont.Bold if bold else QFont.Normal)
+
+
+def install(app=None):
+    """Append STYLESHEET to the application's stylesheet once; views call it before building widgets."""
+    global _installed
+    app = app or QApplication.instance()
+    if _installed or app is None:
+        return
+    app.setStyleSheet(app.styleSheet() + STYLESHEET)
+    _installed = True
+
+
+def set_state(widget, state):
+    """Switch widget to another STYLESHEET state; only a widget whose state changed is repolished."""
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
@@ -0,0 +1,9 @@
+import os
+import sys
+
+CLIENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The client imports itself as meowstery.python_client and the generated stubs as top-level modules
+for path in (os.path.dirname(os.path.dirname(CLIENT_DIR)), os.path.join(CLIENT_DIR, "idl")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,18 @@
+import socket
+
+import pytest
+
+pytest.importorskip("omniORB")
+pytest.importorskip("PyQt5")
+
+from meowstery.python_client.local_server.server import main
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_push_self_test_delivers_every_event():
+    assert main(["--port", str(free_port()), "--self-test"]) == 0
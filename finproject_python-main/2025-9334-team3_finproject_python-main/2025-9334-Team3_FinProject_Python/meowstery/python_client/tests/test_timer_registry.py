@@ -0,0 +1,142 @@
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtCore import QCoreApplication
+
+from meowstery.python_client.player.model.timer_registry import TimerRegistry, check_leaks
+
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def test_loop_restarted_after_close_is_reported(app):
+    registry = TimerRegistry("RestartedLoop")
+    loop = registry.poll_loop("poll", lambda: None, 1000)
+    loop.start()
+    registry.close()
+    assert not check_leaks("close").get("RestartedLoop")
+
+    loop.start()
+
+    assert not loop.isActive()
+    assert check_leaks("restart").get("RestartedLoop") == ["poll"]
+
+
+def test_timer_restarted_after_close_is_reported(app):
+    registry = TimerRegistry("RestartedTimer")
+    timer = registry.timer("tick", lambda: None, 1000)
+    registry.close()
+
+    timer.start()
+
+    assert check_leaks("restart").get("RestartedTimer") == ["tick"]
+    timer.stop()
+
+
+class _Session:
+    sessionStatus = "PLAYING"
+    playerUsernames = ["alice", "bob"]
+    startTime = ""
+
+
+class _Services:
+    """Just enough of CorbaServices for a lobby -> game -> main menu run against a server that is already PLAYING."""
+
+    def __init__(self):
+        self.game_manager_service = self
+        self.admin_service = self
+        self.game_service = self
+        self.word_service = self
+        self.session_cache = self
+
+    def get(self, game_session_id):
+        return _Session()
+
+    def reset_services(self):
+        pass
+
+    def joinOrCreateGameSession(self, username):
+        return "game-1"
+
+    def getWaitTime(self):
+        return 30
+
+    def getRoundTime(self):
+        return 30
+
+    def getRoundDuration(self, game_session_id):
+        return 30
+
+    def requestToJoinGame(self, username):
+        pass
+
+    def getGameStatus(self, username):
+        return "PLAYING"
+
+    def getWordMask(self, username):
+        return type("WordMaskInfo", (), {"maskedWord": "____", "guessesLeft": 5})()
+
+    def getRoundStartTime(self, game_session_id, round_number):
+        return ""
+
+    def getServerTime(self):
+        return ""
+
+    def getRandomWord(self, game_session_id):
+        return "MEOW"
+
+
+class _LobbyView:
+    main_menu_button = None
+    restart_button = None
+
+    def update_status(self, status):
+        pass
+
+    def update_players_list(self, players):
+        pass
+
+    def update_waiting_message(self, message):
+        pass
+
+    def show_restart_and_main_menu_buttons(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _process_until(app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def test_lobby_game_main_menu_teardown_leaves_no_timers(app):
+    pytest.importorskip("omniORB")
+    from meowstery.python_client.player.controller.lobby_controller import LobbyController
+    from meowstery.python_client.player.model.user_model import LobbyModel
+
+    lobby = LobbyController(LobbyModel("alice"), _LobbyView(), _Services(), game_view_factory=lambda players: None)
+    returned = []
+    lobby.show_main_menu.connect(lambda: returned.append(True))
+
+    assert _process_until(app, lambda: getattr(lobby, "_game_controller", None) is not None)
+    game = lobby._game_controller
+    assert _process_until(app, lambda: game.round_active)
+
+    game.return_to_main_menu()
+    assert returned
+    # Replies still in flight when the screens closed must not start anything again
+    _process_until(app, lambda: False, timeout=0.5)
+
+    leaks = check_leaks("lobby -> game -> main menu")
+    assert "LobbyController" not in leaks
+    assert "GameController" not in leaks